@@ -8,12 +8,29 @@ from ._useragent import set_databricks_sdk_upstream
 
 set_databricks_sdk_upstream()
 
-import laktory._parsers
-import laktory.models
-import laktory.spark
-import laktory.typing
-import laktory.yaml
-
+from ._lazy import attach
+from ._lazy import when_imported
 from ._logger import get_logger
 from ._settings import Settings
 from .version import show_version_info
+
+# Submodules are imported on first access to keep `import laktory` and CLI
+# startup light. Spark and Polars namespaces are registered as soon as the
+# corresponding library is imported.
+__getattr__, __dir__, _ = attach(
+    __name__,
+    submodules=[
+        "datetime",
+        "dispatcher",
+        "dlt",
+        "models",
+        "polars",
+        "spark",
+        "storage",
+        "typing",
+        "yaml",
+    ],
+)
+
+when_imported("polars", lambda _: __getattr__("polars"))
+when_imported("pyspark", lambda _: __getattr__("spark"))
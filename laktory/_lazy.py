@@ -0,0 +1,166 @@
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+from collections.abc import Iterable
+from typing import Callable
+
+# --------------------------------------------------------------------------- #
+# Lazy Attributes                                                             #
+# --------------------------------------------------------------------------- #
+
+
+def attach(
+    package_name: str,
+    submodules: Iterable[str] = None,
+    attributes: dict[str, str] = None,
+) -> tuple[Callable, Callable, list[str]]:
+    """
+    Build PEP 562 module-level `__getattr__` and `__dir__` functions so that
+    submodules and public attributes of a package are only imported on first
+    access.
+
+    Parameters
+    ----------
+    package_name:
+        Name of the package (`__name__`) the functions are attached to.
+    submodules:
+        Names of the submodules that can be accessed as attributes.
+    attributes:
+        Mapping of public attribute names to the module (relative to the
+        package) in which they are defined.
+
+    Returns
+    -------
+    :
+        `__getattr__`, `__dir__` and `__all__` for the package
+
+    Examples
+    --------
+    ```py
+    from laktory._lazy import attach
+
+    __getattr__, __dir__, __all__ = attach(
+        __name__,
+        submodules=["resources"],
+        attributes={"Pipeline": ".pipeline.pipeline"},
+    )
+    ```
+    """
+    if submodules is None:
+        submodules = []
+    submodules = set(submodules)
+    if attributes is None:
+        attributes = {}
+
+    __all__ = sorted(set(attributes) | submodules)
+
+    def __getattr__(name):
+        if name in attributes:
+            module = importlib.import_module(attributes[name], package_name)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module(f"{package_name}.{name}")
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+        # Cache value so that __getattr__ is not called again
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(__all__))
+
+    return __getattr__, __dir__, __all__
+
+
+# --------------------------------------------------------------------------- #
+# Post-Import Hooks                                                           #
+# --------------------------------------------------------------------------- #
+
+_hooks: dict[str, list[Callable]] = {}
+
+
+class _HookedLoader(importlib.abc.Loader):
+    """
+    Loader wrapper executing registered hooks once a module has been executed.
+    All other attributes are forwarded to the original loader.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._loader.exec_module(module)
+
+        # Restore original loader
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+
+        # Bind submodule to its parent before the import system does so that
+        # hooks can access it as an attribute
+        parent, _, child = module.__name__.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, module)
+
+        _run_hooks(module.__name__)
+
+
+class _HookFinder(importlib.abc.MetaPathFinder):
+    def __init__(self):
+        self._searching = set()
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in _hooks or fullname in self._searching:
+            return None
+
+        # Find spec using the other finders
+        self._searching.add(fullname)
+        try:
+            spec = importlib.util.find_spec(fullname)
+        finally:
+            self._searching.discard(fullname)
+
+        if spec is None or spec.loader is None:
+            return None
+
+        spec.loader = _HookedLoader(spec.loader)
+        return spec
+
+
+_finder = _HookFinder()
+
+
+def _run_hooks(name):
+    for hook in _hooks.pop(name, []):
+        hook(sys.modules[name])
+
+
+def when_imported(name: str, hook: Callable) -> None:
+    """
+    Call `hook` with module `name` as soon as it is imported. If the module is
+    already imported, `hook` is called immediately. Used to register laktory
+    namespaces on Spark and Polars classes without importing these libraries
+    eagerly.
+
+    Parameters
+    ----------
+    name:
+        Full name of the module
+    hook:
+        Callable receiving the imported module as its only argument.
+    """
+    if name in sys.modules:
+        hook(sys.modules[name])
+        return
+
+    _hooks.setdefault(name, []).append(hook)
+    if _finder not in sys.meta_path:
+        sys.meta_path.insert(0, _finder)
@@ -0,0 +1,111 @@
+import ast
+from fractions import Fraction
+from functools import lru_cache
+
+from planck import units
+
+# Temperature scales expressed as celsius = scale * value + offset. Fractions
+# are used to get exact conversion factors (ex.: 9/5 and 32 from C to F)
+_C = (Fraction(1), Fraction(0))
+_K = (Fraction(1), Fraction("-273.15"))
+_F = (Fraction(5, 9), Fraction(-160, 9))
+_R = (Fraction(5, 9), Fraction("-273.15"))
+TEMPERATURE_SCALES = {
+    "c": _C,
+    "degc": _C,
+    "celcius": _C,
+    "celsius": _C,
+    "k": _K,
+    "kelvin": _K,
+    "f": _F,
+    "fahrenheit": _F,
+    "r": _R,
+    "rankine": _R,
+}
+
+
+@lru_cache(maxsize=None)
+def get_conversion(input_unit: str, output_unit: str) -> tuple[float, float]:
+    """
+    Resolve units conversion as a scale and an offset such that
+    `output = scale * input + offset`. Results are cached so that each pair of
+    units is only looked up once.
+
+    Parameters
+    ----------
+    input_unit:
+        Input units
+    output_unit:
+        Output units
+
+    Returns
+    -------
+    :
+        Scale and offset
+    """
+    t_in = TEMPERATURE_SCALES.get(input_unit.lower())
+    t_out = TEMPERATURE_SCALES.get(output_unit.lower())
+    if t_in or t_out:
+        if not (t_in and t_out):
+            raise ValueError(
+                f"Units '{input_unit}' can't be converted to '{output_unit}'"
+            )
+        scale = t_in[0] / t_out[0]
+        offset = (t_in[1] - t_out[1]) / t_out[0]
+        return float(scale), float(offset)
+
+    try:
+        scale = units[input_unit][output_unit]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Units '{input_unit}' can't be converted to '{output_unit}'"
+        ) from None
+
+    return float(scale), 0.0
+
+
+def validate_units_expr(expr: str) -> None:
+    """
+    Validate units of `convert_units` calls found in a Python expression. Units
+    must be set as literal strings to be validated.
+
+    Parameters
+    ----------
+    expr:
+        Python expression
+    """
+    try:
+        tree = ast.parse(expr.strip(), mode="eval")
+    except SyntaxError:
+        return
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if isinstance(func, ast.Name):
+            name = func.id
+            chained = False
+        elif isinstance(func, ast.Attribute):
+            name = func.attr
+            # Chained calls (`pl.col("x").laktory.convert_units(...)`) don't
+            # receive the column as first argument
+            parent = func.value
+            if isinstance(parent, ast.Attribute):
+                parent = parent.value
+            chained = isinstance(parent, ast.Call)
+        else:
+            continue
+        if name != "convert_units":
+            continue
+
+        args = node.args if chained else node.args[1:]
+        values = dict(zip(["input_unit", "output_unit"], args))
+        values.update({k.arg: k.value for k in node.keywords})
+        values = [values.get("input_unit"), values.get("output_unit")]
+        if not all(isinstance(v, ast.Constant) for v in values):
+            continue
+        values = [v.value for v in values]
+        # Units set as variables are resolved later
+        if all(isinstance(v, str) and "{" not in v for v in values):
+            get_conversion(*values)
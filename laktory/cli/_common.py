@@ -1,5 +1,9 @@
 import os
 import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 from typing import Union
 
 from prompt_toolkit.validation import ValidationError
@@ -7,9 +11,10 @@ from prompt_toolkit.validation import Validator
 from pydantic import BaseModel
 
 from laktory._logger import get_logger
+from laktory._settings import settings
+from laktory.constants import CACHE_ROOT
 from laktory.constants import QUICKSTART_TEMPLATES
 from laktory.constants import SUPPORTED_BACKENDS
-from laktory.models.stacks.stack import Stack
 
 logger = get_logger(__name__)
 DIRPATH = os.path.dirname(__file__)
@@ -35,14 +40,57 @@ class BackendValidator(Validator):
             )  # Move cursor to end
 
 
+def _write_env_stack(stack_filepath: str, env: str, dirpath: str) -> str:
+    """
+    Render the IaC stack of environment `env` and write it, along with the
+    files generated by the stack, in the working directory `dirpath`. Executed
+    in a separate process.
+    """
+    from laktory.models.resources.databricks.dbfsfile import DbfsFile
+    from laktory.models.resources.databricks.notebook import Notebook
+    from laktory.models.resources.databricks.workspacefile import WorkspaceFile
+    from laktory.models.stacks.stack import Stack
+
+    rootpath = os.path.dirname(stack_filepath)
+    if not os.path.exists(dirpath):
+        os.makedirs(dirpath)
+    os.chdir(dirpath)
+
+    with open(stack_filepath, "r", encoding="utf-8") as fp:
+        stack = Stack.model_validate_yaml(fp)
+
+    if stack.backend == "pulumi":
+        pstack = stack.to_pulumi(env_name=env)
+    else:
+        pstack = stack.to_terraform(env_name=env)
+
+    # Local files are resolved from the environment working directory when
+    # generated by the stack and from the stack directory otherwise.
+    for r in pstack.resources.values():
+        if not isinstance(r, (DbfsFile, Notebook, WorkspaceFile)):
+            continue
+        if os.path.isabs(r.source):
+            continue
+        source = os.path.abspath(r.source)
+        if not os.path.exists(source):
+            source = os.path.abspath(os.path.join(rootpath, r.source))
+        r.source = source
+
+    return os.path.abspath(pstack.write())
+
+
 class CLIController(BaseModel):
     stack_filepath: Union[str, None] = None
     env: Union[str, None] = None
     auto_approve: Union[bool, None] = False
     options_str: Union[str, None] = None
-    stack: Union[Stack, None] = None
+    max_parallel: Union[int, None] = 4
+    # Stack model is imported on initialization to keep CLI startup light
+    stack: Any = None
 
     def model_post_init(self, __context):
+        from laktory.models.stacks.stack import Stack
+
         super().model_post_init(__context)
 
         # Read stack
@@ -61,6 +109,13 @@ class CLIController(BaseModel):
                 )
                 self.env = env_names[0]
 
+    @property
+    def envs(self) -> list[str]:
+        """Selected environments, from comma separated `env`"""
+        if self.env is None:
+            return [None]
+        return [e.strip() for e in self.env.split(",")]
+
     @property
     def backend(self) -> str:
         return self.stack.backend
@@ -96,6 +151,10 @@ class CLIController(BaseModel):
         return self.organization + "/" + self.env
 
     def pulumi_call(self, cmd):
+        if len(self.envs) > 1:
+            self.envs_call(cmd)
+            return
+
         if self.pulumi_stack_name is None:
             raise ValueError("Argument `stack` must be specified with pulumi backend")
 
@@ -103,18 +162,136 @@ class CLIController(BaseModel):
         getattr(pstack, cmd)(stack=self.pulumi_stack_name, flags=self.pulumi_options)
 
     def terraform_call(self, cmd):
+        if len(self.envs) > 1:
+            self.envs_call(cmd)
+            return
+
         pstack = self.stack.to_terraform(env_name=self.env)
         getattr(pstack, cmd)(flags=self.terraform_options)
 
+    # ----------------------------------------------------------------------- #
+    # Multiple Environments                                                   #
+    # ----------------------------------------------------------------------- #
+
+    def env_dirpath(self, env: str) -> str:
+        """Working directory of the IaC backend for environment `env`"""
+        return os.path.abspath(os.path.join(CACHE_ROOT, ".laktory", env))
+
+    def envs_call(self, cmd: str) -> dict[str, bool]:
+        """
+        Call IaC backend command `cmd` for all the selected environments. Stacks
+        are rendered concurrently in a process pool, each in its own working
+        directory, and backend commands are executed with a parallelism bounded
+        by `max_parallel`. The output of each command is streamed with the
+        environment name as prefix. With terraform, a remote state backend
+        is required as local states are not shared across working directories.
+
+        Parameters
+        ----------
+        cmd:
+            Backend command (`preview`, `up`, `plan`, `apply`, etc.)
+
+        Returns
+        -------
+        :
+            Success status of each environment
+        """
+        from laktory._useragent import set_databricks_sdk_upstream
+
+        envs = self.envs
+        for env in envs:
+            if env not in self.stack.environments:
+                raise ValueError(f"Environment '{env}' is not declared in the stack.")
+
+        if cmd in ["up", "apply", "destroy"] and not self.auto_approve:
+            raise ValueError(
+                f"Command '{cmd}' for multiple environments requires auto approval (`--yes`)"
+            )
+
+        # Each environment is run from its own working directory, which would
+        # not hold the local state of a single environment deployment.
+        if self.backend == "terraform":
+            for env in envs:
+                if not self.stack.get_env(env).terraform.backend:
+                    raise ValueError(
+                        f"Terraform backend is not configured for environment '{env}'. "
+                        "Multiple environments require a remote state backend, "
+                        "otherwise run each environment separately."
+                    )
+
+        # Render stacks
+        stack_filepath = os.path.abspath(self.stack_filepath)
+        logger.info(f"Rendering stacks for environments {envs}")
+        with ProcessPoolExecutor(max_workers=len(envs)) as executor:
+            futures = {
+                env: executor.submit(
+                    _write_env_stack, stack_filepath, env, self.env_dirpath(env)
+                )
+                for env in envs
+            }
+            for env, future in futures.items():
+                logger.info(f"Stack for environment {env} written at {future.result()}")
+
+        # Inject user-agent value for monitoring usage as a Databricks partner
+        set_databricks_sdk_upstream()
+
+        def _run(env):
+            if self.backend == "pulumi":
+                _cmd = ["pulumi", cmd, "-s", self.organization + "/" + env]
+                _cmd += self.pulumi_options
+            else:
+                _cmd = ["terraform", cmd] + self.terraform_options
+            logger.info(f"Invoking '{' '.join(_cmd)}' for environment {env}")
+            t0 = time.time()
+            success = Worker().run(
+                cmd=_cmd,
+                cwd=self.env_dirpath(env),
+                raise_exceptions=False,
+                prefix=f"[{env}] ",
+            )
+            return success, time.time() - t0
+
+        # Call backend
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+            results = dict(zip(envs, executor.map(_run, envs)))
+
+        # Summary
+        print("Summary:")
+        for env, (success, duration) in results.items():
+            status = "succeeded" if success else "failed"
+            print(f"   {env}: {cmd} {status} after {duration:5.2f} sec")
+
+        failed = [env for env, (success, _) in results.items() if not success]
+        if failed and settings.cli_raise_external_exceptions:
+            raise RuntimeError(f"'{cmd}' failed for environments {failed}")
+
+        return {env: success for env, (success, _) in results.items()}
+
 
 class Worker:
-    def run(self, cmd, cwd=None, raise_exceptions=True):
+    def run(self, cmd, cwd=None, raise_exceptions=True, prefix=None):
         try:
-            subprocess.run(
-                cmd,
-                cwd=cwd,
-                check=True,
-            )
+            if prefix is None:
+                subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    check=True,
+                )
+            else:
+                # Stream output line by line with prefix
+                with subprocess.Popen(
+                    cmd,
+                    cwd=cwd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,
+                ) as p:
+                    for line in p.stdout:
+                        print(f"{prefix}{line}", end="", flush=True)
+                if p.returncode != 0:
+                    raise subprocess.CalledProcessError(p.returncode, cmd)
+            return True
 
         except Exception as e:
             _cmd = " ".join(cmd)
@@ -147,3 +324,5 @@ class Worker:
                     print(
                         "Pulumi is selected as IaC backend. Make sure it is installed and part of the PATH"
                     )
+
+            return False
@@ -10,7 +10,12 @@ from laktory.constants import SUPPORTED_BACKENDS
 @app.command()
 def deploy(
     environment: Annotated[
-        str, typer.Option("--env", "-e", help="Name of the environment")
+        str,
+        typer.Option(
+            "--env",
+            "-e",
+            help="Name of the environment. Comma separated names to target multiple environments.",
+        ),
     ] = None,
     filepath: Annotated[
         str, typer.Option(help="Stack (yaml) filepath.")
@@ -27,6 +32,13 @@ def deploy(
         str,
         typer.Option("--options", help="Comma separated IaC backend options (flags)."),
     ] = None,
+    max_parallel: Annotated[
+        int,
+        typer.Option(
+            "--max-parallel",
+            help="Maximum number of environments processed in parallel.",
+        ),
+    ] = 4,
 ):
     """
     Execute deployment.
@@ -34,18 +46,22 @@ def deploy(
     Parameters
     ----------
     environment:
-        Name of the environment.
+        Name of the environment. Comma separated names to target multiple
+        environments.
     filepath:
         Stack (yaml) filepath.
     auto_approve:
         Automatically approve and perform the update after previewing it
     options:
         Comma separated IaC backend options (flags).
+    max_parallel:
+        Maximum number of environments processed in parallel.
 
     Examples
     --------
     ```cmd
     laktory deploy --env dev --filepath my-stack.yaml
+    laktory deploy --env dev,staging,prod --yes
     ```
 
     References
@@ -58,6 +74,7 @@ def deploy(
         auto_approve=auto_approve,
         stack_filepath=filepath,
         options_str=options,
+        max_parallel=max_parallel,
     )
 
     # Call
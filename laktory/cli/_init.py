@@ -9,7 +9,12 @@ from laktory.cli.app import app
 @app.command()
 def init(
     environment: Annotated[
-        str, typer.Option("--env", "-e", help="Name of the environment")
+        str,
+        typer.Option(
+            "--env",
+            "-e",
+            help="Name of the environment. Comma separated names to target multiple environments.",
+        ),
     ] = None,
     filepath: Annotated[
         str, typer.Option(help="Stack (yaml) filepath.")
@@ -18,6 +23,13 @@ def init(
         str,
         typer.Option("--options", help="Comma separated IaC backend options (flags)."),
     ] = None,
+    max_parallel: Annotated[
+        int,
+        typer.Option(
+            "--max-parallel",
+            help="Maximum number of environments processed in parallel.",
+        ),
+    ] = 4,
 ):
     """
     Initialize IaC backend
@@ -25,11 +37,14 @@ def init(
     Parameters
     ----------
     environment:
-        Name of the environment.
+        Name of the environment. Comma separated names to target multiple
+        environments.
     filepath:
         Stack (yaml) filepath.
     options:
         Comma separated IaC backend options (flags).
+    max_parallel:
+        Maximum number of environments processed in parallel.
 
     Examples
     --------
@@ -45,6 +60,7 @@ def init(
         env=environment,
         stack_filepath=filepath,
         options_str=options,
+        max_parallel=max_parallel,
     )
 
     # Call
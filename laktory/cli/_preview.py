@@ -10,7 +10,12 @@ from laktory.constants import SUPPORTED_BACKENDS
 @app.command()
 def preview(
     environment: Annotated[
-        str, typer.Option("--env", "-e", help="Name of the environment")
+        str,
+        typer.Option(
+            "--env",
+            "-e",
+            help="Name of the environment. Comma separated names to target multiple environments.",
+        ),
     ] = None,
     filepath: Annotated[
         str, typer.Option(help="Stack (yaml) filepath.")
@@ -19,6 +24,13 @@ def preview(
         str,
         typer.Option("--options", help="Comma separated IaC backend options (flags)."),
     ] = None,
+    max_parallel: Annotated[
+        int,
+        typer.Option(
+            "--max-parallel",
+            help="Maximum number of environments processed in parallel.",
+        ),
+    ] = 4,
 ):
     """
     Validate configuration and resources and preview deployment.
@@ -26,16 +38,20 @@ def preview(
     Parameters
     ----------
     environment:
-        Name of the environment.
+        Name of the environment. Comma separated names to target multiple
+        environments.
     filepath:
         Stack (yaml) filepath.
     options:
         Comma separated IaC backend options (flags).
+    max_parallel:
+        Maximum number of environments processed in parallel.
 
     Examples
     --------
     ```cmd
     laktory preview --env dev pulumi_options "--show-reads,--show-config"
+    laktory preview --env dev,staging,prod --max-parallel 2
     ```
 
     References
@@ -47,6 +63,7 @@ def preview(
         env=environment,
         stack_filepath=filepath,
         options_str=options,
+        max_parallel=max_parallel,
     )
 
     # Call
@@ -26,6 +26,14 @@ def run(
             "--full-refresh", "--fr", help="Full tables refresh (pipeline only)"
         ),
     ] = False,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force",
+            "-f",
+            help="Execute pipeline nodes with unchanged inputs (job only)",
+        ),
+    ] = False,
     current_run_action: Annotated[
         str,
         typer.Option(
@@ -34,6 +42,22 @@ def run(
             help="Action to take if job currently running ['WAIT', 'CANCEL', 'FAIL']",
         ),
     ] = "WAIT",
+    select: Annotated[
+        list[str],
+        typer.Option(
+            "--select",
+            "-s",
+            help="Pipeline nodes selector (e.g. `slv_stock_prices+`). May be repeated.",
+        ),
+    ] = None,
+    exclude: Annotated[
+        list[str],
+        typer.Option(
+            "--exclude",
+            "-x",
+            help="Pipeline nodes exclusion selector (e.g. `gld_*`). May be repeated.",
+        ),
+    ] = None,
     environment: Annotated[
         str, typer.Option("--env", "-e", help="Name of the environment")
     ] = None,
@@ -58,6 +82,16 @@ def run(
         Action to take for currently running job or pipline.
     full_refresh:
         Full tables refresh (pipline only)
+    force:
+        Execute pipeline nodes even if their inputs are unchanged since their
+        last execution (job with `skip_unchanged` only).
+    select:
+        Selectors of the nodes to run when the job or DLT pipeline orchestrates
+        a laktory pipeline. A selector is a node name or a glob pattern,
+        optionally prefixed (upstream nodes) or suffixed (downstream nodes)
+        with `+`.
+    exclude:
+        Selectors of the nodes not to run.
     environment:
         Name of the environment.
     filepath:
@@ -67,6 +101,7 @@ def run(
     --------
     ```cmd
     laktory run --env dev --dlt pl-stock-prices --full_refresh --action CANCEL
+    laktory run --env dev --job job-pl-stock-prices --select slv_stock_prices+ --exclude gld_*
     ```
     """
 
@@ -82,7 +117,7 @@ def run(
         stack_filepath=filepath,
     )
     dispatcher = Dispatcher(stack=controller.stack)
-    dispatcher.get_resource_ids()
+    dispatcher.get_resource_ids(names=[job or dlt])
 
     if job:
         dispatcher.run_job(
@@ -90,6 +125,9 @@ def run(
             timeout=timeout,
             raise_exception=raise_exception,
             current_run_action=current_run_action,
+            select=select or None,
+            exclude=exclude or None,
+            force=force,
         )
 
     if dlt:
@@ -99,4 +137,6 @@ def run(
             raise_exception=raise_exception,
             current_run_action=current_run_action,
             full_refresh=full_refresh,
+            select=select or None,
+            exclude=exclude or None,
         )
@@ -2,3 +2,5 @@ from laktory.dispatcher.dispatcher import Dispatcher
 from laktory.dispatcher.dispatcherrunner import DispatcherRunner
 from laktory.dispatcher.dltpipelinerunner import DLTPipelineRunner
 from laktory.dispatcher.jobrunner import JobRunner
+from laktory.dispatcher.runmonitor import RunMonitor
+from laktory.dispatcher.runmonitor import RunResult
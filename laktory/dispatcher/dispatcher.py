@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+from laktory._logger import get_logger
 from laktory._useragent import DATABRICKS_USER_AGENT
 from laktory._useragent import VERSION
+from laktory.constants import CACHE_ROOT
 from laktory.dispatcher.dltpipelinerunner import DLTPipelineRunner
 from laktory.dispatcher.jobrunner import JobRunner
-from laktory.models.stacks.stack import Stack
 
 if TYPE_CHECKING:
     from databricks.sdk import WorkspaceClient
 
+    from laktory.dispatcher.dispatcherrunner import DispatcherRunner
+    from laktory.models.stacks.stack import Stack
+
+logger = get_logger(__name__)
+
 
 class Dispatcher:
     """
@@ -25,6 +35,11 @@ class Dispatcher:
         Stack object
     env
         Selected environment
+    id_cache_ttl
+        Time to live, in seconds, of the resource ids cached locally. Set to
+        `0` to disable the cache.
+    max_workers
+        Maximum number of resource ids fetched concurrently.
 
     Examples
     --------
@@ -36,7 +51,7 @@ class Dispatcher:
         stack = models.Stack.model_validate_yaml(fp)
 
     dispatcher = Dispatcher(stack=stack)
-    dispatcher.get_resource_ids()
+    dispatcher.get_resource_ids(names=["pl-stock-prices", "job-stock-prices"])
     pl = dispatcher.resources["pl-stock-prices"]
     job = dispatcher.resources["job-stock-prices"]
 
@@ -48,10 +63,20 @@ class Dispatcher:
     ```
     """
 
-    def __init__(self, stack: Stack = None, env: str = None):
+    def __init__(
+        self,
+        stack: Stack = None,
+        env: str = None,
+        id_cache_ttl: float = 3600,
+        max_workers: int = 8,
+    ):
         self.stack = stack
         self._env = env
         self._wc = None
+        self._workspace_kwargs = None
+        self.id_cache_ttl = id_cache_ttl
+        self.id_cache_filepath = os.path.join(CACHE_ROOT, "tmp-resource-ids.json")
+        self.max_workers = max_workers
         self.resources = {}
 
         self.init_resources()
@@ -65,12 +90,12 @@ class Dispatcher:
 
             if pl.databricks_dlt is not None:
                 self.resources[pl.databricks_dlt.name] = DLTPipelineRunner(
-                    dispatcher=self, name=pl.databricks_dlt.name
+                    dispatcher=self, name=pl.databricks_dlt.name, pipeline=pl
                 )
 
             if pl.databricks_job is not None:
                 self.resources[pl.databricks_job.name] = JobRunner(
-                    dispatcher=self, name=pl.databricks_job.name
+                    dispatcher=self, name=pl.databricks_job.name, pipeline=pl
                 )
 
         for k, pl in self.stack.resources.databricks_dltpipelines.items():
@@ -97,6 +122,7 @@ class Dispatcher:
         """Set environment"""
         self._env = value
         self._wc = None
+        self._workspace_kwargs = None
 
     # ----------------------------------------------------------------------- #
     # Workspace Client                                                        #
@@ -104,21 +130,31 @@ class Dispatcher:
 
     @property
     def _workspace_arguments(self):
+        if self._workspace_kwargs is None:
+            self._workspace_kwargs = self._get_workspace_arguments()
+        return self._workspace_kwargs
+
+    def _get_workspace_arguments(self):
+        # Read databricks provider configuration directly from the environment
+        # stack to avoid rendering the complete pulumi or terraform stack
+        from laktory.models.resources.providers.databricksprovider import (
+            DatabricksProvider,
+        )
+
+        env = self.stack.get_env(env_name=self.env)
+
         data = {}
         if self.stack.backend == "pulumi":
-            config = self.stack.to_pulumi(env_name=self.env).model_dump()["config"]
-            for k, v in config.items():
+            for k, v in env.pulumi.config.items():
                 if k.startswith("databricks"):
                     _k = k.split(":")[1]
                     data[_k] = v
         elif self.stack.backend == "terraform":
-            providers = self.stack.to_terraform(env_name=self.env).model_dump()[
-                "provider"
-            ]
-            for k in providers:
-                if "databricks" in k.lower():
-                    data = providers[k]
+            for provider in env.resources.providers.values():
+                if isinstance(provider, DatabricksProvider):
+                    data = provider.model_dump(exclude_unset=True)
                     break
+        data = env.inject_vars_into_dump(data)
 
         kwargs = {}
         for k in [
@@ -167,16 +203,128 @@ class Dispatcher:
     # Resources                                                               #
     # ----------------------------------------------------------------------- #
 
-    def get_resource_ids(self, env=None):
+    def get_resource_ids(self, env: str = None, names: list[str] = None):
         """
-        Get resource ids for each of the resources defined in the stack in the
-        provided environment `env`.
+        Get resource ids for the resources defined in the stack in the
+        provided environment `env`. Ids found in the local cache are re-used
+        until they expire or a request using them fails, and the others are
+        fetched concurrently.
+
+        Parameters
+        ----------
+        env:
+            Name of the environment. If `None`, current environment is used.
+        names:
+            Names of the resources for which the id is required. If `None`,
+            ids of all the resources are fetched.
         """
         if env is not None:
             self.env = env
 
-        for r in self.resources.values():
-            r.get_id()
+        if names is None:
+            names = list(self.resources.keys())
+
+        for name in names:
+            if name not in self.resources:
+                raise ValueError(f"Resource '{name}' is not declared in the stack.")
+
+        # Read cache
+        cache = self._read_id_cache()
+        runners = []
+        for name in names:
+            r = self.resources[name]
+            entry = cache.get(self._id_cache_key(r)) if cache else None
+            if (
+                entry is not None
+                and time.time() - entry["timestamp"] < self.id_cache_ttl
+            ):
+                logger.info(f"Using cached id for {r.name}")
+                r.id = entry["id"]
+                r._id_cached = True
+            else:
+                r._id_cached = False
+                runners.append(r)
+
+        if not runners:
+            return
+
+        # Fetch ids
+        if len(runners) == 1:
+            runners[0].get_id()
+        else:
+            # Build client before spawning threads so that it is shared
+            _ = self.wc
+            max_workers = min(self.max_workers, len(runners))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(lambda r: r.get_id(), runners))
+
+        # Write cache
+        if not self.id_cache_ttl:
+            return
+        for r in runners:
+            if r.id is not None:
+                cache[self._id_cache_key(r)] = {
+                    "id": r.id,
+                    "timestamp": time.time(),
+                }
+        self._write_id_cache(cache)
+
+    def cache_resource_id(self, runner: DispatcherRunner):
+        """
+        Update the cached id of a resource, typically after it has been
+        deleted or re-created. The entry is removed when the resource no
+        longer exists.
+
+        Parameters
+        ----------
+        runner:
+            Resource runner
+        """
+        if not self.id_cache_ttl:
+            return
+
+        cache = self._read_id_cache()
+        key = self._id_cache_key(runner)
+        if runner.id is None:
+            if cache.pop(key, None) is None:
+                return
+        else:
+            cache[key] = {"id": runner.id, "timestamp": time.time()}
+        self._write_id_cache(cache)
+
+    def _id_cache_key(self, runner: DispatcherRunner) -> str:
+        # Host resolved by the client (arguments, environment variables or
+        # profile) so that workspaces don't share entries
+        host = self.wc.config.host
+        return f"{host}/{self.env}/{type(runner).__name__}/{runner.name}"
+
+    def _read_id_cache(self) -> dict:
+        if not self.id_cache_ttl or not os.path.exists(self.id_cache_filepath):
+            return {}
+
+        try:
+            with open(self.id_cache_filepath) as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            logger.warning(f"Could not read cache {self.id_cache_filepath}")
+            return {}
+
+    def _write_id_cache(self, cache: dict):
+        if not self.id_cache_ttl:
+            return
+
+        # Drop expired entries
+        now = time.time()
+        cache = {
+            k: v for k, v in cache.items() if now - v["timestamp"] < self.id_cache_ttl
+        }
+
+        dirpath = os.path.dirname(self.id_cache_filepath)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        with open(self.id_cache_filepath, "w") as fp:
+            json.dump(cache, fp, indent=4)
 
     # ----------------------------------------------------------------------- #
     # Run                                                                     #
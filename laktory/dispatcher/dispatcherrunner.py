@@ -7,9 +7,13 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 
+from laktory._logger import get_logger
+
 if TYPE_CHECKING:
     from databricks.sdk import WorkspaceClient
 
+logger = get_logger(__name__)
+
 
 class DispatcherRunner(BaseModel):
     """
@@ -23,12 +27,17 @@ class DispatcherRunner(BaseModel):
         ID of the deployed resource
     dispatcher:
         Dispatcher managing the runs
+    pipeline:
+        Laktory pipeline orchestrated by the resource, if any. Required to
+        run a selection of nodes.
     """
 
     model_config = ConfigDict(extra="forbid")
     name: str = None
     id: str = None
     dispatcher: Any = Field(default=None, exclude=True)
+    pipeline: Any = Field(default=None, exclude=True)
+    _id_cached: bool = False
 
     @property
     def wc(self) -> WorkspaceClient:
@@ -38,5 +47,51 @@ class DispatcherRunner(BaseModel):
     def get_id(self) -> str:
         raise NotImplementedError()
 
+    def _call_with_id(self, func):
+        """
+        Call `func`, a request using the resource id. If the id was read from
+        the dispatcher cache and the request fails, the id is fetched again.
+        When it has changed (resource deleted or re-created), the cache entry
+        is updated and the request is retried once.
+        """
+        try:
+            return func()
+        except Exception:
+            if not self._id_cached:
+                raise
+            self._id_cached = False
+            cached_id = self.id
+            self.get_id()
+            if self.id == cached_id:
+                raise
+            logger.info(f"Cached id for {self.name} is outdated")
+            self.dispatcher.cache_resource_id(self)
+            if self.id is None:
+                raise
+        return func()
+
+    def _select_node_names(
+        self, select: list[str] = None, exclude: list[str] = None
+    ) -> list[str]:
+        if self.pipeline is None:
+            raise ValueError(
+                f"Nodes selection is not available for '{self.name}' as it does not orchestrate a laktory pipeline."
+            )
+        return self.pipeline.select_node_names(select=select, exclude=exclude)
+
     def run(self, wait=True):
         raise NotImplementedError()
+
+    def poll(self) -> Any:
+        """Refresh the status of the current run and return its state"""
+        raise NotImplementedError()
+
+    @property
+    def is_terminated(self) -> bool:
+        """`True` if the current run reached a final state"""
+        raise NotImplementedError()
+
+    @property
+    def is_successful(self) -> bool:
+        """`True` if the current run terminated successfully"""
+        raise NotImplementedError()
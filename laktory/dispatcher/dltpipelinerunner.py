@@ -7,10 +7,12 @@ from typing import Literal
 from laktory._logger import get_logger
 from laktory.datetime import unix_timestamp
 from laktory.dispatcher.dispatcherrunner import DispatcherRunner
+from laktory.dispatcher.runmonitor import RunMonitor
 
 if TYPE_CHECKING:
     from databricks.sdk.service.pipelines import GetUpdateResponse
     from databricks.sdk.service.pipelines import StartUpdateResponse
+    from databricks.sdk.service.pipelines import UpdateInfoState
 
 logger = get_logger(__name__)
 
@@ -22,6 +24,8 @@ class DLTPipelineRunner(DispatcherRunner):
 
     _update_start: StartUpdateResponse = None
     _update: GetUpdateResponse = None
+    _t0: float = None
+    _event_ids: list = []
 
     def get_id(self) -> str:
         """Get deployed pipeline id"""
@@ -40,6 +44,8 @@ class DLTPipelineRunner(DispatcherRunner):
         full_refresh: bool = False,
         raise_exception: bool = False,
         current_run_action: Literal["WAIT", "CANCEL", "FAIL"] = "WAIT",
+        select: list[str] = None,
+        exclude: list[str] = None,
     ):
         """
         Run remote pipeline and monitor failures.
@@ -62,6 +68,13 @@ class DLTPipelineRunner(DispatcherRunner):
                 - WAIT: wait for the current run to complete
                 - CANCEL: cancel the current run
                 - FAIL: raise an exception
+        select:
+            Selectors of the pipeline nodes to refresh. Only the tables of the
+            selected nodes are refreshed. See `Pipeline.select_node_names` for
+            the selectors syntax. Requires the DLT pipeline to orchestrate a
+            laktory pipeline.
+        exclude:
+            Selectors of the pipeline nodes not to refresh.
 
         Returns
         -------
@@ -69,18 +82,28 @@ class DLTPipelineRunner(DispatcherRunner):
             None
         """
         from databricks.sdk.core import DatabricksError
-        from databricks.sdk.service.pipelines import EventLevel
-        from databricks.sdk.service.pipelines import UpdateInfoState
 
-        event_ids = []
+        kwargs = {"full_refresh": full_refresh}
+        if select is not None or exclude is not None:
+            table_names = []
+            for node_name in self._select_node_names(select=select, exclude=exclude):
+                for sink in self.pipeline.nodes_dict[node_name].all_sinks:
+                    table_names += [sink.table_name]
+            logger.info(f"Pipeline {self.name} selected tables: {table_names}")
+            if full_refresh:
+                kwargs = {"full_refresh_selection": table_names}
+            else:
+                kwargs = {"refresh_selection": table_names}
 
         # Start update
         t0 = time.time()
         try:
-            self._update_start = self.wc.pipelines.start_update(
-                pipeline_id=self.id,
-                full_refresh=full_refresh,
-                # validate_only=False,
+            self._update_start = self._call_with_id(
+                lambda: self.wc.pipelines.start_update(
+                    pipeline_id=self.id,
+                    # validate_only=False,
+                    **kwargs,
+                )
             )
             logger.info(f"Pipeline {self.name} update started...")
 
@@ -103,65 +126,72 @@ class DLTPipelineRunner(DispatcherRunner):
             logger.info(f"Pipeline {self.name} update started...")
             self._update_start = self.wc.pipelines.start_update(
                 pipeline_id=self.id,
-                full_refresh=full_refresh,
                 # validate_only=False,
+                **kwargs,
             )
 
-        pstate = None
+        self._t0 = t0
+        self._event_ids = []
         self.get_update()
         logger.info(f"Pipeline {self.name} run URL: {self.update_url}")
         if wait:
-            while (
-                time.time() - t0 < timeout
-                or self.update_state == UpdateInfoState.COMPLETED
-            ):
-                self.get_update()
-
-                if self.update_state != pstate:
-                    logger.info(
-                        f"Pipeline {self.name} state: {self.update_state.value}"
-                    )
-                    pstate = self.update_state
-
-                # filter don't seem to work
-                for event in self.wc.pipelines.list_pipeline_events(
-                    pipeline_id=self.id,
-                    max_results=100,
-                    # filter=f"(level in ('ERROR', 'WARN')) AND (timestamp > '{utc_datetime(t0).isoformat()}Z')"
-                    # filter=f"level in ('ERROR', 'WARN')",
-                    # filter=f"timestamp > '{utc_datetime(t0).isoformat()}Z'"
-                    page_token=None,
-                ):
-                    if (
-                        event.id in event_ids
-                        or unix_timestamp(event.timestamp) < t0
-                        or event.origin.update_id != self.update_id
-                    ):
-                        continue
-
-                    if event.level == EventLevel.WARN:
-                        logger.warn(event.message)
-                    elif event.level == EventLevel.ERROR:
-                        logger.error(event.message)
-                    event_ids += [event.id]
-
-                if self.update_state in [
-                    UpdateInfoState.CANCELED,
-                    UpdateInfoState.COMPLETED,
-                    UpdateInfoState.FAILED,
-                ]:
-                    break
-
-                time.sleep(1.0)
+            monitor = RunMonitor(runners=[self], timeout=timeout)
+            monitor.run()
 
             logger.info(
                 f"Pipeline {self.name} update terminated after {time.time() - t0: 5.2f} sec with {self.update_state}"
             )
-            if raise_exception and self.update_state != UpdateInfoState.COMPLETED:
+            if raise_exception and not self.is_successful:
                 raise Exception(
                     f"Pipeline {self.name} update not completed ({self.update_state})"
                 )
 
+    def poll(self) -> UpdateInfoState:
+        """Refresh current update, log new events and return update state"""
+        from databricks.sdk.service.pipelines import EventLevel
+
+        self.get_update()
+
+        # filter don't seem to work
+        for event in self.wc.pipelines.list_pipeline_events(
+            pipeline_id=self.id,
+            max_results=100,
+            # filter=f"(level in ('ERROR', 'WARN')) AND (timestamp > '{utc_datetime(t0).isoformat()}Z')"
+            # filter=f"level in ('ERROR', 'WARN')",
+            # filter=f"timestamp > '{utc_datetime(t0).isoformat()}Z'"
+            page_token=None,
+        ):
+            if (
+                event.id in self._event_ids
+                or unix_timestamp(event.timestamp) < self._t0
+                or event.origin.update_id != self.update_id
+            ):
+                continue
+
+            if event.level == EventLevel.WARN:
+                logger.warn(event.message)
+            elif event.level == EventLevel.ERROR:
+                logger.error(event.message)
+            self._event_ids += [event.id]
+
+        return self.update_state
+
+    @property
+    def is_terminated(self) -> bool:
+        from databricks.sdk.service.pipelines import UpdateInfoState
+
+        return self.update_state in [
+            UpdateInfoState.CANCELED,
+            UpdateInfoState.COMPLETED,
+            UpdateInfoState.FAILED,
+        ]
+
+    @property
+    def is_successful(self) -> bool:
+        from databricks.sdk.service.pipelines import UpdateInfoState
+
+        return self.update_state == UpdateInfoState.COMPLETED
+
     def get_update(self):
         self._update = self.wc.pipelines.get_update(
             pipeline_id=self.id, update_id=self.update_id
@@ -6,9 +6,11 @@ from typing import Literal
 
 from laktory._logger import get_logger
 from laktory.dispatcher.dispatcherrunner import DispatcherRunner
+from laktory.dispatcher.runmonitor import RunMonitor
 
 if TYPE_CHECKING:
     from databricks.sdk.service.jobs import Run
+    from databricks.sdk.service.jobs import RunLifeCycleState
     from databricks.sdk.service.jobs import Wait
 
 logger = get_logger(__name__)
@@ -21,6 +23,7 @@ class JobRunner(DispatcherRunner):
 
     _run_start: Wait = None
     _run: Run = None
+    _task_states: dict = {}
 
     def get_id(self) -> str:
         """Get deployed job id"""
@@ -37,6 +40,9 @@ class JobRunner(DispatcherRunner):
         timeout: int = 20 * 60,
         raise_exception: bool = False,
         current_run_action: Literal["WAIT", "CANCEL", "FAIL"] = "WAIT",
+        select: list[str] = None,
+        exclude: list[str] = None,
+        force: bool = False,
     ):
         """
         Run remote job and monitor failures.
@@ -56,6 +62,17 @@ class JobRunner(DispatcherRunner):
                 - WAIT: wait for the current run to complete
                 - CANCEL: cancel the current run
                 - FAIL: raise an exception
+        select:
+            Selectors of the pipeline nodes to run. Only the tasks executing
+            the selected nodes are run. See `Pipeline.select_node_names` for
+            the selectors syntax. Requires the job to orchestrate a laktory
+            pipeline.
+        exclude:
+            Selectors of the pipeline nodes not to run.
+        force:
+            If `True`, pipeline nodes with unchanged inputs are executed
+            anyway. Only applicable to a job orchestrating a laktory pipeline
+            with `skip_unchanged` enabled.
 
         Returns
         -------
@@ -63,9 +80,29 @@ class JobRunner(DispatcherRunner):
             None
         """
         from databricks.sdk.errors import OperationFailed
-        from databricks.sdk.service.jobs import RunLifeCycleState
 
-        active_runs = list(self.wc.jobs.list_runs(job_id=self.id, active_only=True))
+        only = None
+        if select is not None or exclude is not None:
+            node_names = set(self._select_node_names(select=select, exclude=exclude))
+            node_groups = self.pipeline.databricks_job.node_groups
+            only = [k for k, v in node_groups.items() if node_names.intersection(v)]
+            logger.info(f"Job {self.name} selected tasks: {only}")
+
+        job_parameters = None
+        if force:
+            if (
+                self.pipeline is not None
+                and self.pipeline.databricks_job.skip_unchanged
+            ):
+                job_parameters = {"skip_unchanged": "false"}
+            else:
+                logger.warning(
+                    f"Job {self.name} does not skip unchanged nodes. `force` is ignored."
+                )
+
+        active_runs = self._call_with_id(
+            lambda: list(self.wc.jobs.list_runs(job_id=self.id, active_only=True))
+        )
 
         if len(active_runs) > 0:
             if current_run_action.upper() == "FAIL":
@@ -94,38 +131,16 @@ class JobRunner(DispatcherRunner):
         logger.info(f"Job {self.name} run started...")
         self._run_start = self.wc.jobs.run_now(
             job_id=self.id,
+            only=only,
+            job_parameters=job_parameters,
         )
 
-        pstates = {}
+        self._task_states = {}
         self.get_run()
         logger.info(f"Job {self.name} run URL: {self._run.run_page_url}")
         if wait:
-            while (
-                time.time() - t0 < timeout
-                or self.run_state == RunLifeCycleState.TERMINATED
-            ):
-                self.get_run()
-
-                if self.run_state != pstates.get(self.run_id, None):
-                    logger.info(f"Job {self.name} state: {self.run_state.value}")
-                    pstates[self.run_id] = self.run_state
-
-                for task in self._run.tasks:
-                    state = task.state
-                    if state.life_cycle_state != pstates.get(task.run_id, None):
-                        logger.info(
-                            f"   Task {self.name}.{task.task_key} state: {state.life_cycle_state.value}"
-                        )
-                    pstates[task.run_id] = state.life_cycle_state
-
-                if self.run_state in [
-                    RunLifeCycleState.TERMINATED,
-                    RunLifeCycleState.SKIPPED,
-                    RunLifeCycleState.INTERNAL_ERROR,
-                ]:
-                    break
-
-                time.sleep(1)
+            monitor = RunMonitor(runners=[self], timeout=timeout)
+            monitor.run()
 
             logger.info(
                 f"Job {self.name} run terminated after {time.time() - t0: 5.2f} sec with {self.run_state} ({self._run.state.state_message})"
@@ -134,11 +149,39 @@ class JobRunner(DispatcherRunner):
                 logger.info(
                     f"Task {self.name}.{task.task_key} terminated with {task.state.result_state} ({task.state.state_message})"
                 )
-            if raise_exception and self.run_state != RunLifeCycleState.TERMINATED:
+            if raise_exception and not self.is_successful:
                 raise Exception(
                     f"Job {self.name} update not completed ({self.run_state})"
                 )
 
+    def poll(self) -> RunLifeCycleState:
+        """Refresh current run and return its life cycle state"""
+        self.get_run()
+
+        for task in self._run.tasks:
+            state = task.state.life_cycle_state
+            if state != self._task_states.get(task.run_id, None):
+                logger.info(f"   Task {self.name}.{task.task_key} state: {state.value}")
+            self._task_states[task.run_id] = state
+
+        return self.run_state
+
+    @property
+    def is_terminated(self) -> bool:
+        from databricks.sdk.service.jobs import RunLifeCycleState
+
+        return self.run_state in [
+            RunLifeCycleState.TERMINATED,
+            RunLifeCycleState.SKIPPED,
+            RunLifeCycleState.INTERNAL_ERROR,
+        ]
+
+    @property
+    def is_successful(self) -> bool:
+        from databricks.sdk.service.jobs import RunLifeCycleState
+
+        return self.run_state == RunLifeCycleState.TERMINATED
+
     def get_run(self):
         self._run = self.wc.jobs.get_run(
             run_id=self.run_id,
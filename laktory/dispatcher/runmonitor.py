@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+from pydantic import BaseModel
+
+from laktory._logger import get_logger
+
+if TYPE_CHECKING:
+    from laktory.dispatcher.dispatcherrunner import DispatcherRunner
+
+logger = get_logger(__name__)
+
+
+class RunResult(BaseModel):
+    """
+    Outcome of a monitored run.
+
+    Attributes
+    ----------
+    name:
+        Name of the resource attached to the runner
+    state:
+        Last observed state of the run
+    success:
+        `True` if the run terminated successfully
+    timed_out:
+        `True` if the monitor timed out before the run terminated
+    duration:
+        Monitoring duration in seconds
+    polls:
+        Number of status requests sent to the workspace
+    """
+
+    name: str = None
+    state: str = None
+    success: bool = False
+    timed_out: bool = False
+    duration: float = None
+    polls: int = 0
+
+
+class RunMonitor:
+    """
+    Monitor of job and DLT pipeline runs. All the runs are watched
+    concurrently from a single event loop. Blocking workspace requests are
+    delegated to worker threads only for the duration of each status request.
+
+    The delay between two status requests of a run grows exponentially, with
+    random jitter, while its state remains unchanged and is reset as soon as
+    the state changes.
+
+    Parameters
+    ----------
+    runners
+        Runners with a started run
+    timeout
+        Maximum time, in seconds, allowed for all runs to terminate.
+    min_interval
+        Delay, in seconds, before the first status request and after each state
+        change.
+    max_interval
+        Maximum delay, in seconds, between two status requests.
+    backoff_factor
+        Multiplier applied to the delay after each request without state
+        change.
+    jitter
+        Fraction of the delay randomly subtracted to avoid synchronized
+        requests.
+    on_state_change
+        Callable (or coroutine function) called with the runner, the previous
+        state and the new state every time the state of a run changes.
+
+    Examples
+    --------
+    ```py tag:skip-run
+    from laktory import models
+    from laktory.dispatcher import Dispatcher
+    from laktory.dispatcher import RunMonitor
+
+    with open("./stack.yaml") as fp:
+        stack = models.Stack.model_validate_yaml(fp)
+
+    dispatcher = Dispatcher(stack=stack)
+    dispatcher.get_resource_ids()
+
+    runners = list(dispatcher.resources.values())
+    for runner in runners:
+        runner.run(wait=False)
+
+    monitor = RunMonitor(
+        runners=runners,
+        on_state_change=lambda r, old, new: print(r.name, old, new),
+    )
+    results = monitor.run()
+    print(monitor.success)
+    ```
+    """
+
+    def __init__(
+        self,
+        runners: list[DispatcherRunner],
+        timeout: float = 20 * 60,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff_factor: float = 1.5,
+        jitter: float = 0.2,
+        on_state_change: Callable[[DispatcherRunner, Any, Any], Any] = None,
+    ):
+        self.runners = runners
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.on_state_change = on_state_change
+        self.results: dict[str, RunResult] = {}
+
+    # ----------------------------------------------------------------------- #
+    # Results                                                                 #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def success(self) -> bool:
+        """`True` if all runs terminated successfully"""
+        return all(r.success for r in self.results.values())
+
+    @property
+    def summary(self) -> dict[str, int]:
+        """Number of runs for each final state"""
+        return dict(Counter(r.state for r in self.results.values()))
+
+    # ----------------------------------------------------------------------- #
+    # Monitoring                                                              #
+    # ----------------------------------------------------------------------- #
+
+    def next_interval(self, interval: float) -> float:
+        """Delay following `interval` when the state remains unchanged"""
+        return min(interval * self.backoff_factor, self.max_interval)
+
+    def _sleep_time(self, interval: float) -> float:
+        return interval * (1.0 - self.jitter * random.random())
+
+    async def _notify(self, runner, previous_state, state):
+        logger.info(f"{runner.name} state: {_state_value(state)}")
+        if self.on_state_change is None:
+            return
+        output = self.on_state_change(runner, previous_state, state)
+        if inspect.isawaitable(output):
+            await output
+
+    async def _watch_runner(self, runner: DispatcherRunner, t0: float) -> RunResult:
+        result = RunResult(name=runner.name)
+        interval = self.min_interval
+        state = None
+
+        while True:
+            state_ = await asyncio.to_thread(runner.poll)
+            result.polls += 1
+
+            if state_ != state:
+                await self._notify(runner, state, state_)
+                state = state_
+                interval = self.min_interval
+            else:
+                interval = self.next_interval(interval)
+
+            if runner.is_terminated:
+                break
+
+            remaining = t0 + self.timeout - time.time()
+            if remaining <= 0:
+                result.timed_out = True
+                break
+
+            await asyncio.sleep(min(self._sleep_time(interval), remaining))
+
+        result.state = _state_value(state)
+        result.success = runner.is_successful
+        result.duration = time.time() - t0
+        self.results[runner.name] = result
+        return result
+
+    async def watch(self) -> dict[str, RunResult]:
+        """
+        Watch all runs until they terminate or the monitor times out.
+
+        Returns
+        -------
+        :
+            Result of each run
+        """
+        t0 = time.time()
+        self.results = {}
+        await asyncio.gather(*[self._watch_runner(r, t0) for r in self.runners])
+        return self.results
+
+    def run(self) -> dict[str, RunResult]:
+        """
+        Synchronous version of `watch`. When called from a running event loop
+        (e.g. a notebook), the monitor runs its own loop in a separate thread.
+
+        Returns
+        -------
+        :
+            Result of each run
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.watch())
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.watch()).result()
+
+
+def _state_value(state: Any) -> Any:
+    return getattr(state, "value", state)
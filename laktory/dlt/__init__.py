@@ -346,3 +346,145 @@ def table_or_view(*args, as_view=False, **kwargs):
         return view(*args, **kwargs)
     else:
         return table(*args, **kwargs)
+
+
+# --------------------------------------------------------------------------- #
+# Pipeline Nodes                                                              #
+# --------------------------------------------------------------------------- #
+
+
+def get_stage_view_name(node) -> str:
+    """
+    Name of the intermediate DLT view storing the staged DataFrame of a
+    pipeline node writing to multiple sinks.
+
+    Parameters
+    ----------
+    node:
+        Pipeline node
+
+    Returns
+    -------
+    :
+        View name
+    """
+    return f"{node.name}_laktory_stage"
+
+
+def define_node(node, udfs=None) -> list:
+    """
+    Define the DLT tables and views of a pipeline node, excluding CDC sinks.
+
+    When the node writes to a single sink (or none), the node is executed
+    by the function of the table (or view). When it writes to multiple
+    sinks, such as an output and a quarantine sink, the node is executed
+    only once by an intermediate view returning the staged DataFrame. Each
+    sink table then reads this view and applies the expectations filters.
+
+    Parameters
+    ----------
+    node:
+        Pipeline node
+    udfs:
+        User-defined functions
+
+    Returns
+    -------
+    :
+        Functions decorated with `@dlt.table` or `@dlt.view`, in order of
+        execution.
+
+    Examples
+    --------
+    ```py tag:skip-run
+    from laktory import dlt
+
+    dlt.spark = spark
+
+    for node in pl.nodes:
+        for wrapper in dlt.define_node(node):
+            df = dlt.get_df(wrapper)
+            display(df)
+    ```
+    """
+    sinks = [s for s in node.sinks or [] if not s.is_cdc]
+
+    if len(sinks) == 0 and node.sinks:
+        return []
+
+    if len(sinks) <= 1:
+        sink = None
+        if sinks:
+            sink = sinks[0]
+        return [_define_node_table(node, sink, udfs=udfs)]
+
+    view_name = get_stage_view_name(node)
+
+    @view(name=view_name, comment=node.description)
+    def get_stage_df():
+        logger.info(f"Building {node.name} node stage view")
+        node.execute(spark=spark, udfs=udfs)
+        return node.stage_df
+
+    wrappers = [get_stage_df]
+    for sink in sinks:
+        wrappers += [_define_node_table(node, sink, view_name=view_name)]
+
+    return wrappers
+
+
+def _define_node_table(node, sink, udfs=None, view_name=None):
+    # Get Expectations
+    dlt_warning_expectations = {}
+    dlt_drop_expectations = {}
+    dlt_fail_expectations = {}
+    if sink and not sink.is_quarantine:
+        dlt_warning_expectations = node.dlt_warning_expectations
+        dlt_drop_expectations = node.dlt_drop_expectations
+        dlt_fail_expectations = node.dlt_fail_expectations
+
+    # Get Name
+    name = node.name
+    if sink is not None:
+        name = sink.table_name
+
+    is_quarantine = sink is not None and sink.is_quarantine
+
+    @table_or_view(
+        name=name,
+        comment=node.description,
+        as_view=sink is None,
+    )
+    @expect_all(dlt_warning_expectations)
+    @expect_all_or_drop(dlt_drop_expectations)
+    @expect_all_or_fail(dlt_fail_expectations)
+    def get_df():
+        sink_str = ""
+        if sink is not None:
+            sink_str = f" | sink: {sink.full_name}"
+        logger.info(f"Building {node.name} node{sink_str}")
+
+        # Execute node
+        if view_name is None:
+            node.execute(spark=spark, udfs=udfs)
+            df = node.quarantine_df if is_quarantine else node.output_df
+
+        # Node already executed by stage view
+        elif is_debug():
+            df = node.quarantine_df if is_quarantine else node.output_df
+
+        # Read stage view
+        else:
+            if node.source.as_stream:
+                df = read_stream(view_name)
+            else:
+                df = read(view_name)
+            if is_quarantine:
+                df = node.filter_quarantine_df(df)
+            else:
+                df = node.filter_output_df(df)
+
+        # Return
+        return df
+
+    return get_df
@@ -1,13 +1,133 @@
-from .basemodel import BaseModel
-from .dataevent import DataEvent
-from .dataframecolumnexpression import DataFrameColumnExpression
-from .dataproducer import DataProducer
-from .dataquality import *
-from .datasinks import *
-from .datasources import *
-from .grants import *
-from .pipeline.pipeline import Pipeline
-from .pipeline.pipelinenode import PipelineNode
-from .resources import *
-from .stacks import *
-from .transformers import *
+from typing import TYPE_CHECKING
+
+from laktory._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "basemodel",
+        "dataevent",
+        "dataeventbatch",
+        "dataeventwriter",
+        "dataframecolumnexpression",
+        "dataproducer",
+        "dataquality",
+        "datasinks",
+        "datasources",
+        "grants",
+        "pipeline",
+        "resources",
+        "stacks",
+        "transformers",
+    ],
+    attributes={
+        "AWSProvider": ".resources.providers",
+        "AzureProvider": ".resources.providers",
+        "AzurePulumiProvider": ".resources.providers",
+        "BaseChainNode": ".transformers",
+        "BaseDataSink": ".datasinks",
+        "BaseDataSource": ".datasources",
+        "BaseModel": ".basemodel",
+        "BaseResource": ".resources",
+        "CatalogGrant": ".grants",
+        "ConnectionGrant": ".grants",
+        "DataEvent": ".dataevent",
+        "DataEventBatch": ".dataeventbatch",
+        "DataEventWriter": ".dataeventwriter",
+        "DataFrameColumnExpression": ".dataframecolumnexpression",
+        "DataProducer": ".dataproducer",
+        "DataQualityCheck": ".dataquality",
+        "DataQualityExpectation": ".dataquality",
+        "DataSinkMergeCDCOptions": ".datasinks",
+        "DataSinksUnion": ".datasinks",
+        "DataSourcesUnion": ".datasources",
+        "DatabricksProvider": ".resources.providers",
+        "ExternalLocationGrant": ".grants",
+        "FileDataSink": ".datasinks",
+        "FileDataSource": ".datasources",
+        "FunctionGrant": ".grants",
+        "MemoryDataSource": ".datasources",
+        "MetastoreGrant": ".grants",
+        "Pipeline": ".pipeline.pipeline",
+        "PipelineNode": ".pipeline.pipelinenode",
+        "PipelineNodeDataSource": ".datasources",
+        "PolarsChain": ".transformers",
+        "PolarsChainNode": ".transformers",
+        "PolarsChainNodeFuncArg": ".transformers",
+        "PolarsChainNodeSQLExpr": ".transformers",
+        "PulumiResource": ".resources",
+        "PulumiStack": ".stacks",
+        "RegisteredModelGrant": ".grants",
+        "SchemaGrant": ".grants",
+        "ShareGrant": ".grants",
+        "SparkChain": ".transformers",
+        "SparkChainNode": ".transformers",
+        "SparkChainNodeFuncArg": ".transformers",
+        "SparkChainNodeSQLExpr": ".transformers",
+        "Stack": ".stacks",
+        "StackResources": ".stacks",
+        "StorageCredentialGrant": ".grants",
+        "TableDataSink": ".datasinks",
+        "TableDataSource": ".datasources",
+        "TableGrant": ".grants",
+        "TerraformResource": ".resources",
+        "TerraformStack": ".stacks",
+        "ViewGrant": ".grants",
+        "VolumeGrant": ".grants",
+    },
+)
+
+if TYPE_CHECKING:
+    from .basemodel import BaseModel
+    from .dataevent import DataEvent
+    from .dataeventbatch import DataEventBatch
+    from .dataeventwriter import DataEventWriter
+    from .dataframecolumnexpression import DataFrameColumnExpression
+    from .dataproducer import DataProducer
+    from .dataquality import DataQualityCheck
+    from .dataquality import DataQualityExpectation
+    from .datasinks import BaseDataSink
+    from .datasinks import DataSinkMergeCDCOptions
+    from .datasinks import DataSinksUnion
+    from .datasinks import FileDataSink
+    from .datasinks import TableDataSink
+    from .datasources import BaseDataSource
+    from .datasources import DataSourcesUnion
+    from .datasources import FileDataSource
+    from .datasources import MemoryDataSource
+    from .datasources import PipelineNodeDataSource
+    from .datasources import TableDataSource
+    from .grants import CatalogGrant
+    from .grants import ConnectionGrant
+    from .grants import ExternalLocationGrant
+    from .grants import FunctionGrant
+    from .grants import MetastoreGrant
+    from .grants import RegisteredModelGrant
+    from .grants import SchemaGrant
+    from .grants import ShareGrant
+    from .grants import StorageCredentialGrant
+    from .grants import TableGrant
+    from .grants import ViewGrant
+    from .grants import VolumeGrant
+    from .pipeline.pipeline import Pipeline
+    from .pipeline.pipelinenode import PipelineNode
+    from .resources import BaseResource
+    from .resources import PulumiResource
+    from .resources import TerraformResource
+    from .resources.providers import AWSProvider
+    from .resources.providers import AzureProvider
+    from .resources.providers import AzurePulumiProvider
+    from .resources.providers import DatabricksProvider
+    from .stacks import PulumiStack
+    from .stacks import Stack
+    from .stacks import StackResources
+    from .stacks import TerraformStack
+    from .transformers import BaseChainNode
+    from .transformers import PolarsChain
+    from .transformers import PolarsChainNode
+    from .transformers import PolarsChainNodeFuncArg
+    from .transformers import PolarsChainNodeSQLExpr
+    from .transformers import SparkChain
+    from .transformers import SparkChainNode
+    from .transformers import SparkChainNodeFuncArg
+    from .transformers import SparkChainNodeSQLExpr
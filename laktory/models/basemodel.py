@@ -4,6 +4,7 @@ import re
 import typing
 from contextlib import contextmanager
 from copy import deepcopy
+from typing import Annotated
 from typing import Any
 from typing import TextIO
 from typing import TypeVar
@@ -22,12 +23,45 @@ from pydantic._internal._model_construction import ModelMetaclass as _ModelMetac
 from laktory._parsers import _resolve_value
 from laktory._parsers import _resolve_values
 from laktory._parsers import _snake_to_camel
-from laktory.typing import var
+from laktory.typing import VariableOr
 from laktory.yaml.recursiveloader import RecursiveLoader
 
 Model = TypeVar("Model", bound="BaseModel")
 
 
+def _with_variables(type_hint: Any) -> Any:
+    # Strings are already accepted as is
+    if type_hint is str:
+        return type_hint
+
+    # Variables already supported
+    if get_origin(type_hint) is Annotated and VariableOr() in type_hint.__metadata__:
+        return type_hint
+
+    origin = get_origin(type_hint)
+    args = get_args(type_hint)
+
+    if origin is list:
+        type_hint = list[_with_variables(args[0])]
+
+    elif origin is dict:
+        type_hint = dict[_with_variables(args[0]), _with_variables(args[1])]
+
+    return Annotated[type_hint, VariableOr()]
+
+
+def _is_list_of_models(type_hint: Any) -> bool:
+    if get_origin(type_hint) is not list:
+        return False
+
+    # Remove variables annotation and select first union member
+    item = get_args(type_hint)[0]
+    while get_origin(item) in [Annotated, Union]:
+        item = get_args(item)[0]
+
+    return isinstance(item, type) and issubclass(item, _BaseModel)
+
+
 class ModelMetaclass(_ModelMetaclass):
     def __new__(
         mcs,
@@ -36,7 +70,8 @@ class ModelMetaclass(_ModelMetaclass):
         namespace: dict[str, Any],
         **kwargs: Any,
     ) -> type:
-        # Add var as a possible type hint of each model field to support variables injection
+        # Allow variables (strings) in place of the value of each model field to
+        # support variables injection
         for field_name in namespace.get("__annotations__", {}):
             type_hint = namespace["__annotations__"][field_name]
 
@@ -55,19 +90,7 @@ class ModelMetaclass(_ModelMetaclass):
             if type_hint is typing.Any:
                 continue
 
-            origin = get_origin(type_hint)
-            args = get_args(type_hint)
-            new_type_hint = type_hint
-
-            if origin is list:
-                new_type_hint = list[tuple([Union[args[0], var]])]
-
-            elif origin is dict:
-                new_type_hint = dict[Union[args[0], var], Union[args[1], var]]
-
-            new_type_hint = Union[new_type_hint, var]
-
-            namespace["__annotations__"][field_name] = new_type_hint
+            namespace["__annotations__"][field_name] = _with_variables(type_hint)
 
         return super().__new__(mcs, cls_name, bases, namespace, **kwargs)
 
@@ -88,6 +111,8 @@ class BaseModel(_BaseModel, metaclass=ModelMetaclass):
         # `validate_assignment` is required when injecting complex variables to resolve
         # target model and more suitable when models are dynamically updated in code.
         validate_assignment=True,
+        # Core schemas are built on first validation instead of at import.
+        defer_build=True,
     )
     variables: dict[str, Any] = Field(default={}, exclude=True)
     _camel_serialization: bool = False
@@ -133,8 +158,7 @@ class BaseModel(_BaseModel, metaclass=ModelMetaclass):
                 else:
                     # Automatic singularization
                     k_singular = k
-                    ann = str(fields[k].annotation)
-                    if "list[typing.Union[laktory.models" in ann:
+                    if _is_list_of_models(fields[k].annotation):
                         k_singular = engine.singular_noun(k) or k
 
                 if k_singular != k:
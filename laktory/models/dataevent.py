@@ -24,6 +24,66 @@ EXCLUDES = [
 ]
 
 
+def get_container_client(account_url: str = None, container_name: str = "landing"):
+    """
+    Build an Azure storage container client from an account URL (default
+    credentials) or from the `LAKEHOUSE_SA_CONN_STR` connection string.
+
+    Parameters
+    ----------
+    account_url:
+        URL of storage account
+    container_name:
+        Name of the storage container
+
+    Returns
+    -------
+    :
+        Container client
+    """
+    from azure.identity import DefaultAzureCredential
+    from azure.storage.blob import ContainerClient
+
+    if account_url:
+        # From account URL
+        # TODO: test
+        return ContainerClient(
+            account_url,
+            credential=DefaultAzureCredential(),
+            container_name=container_name,
+        )
+
+    elif settings.lakehouse_sa_conn_str is not None:
+        # From connection string
+        return ContainerClient.from_connection_string(
+            conn_str=settings.lakehouse_sa_conn_str,
+            container_name=container_name,
+        )
+
+    raise ValueError(
+        "Provide a valid container client, an account url or a connection string in LAKEHOUSE_SA_CONN_STR"
+    )
+
+
+def get_s3_resource():
+    """
+    Build an AWS S3 resource from the AWS settings.
+
+    Returns
+    -------
+    :
+        S3 resource
+    """
+    import boto3
+
+    return boto3.resource(
+        service_name="s3",
+        aws_access_key_id=settings.aws_access_key_id,
+        aws_secret_access_key=settings.aws_secret_access_key,
+        region_name=settings.aws_region,
+    )
+
+
 class DataEvent(BaseModel):
     """
     Data Event class defines both the context (metadata) describing a data
@@ -356,29 +416,9 @@ class DataEvent(BaseModel):
         """
         # Set container client
         if container_client is None:
-            from azure.identity import DefaultAzureCredential
-            from azure.storage.blob import ContainerClient
-
-            if account_url:
-                # From account URL
-                # TODO: test
-                container_client = ContainerClient(
-                    account_url,
-                    credential=DefaultAzureCredential(),
-                    container_name=container_name,
-                )
-
-            elif settings.lakehouse_sa_conn_str is not None:
-                # From connection string
-                container_client = ContainerClient.from_connection_string(
-                    conn_str=settings.lakehouse_sa_conn_str,
-                    container_name=container_name,
-                )
-
-            else:
-                raise ValueError(
-                    "Provide a valid container client, an account url or a connection string in LAKEHOUSE_SA_CONN_STR"
-                )
+            container_client = get_container_client(
+                account_url=account_url, container_name=container_name
+            )
 
         path = self.get_storage_filepath(suffix=suffix, fmt=fmt)
         blob = container_client.get_blob_client(path)
@@ -426,15 +466,8 @@ class DataEvent(BaseModel):
         skip_if_exists:
             If `True` and file already exists, writing is skipped.
         """
-        import boto3
-
         if s3_resource is None:
-            s3_resource = boto3.resource(
-                service_name="s3",
-                aws_access_key_id=settings.aws_access_key_id,
-                aws_secret_access_key=settings.aws_secret_access_key,
-                region_name=settings.aws_region,
-            )
+            s3_resource = get_s3_resource()
 
         bucket = s3_resource.Bucket(bucket_name)
 
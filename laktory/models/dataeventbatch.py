@@ -0,0 +1,331 @@
+import io
+import os
+import uuid
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Literal
+from typing import Union
+
+from pydantic import ConfigDict
+from pydantic import Field
+
+from laktory._logger import get_logger
+from laktory.models.basemodel import BaseModel
+from laktory.models.dataevent import EXCLUDES
+from laktory.models.dataevent import DataEvent
+from laktory.models.dataproducer import DataProducer
+from laktory.polars import PolarsDataFrame
+
+logger = get_logger(__name__)
+
+
+class DataEventBatch(BaseModel):
+    """
+    Columnar batch of data events sharing the same context (metadata). The
+    data of the events is stored as a Polars DataFrame and the `_name`,
+    `_producer_name` and `_created_at` metadata columns are computed with
+    vectorized expressions, avoiding the overhead of building one `DataEvent`
+    per row. Requires polars.
+
+    Each row written to a file has the same content as a single event
+    written with `DataEvent.to_path`.
+
+    Attributes
+    ----------
+    data:
+        Events data as a Polars DataFrame, a dictionary of columns or a list of
+        records.
+    description:
+        Data event description
+    event_root:
+        Root path for specific event. Default value: `{settings.workspace_landing_root}/events/my-event`
+    events_root:
+        Root path for all events. Default value: `{settings.workspace_landing_root}/events/`
+    name:
+        Data event name
+    producer:
+        Data event producer
+    tstamp_col:
+        Column storing event UTC timestamp
+    tstamp_in_path:
+        If `True`, includes timestamp if data event filepath
+
+    Examples
+    --------
+    ```py
+    from datetime import datetime
+
+    from laktory import models
+
+    batch = models.DataEventBatch(
+        name="stock_price",
+        producer={"name": "yahoo-finance"},
+        data={
+            "created_at": [datetime(2023, 8, 23), datetime(2023, 8, 24)],
+            "symbol": ["GOOGL", "GOOGL"],
+            "open": [130.25, 131.02],
+        },
+    )
+    print(batch.data.columns)
+    '''
+    ['created_at', 'symbol', 'open', '_name', '_producer_name', '_created_at']
+    '''
+
+    print(list(batch.partitions()))
+    '''
+    ['/Volumes/dev/sources/landing/events/yahoo-finance/stock_price/2023/08/23/', '/Volumes/dev/sources/landing/events/yahoo-finance/stock_price/2023/08/24/']
+    '''
+    ```
+    """
+
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+    data: Any = Field(None, exclude=True)
+    description: Union[str, None] = None
+    events_root_: Union[str, None] = Field(None, alias="events_root")
+    event_root_: Union[str, None] = Field(None, alias="event_root")
+    name: str
+    producer: DataProducer = None
+    tstamp_col: str = "created_at"
+    tstamp_in_path: bool = True
+
+    def model_post_init(self, __context):
+        super().model_post_init(__context)
+
+        import polars as pl
+
+        df = self.data
+        if df is None:
+            df = pl.DataFrame()
+        elif isinstance(df, list):
+            df = pl.DataFrame(df, infer_schema_length=None)
+        elif not isinstance(df, pl.DataFrame):
+            df = pl.DataFrame(df)
+
+        producer_name = None
+        if self.producer is not None:
+            producer_name = self.producer.name
+
+        self.data = df.with_columns(
+            pl.lit(self.name, dtype=pl.String).alias("_name"),
+            pl.lit(producer_name, dtype=pl.String).alias("_producer_name"),
+            self._get_created_at(df).alias("_created_at"),
+        )
+
+    def _get_created_at(self, df: PolarsDataFrame):
+        import polars as pl
+
+        now = datetime.now(timezone.utc)
+        utc = pl.Datetime("us", "UTC")
+
+        dtype = df.schema.get(self.tstamp_col)
+        if dtype is None:
+            s = pl.repeat(now, df.height, dtype=utc, eager=True)
+        elif dtype == pl.String:
+            s = df[self.tstamp_col]
+            try:
+                s = s.str.to_datetime(time_unit="us")
+            except pl.exceptions.PolarsError:
+                # Mixed offsets or formats are parsed value by value
+                s = s.map_elements(_parse_tstamp, return_dtype=utc)
+        else:
+            s = df[self.tstamp_col].cast(pl.Datetime("us", dtype.time_zone))
+
+        # Timestamps without time zone are assumed to be UTC
+        if s.dtype.time_zone is None:
+            s = s.dt.replace_time_zone("UTC")
+        else:
+            s = s.dt.convert_time_zone("UTC")
+
+        return s.fill_null(now)
+
+    # ----------------------------------------------------------------------- #
+    # Properties                                                              #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def header(self) -> DataEvent:
+        """Data event holding the context of the batch, without data"""
+        return DataEvent(
+            **self.model_dump(exclude={"data"}, by_alias=True, exclude_unset=True)
+        )
+
+    @property
+    def events_root(self) -> str:
+        """Root path for all events"""
+        return self.header.events_root
+
+    @property
+    def event_root(self) -> str:
+        """Root path for the event"""
+        return self.header.event_root
+
+    @property
+    def count(self) -> int:
+        """Number of events"""
+        return self.data.height
+
+    # ----------------------------------------------------------------------- #
+    # Paths                                                                   #
+    # ----------------------------------------------------------------------- #
+
+    def partitions(self) -> dict[str, PolarsDataFrame]:
+        """
+        Events data partitioned by landing directory
+        (`{event_root}/yyyy/mm/dd/` when `tstamp_in_path` is `True`).
+
+        Returns
+        -------
+        :
+            Events data for each directory path
+        """
+        import polars as pl
+
+        event_root = self.event_root
+        if not self.tstamp_in_path or self.data.height == 0:
+            return {event_root: self.data}
+
+        dirpath = pl.lit(event_root) + pl.col("_created_at").dt.strftime("%Y/%m/%d/")
+        dfs = self.data.with_columns(_dirpath=dirpath).partition_by(
+            "_dirpath", maintain_order=True, as_dict=True
+        )
+        return {k[0]: df.drop("_dirpath") for k, df in sorted(dfs.items())}
+
+    def get_landing_filepath(
+        self, df: PolarsDataFrame, fmt: str = "parquet", suffix: str = None
+    ) -> str:
+        """
+        Get file path on the landing mount/volume associated with a partition
+        of the batch, given a format `fmt` and a `suffix`. The file is named
+        after the earliest event of the partition.
+
+        Parameters
+        ----------
+        df:
+            Partition of the events data
+        fmt
+            File format
+        suffix
+            File path suffix
+
+        Returns
+        -------
+        str
+            Data file path
+        """
+        event = self.header
+        if df.height > 0:
+            event.data = {"_created_at": df["_created_at"].min()}
+        else:
+            event.tstamp_in_path = False
+        return event.get_landing_filepath(fmt=fmt, suffix=suffix)
+
+    # ----------------------------------------------------------------------- #
+    # Output                                                                  #
+    # ----------------------------------------------------------------------- #
+
+    def to_events(self) -> list[DataEvent]:
+        """
+        Convert batch to a list of data events.
+
+        Returns
+        -------
+        :
+            Data events
+        """
+        header = self.model_dump(exclude={"data"}, by_alias=True, exclude_unset=True)
+        return [
+            DataEvent(data=row, **header)
+            for row in self.data.drop("_name", "_producer_name").iter_rows(named=True)
+        ]
+
+    def serialize(
+        self, df: PolarsDataFrame = None, fmt: Literal["ndjson", "parquet"] = "parquet"
+    ) -> bytes:
+        """
+        Serialize events data with the context of the batch.
+
+        Parameters
+        ----------
+        df:
+            Events data. Default to the whole batch.
+        fmt:
+            File format
+
+        Returns
+        -------
+        :
+            File content
+        """
+        import polars as pl
+
+        if df is None:
+            df = self.data
+
+        if fmt == "ndjson":
+            # Same timestamps representation as DataEvent
+            df = df.with_columns(
+                pl.col(pl.Datetime(time_zone="*")).dt.to_string(
+                    "%Y-%m-%dT%H:%M:%S%.fZ"
+                ),
+                pl.col(pl.Datetime(time_zone=None)).dt.to_string(
+                    "%Y-%m-%dT%H:%M:%S%.f"
+                ),
+            )
+
+        header = self.header.model_dump(exclude=EXCLUDES + ["data"])
+        df = df.select(data=pl.struct(pl.all())).join(
+            pl.DataFrame([header]), how="cross"
+        )
+
+        buffer = io.BytesIO()
+        if fmt == "ndjson":
+            df.write_ndjson(buffer)
+        elif fmt == "parquet":
+            df.write_parquet(buffer)
+        else:
+            raise ValueError(f"Format '{fmt}' is not supported.")
+
+        return buffer.getvalue()
+
+    def to_path(
+        self,
+        suffix: str = None,
+        fmt: Literal["ndjson", "parquet"] = "parquet",
+    ) -> list[str]:
+        """
+        Write events to local file paths, one file per landing directory,
+        given a format `fmt` and a `suffix`.
+
+        Parameters
+        ----------
+        suffix:
+            File path suffix. Default to a random identifier.
+        fmt:
+            File format
+
+        Returns
+        -------
+        :
+            Written file paths
+        """
+        if suffix is None:
+            suffix = uuid.uuid4().hex[:8]
+
+        paths = []
+        for df in self.partitions().values():
+            path = self.get_landing_filepath(df, fmt=fmt, suffix=suffix)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            logger.info(f"Writing {df.height} {self.name} events to {path}")
+            with open(path, "wb") as fp:
+                fp.write(self.serialize(df, fmt=fmt))
+            paths += [path]
+
+        return paths
+
+
+def _parse_tstamp(value: str) -> datetime:
+    tstamp = datetime.fromisoformat(value)
+    if not tstamp.tzinfo:
+        tstamp = tstamp.replace(tzinfo=timezone.utc)
+    return tstamp
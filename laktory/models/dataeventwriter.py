@@ -0,0 +1,340 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Literal
+from typing import Union
+
+import pydantic_core
+from pydantic import Field
+
+from laktory._logger import get_logger
+from laktory._settings import settings
+from laktory.models.basemodel import BaseModel
+from laktory.models.dataevent import EXCLUDES
+from laktory.models.dataevent import DataEvent
+from laktory.models.dataevent import get_container_client
+from laktory.models.dataevent import get_s3_resource
+from laktory.models.dataeventbatch import DataEventBatch
+from laktory.polars import PolarsDataFrame
+
+logger = get_logger(__name__)
+
+
+class DataEventWriter(BaseModel):
+    """
+    Buffered writer of data events. Events are grouped by name, producer and
+    landing directory (`{event_root}/yyyy/mm/dd/`) and each group is written
+    as a single micro-batch file once it reaches `max_events` events or when
+    its oldest event has been buffered for more than `max_interval` seconds.
+    Serialization and uploads of the micro-batches are executed concurrently
+    in a thread pool.
+
+    Each line of a `ndjson` file (or each row of a `parquet` file) has the
+    same content as a single event written with `DataEvent.to_path`. Events
+    of a micro-batch share the description and producer of its first event.
+
+    Attributes
+    ----------
+    account_url:
+        URL of storage account (`AZURE_STORAGE_CONTAINER` destination)
+    bucket_name:
+        Name of the S3 bucket (`AWS_S3_BUCKET` destination)
+    container_client:
+        Authorized Azure container client (`AZURE_STORAGE_CONTAINER`
+        destination)
+    container_name:
+        Name of the storage container (`AZURE_STORAGE_CONTAINER` destination)
+    destination:
+        Type of storage the micro-batches are written to. `PATH` is used for
+        local file systems, Databricks volumes and mounts.
+    fmt:
+        Micro-batch file format. `parquet` requires polars.
+    max_events:
+        Number of buffered events of a group triggering a flush
+    max_interval:
+        Maximum time, in seconds, an event is buffered before being flushed
+    max_workers:
+        Maximum number of micro-batches serialized and uploaded concurrently
+    s3_resource:
+        Authorized S3 bucket resource (`AWS_S3_BUCKET` destination)
+
+    Examples
+    --------
+    ```py tag:skip-run
+    from laktory import models
+
+    with models.DataEventWriter(fmt="ndjson", max_events=1000) as writer:
+        for i in range(10000):
+            writer.write(
+                models.DataEvent(
+                    name="stock_price",
+                    producer={"name": "yahoo-finance"},
+                    data={"symbol": "AAPL", "open": 130.25 + i},
+                )
+            )
+    print(len(writer.filepaths))
+    # > 10
+    ```
+    """
+
+    account_url: Union[str, None] = None
+    bucket_name: Union[str, None] = None
+    container_client: Any = Field(None, exclude=True)
+    container_name: str = "landing"
+    destination: Literal["PATH", "AZURE_STORAGE_CONTAINER", "AWS_S3_BUCKET"] = "PATH"
+    fmt: Literal["ndjson", "parquet"] = "ndjson"
+    max_events: int = 1000
+    max_interval: float = 10.0
+    max_workers: int = 4
+    s3_resource: Any = Field(None, exclude=True)
+    _buffers: dict[tuple, list[DataEvent]] = None
+    _buffer_times: dict[tuple, float] = None
+    _client: Any = None
+    _executor: ThreadPoolExecutor = None
+    _filepaths: list[str] = None
+    _futures: list[Future] = None
+    _lock: Any = None
+    _stop: threading.Event = None
+    _timer: threading.Thread = None
+
+    def model_post_init(self, __context):
+        super().model_post_init(__context)
+        self._buffers = {}
+        self._buffer_times = {}
+        self._filepaths = []
+        self._futures = []
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+
+    # ----------------------------------------------------------------------- #
+    # Properties                                                              #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def filepaths(self) -> list[str]:
+        """Paths of the micro-batch files written so far"""
+        return list(self._filepaths)
+
+    @property
+    def buffered_count(self) -> int:
+        """Number of events waiting to be flushed"""
+        with self._lock:
+            return sum(len(v) for v in self._buffers.values())
+
+    # ----------------------------------------------------------------------- #
+    # Buffering                                                               #
+    # ----------------------------------------------------------------------- #
+
+    def _start(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        if self._timer is None:
+            self._stop.clear()
+            self._timer = threading.Thread(target=self._run_timer, daemon=True)
+            self._timer.start()
+
+    def _run_timer(self):
+        while not self._stop.wait(self.max_interval / 2):
+            now = time.monotonic()
+            with self._lock:
+                keys = [
+                    k
+                    for k, t in self._buffer_times.items()
+                    if now - t >= self.max_interval
+                ]
+                batches = [self._pop(k) for k in keys]
+            for batch in batches:
+                self._submit(batch)
+
+    def _pop(self, key) -> list[DataEvent]:
+        self._buffer_times.pop(key, None)
+        return self._buffers.pop(key, [])
+
+    def write(self, events: Union[DataEvent, list[DataEvent], DataEventBatch]) -> None:
+        """
+        Add events to the buffer. Full groups are submitted for writing
+        without waiting for the upload to complete. A batch of events is
+        submitted directly, one micro-batch file per landing directory.
+
+        Parameters
+        ----------
+        events:
+            Data event, list of data events or batch of data events
+        """
+        if isinstance(events, DataEventBatch):
+            # Columnar batches are already grouped and bypass the buffer
+            for df in events.partitions().values():
+                if df.height > 0:
+                    self._submit_func(self._write_event_batch, events, df)
+            return
+
+        if isinstance(events, DataEvent):
+            events = [events]
+
+        with self._lock:
+            self._start()
+            batches = []
+            for event in events:
+                producer = event.producer.name if event.producer else None
+                key = (event.dirpath, event.name, event.description, producer)
+                if key not in self._buffers:
+                    self._buffers[key] = []
+                    self._buffer_times[key] = time.monotonic()
+                self._buffers[key].append(event)
+                if len(self._buffers[key]) >= self.max_events:
+                    batches += [self._pop(key)]
+
+        for batch in batches:
+            self._submit(batch)
+
+    def flush(self, wait: bool = True) -> None:
+        """
+        Submit all buffered events for writing.
+
+        Parameters
+        ----------
+        wait:
+            If `True`, wait for all the submitted micro-batches to be written
+            and raise the first exception encountered.
+        """
+        with self._lock:
+            batches = [self._pop(k) for k in list(self._buffers)]
+        for batch in batches:
+            self._submit(batch)
+
+        if wait:
+            with self._lock:
+                futures = self._futures
+                self._futures = []
+            for future in futures:
+                future.result()
+
+    def close(self) -> None:
+        """Flush all buffered events and release the threads."""
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.join()
+            self._timer = None
+        try:
+            self.flush(wait=True)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ----------------------------------------------------------------------- #
+    # Writing                                                                 #
+    # ----------------------------------------------------------------------- #
+
+    def _submit(self, events: list[DataEvent]) -> None:
+        if not events:
+            return
+        self._submit_func(self._write_batch, events)
+
+    def _submit_func(self, func, *args) -> None:
+        with self._lock:
+            self._start()
+            # Keep failed futures until their exception is raised by `flush`
+            self._futures = [
+                f for f in self._futures if not f.done() or f.exception() is not None
+            ]
+            self._futures += [self._executor.submit(func, *args)]
+
+    def serialize(self, events: list[DataEvent]) -> bytes:
+        """
+        Serialize a micro-batch of events. Metadata is serialized once for
+        the whole batch.
+
+        Parameters
+        ----------
+        events:
+            Data events
+
+        Returns
+        -------
+        :
+            File content
+        """
+        header = events[0].model_dump(exclude=EXCLUDES + ["data"])
+
+        if self.fmt == "parquet":
+            import io
+
+            import polars as pl
+
+            df = pl.DataFrame(
+                [{"data": e.data, **header} for e in events], infer_schema_length=None
+            )
+            buffer = io.BytesIO()
+            df.write_parquet(buffer)
+            return buffer.getvalue()
+
+        # Data is inserted in front of the serialized metadata to preserve
+        # DataEvent fields order
+        header_json = pydantic_core.to_json(header)[1:]
+        return b"".join(
+            b'{"data":' + pydantic_core.to_json(e.data) + b"," + header_json + b"\n"
+            for e in events
+        )
+
+    def _get_client(self):
+        with self._lock:
+            if self._client is not None:
+                return self._client
+
+            if self.destination == "AZURE_STORAGE_CONTAINER":
+                self._client = self.container_client
+                if self._client is None:
+                    self._client = get_container_client(
+                        account_url=self.account_url,
+                        container_name=self.container_name,
+                    )
+
+            elif self.destination == "AWS_S3_BUCKET":
+                s3_resource = self.s3_resource
+                if s3_resource is None:
+                    s3_resource = get_s3_resource()
+                self._client = s3_resource.Bucket(self.bucket_name)
+
+            return self._client
+
+    def _write_batch(self, events: list[DataEvent]) -> str:
+        event = events[0]
+        path = event.get_landing_filepath(fmt=self.fmt, suffix=uuid.uuid4().hex[:8])
+        return self._upload(path, self.serialize(events), len(events), event.name)
+
+    def _write_event_batch(self, batch: DataEventBatch, df: PolarsDataFrame) -> str:
+        path = batch.get_landing_filepath(df, fmt=self.fmt, suffix=uuid.uuid4().hex[:8])
+        content = batch.serialize(df, fmt=self.fmt)
+        return self._upload(path, content, df.height, batch.name)
+
+    def _upload(self, path: str, content: bytes, count: int, name: str) -> str:
+        if self.destination == "PATH":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as fp:
+                fp.write(content)
+
+        elif self.destination == "AZURE_STORAGE_CONTAINER":
+            path = path.replace(settings.workspace_landing_root, "/")
+            blob = self._get_client().get_blob_client(path)
+            blob.upload_blob(content, overwrite=True)
+
+        elif self.destination == "AWS_S3_BUCKET":
+            path = path.replace(settings.workspace_landing_root, "/")[1:]
+            self._get_client().put_object(Key=path, Body=content)
+
+        logger.info(f"Wrote {count} {name} events to {path}")
+        with self._lock:
+            self._filepaths += [path]
+
+        return path
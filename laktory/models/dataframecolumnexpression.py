@@ -6,6 +6,7 @@ from pydantic import model_validator
 
 from laktory._logger import get_logger
 from laktory._settings import settings
+from laktory._units import validate_units_expr
 from laktory.models.basemodel import BaseModel
 from laktory.typing import AnyDataFrameColumn
 
@@ -65,6 +66,14 @@ class DataFrameColumnExpression(BaseModel):
 
         return self
 
+    @model_validator(mode="after")
+    def validate_units(self) -> Any:
+        # Units conversion errors are raised at validation instead of
+        # execution
+        if self.type == "DF":
+            validate_units_expr(self.value)
+        return self
+
     # ----------------------------------------------------------------------- #
     # Properties                                                              #
     # ----------------------------------------------------------------------- #
@@ -13,12 +13,19 @@ class DataQualityCheck(BaseModel):
     Attributes
     ----------
     fails_count:
-        Number of rows not meeting the expectation.
+        Number of rows not meeting the expectation. Estimated from the
+        sample when `sample_rows_count` is set.
     rows_count:
         Total number of rows in dataset.
     status:
         Result of comparison, considering the expectation criteria and
         tolerances.
+    sample_rows_count:
+        Number of sampled rows, if the check was estimated from a sample.
+    sample_fails_count:
+        Number of sampled rows not meeting the expectation.
+    failure_rate_interval:
+        Confidence interval of the failure rate estimated from the sample.
 
     Examples
     --------
@@ -31,7 +38,7 @@ class DataQualityCheck(BaseModel):
         status="FAIL",
     )
     print(check)
-    # > variables={} fails_count=2 rows_count=10 status='FAIL'
+    # > variables={} fails_count=2 rows_count=10 status='FAIL' sample_rows_count=None sample_fails_count=None failure_rate_interval=None
 
     check = models.DataQualityCheck(
         rows_count=10,
@@ -39,13 +46,16 @@ class DataQualityCheck(BaseModel):
         status="PASS",
     )
     print(check)
-    # > variables={} fails_count=2 rows_count=10 status='PASS'
+    # > variables={} fails_count=2 rows_count=10 status='PASS' sample_rows_count=None sample_fails_count=None failure_rate_interval=None
     ```
     """
 
     fails_count: int = None
     rows_count: int = None
     status: Literal["PASS", "FAIL"]
+    sample_rows_count: int = None
+    sample_fails_count: int = None
+    failure_rate_interval: tuple[float, float] = None
 
     # ----------------------------------------------------------------------- #
     # Properties                                                              #
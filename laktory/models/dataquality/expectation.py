@@ -1,4 +1,7 @@
+import math
+import re
 import warnings
+from statistics import NormalDist
 from typing import Any
 from typing import Literal
 from typing import Union
@@ -15,6 +18,8 @@ from laktory.typing import AnyDataFrameColumn
 
 logger = get_logger(__name__)
 
+APPROX_RELATIVE_ERROR_MAX = 0.39
+
 
 class ExpectationTolerance(BaseModel):
     """
@@ -43,6 +48,92 @@ class ExpectationTolerance(BaseModel):
         return self
 
 
+class ExpectationSample(BaseModel):
+    """
+    Sampling specifications for estimating the failure rate of a "ROW" type
+    expectation with a relative tolerance. The failure rate is estimated from
+    a sample of rows with a confidence interval (Wilson score). The status is
+    decided from the estimate when the interval, widened by `margin`, is
+    entirely below or above the tolerance. Otherwise, the expectation is
+    checked on the full DataFrame.
+
+    Attributes
+    ----------
+    fraction:
+        Fraction of rows to sample, between 0 and 1.
+    rows:
+        Approximate number of rows to sample. Converted to a fraction of the
+        DataFrame rows count.
+    seed:
+        Seed for sampling
+    confidence:
+        Confidence level of the failure rate interval
+    margin:
+        Additional margin around the confidence interval within which the
+        expectation is checked on the full DataFrame.
+    """
+
+    fraction: float = None
+    rows: int = None
+    seed: int = None
+    confidence: float = 0.95
+    margin: float = 0.0
+
+    @model_validator(mode="after")
+    def validate_size(self) -> Any:
+        if (self.fraction is None) == (self.rows is None):
+            raise ValueError("Exactly one of `fraction` or `rows` must be set.")
+        if self.fraction is not None and not 0 < self.fraction <= 1:
+            raise ValueError("`fraction` must be between 0 and 1.")
+        if self.rows is not None and self.rows <= 0:
+            raise ValueError("`rows` must be positive.")
+        if not 0 < self.confidence < 1:
+            raise ValueError("`confidence` must be between 0 and 1.")
+        return self
+
+    def get_fraction(self, rows_count: int) -> float:
+        """
+        Fraction of rows to sample
+
+        Parameters
+        ----------
+        rows_count:
+            DataFrame rows count
+
+        Returns
+        -------
+        :
+            Fraction of rows
+        """
+        if self.fraction is not None:
+            return self.fraction
+        return min(1.0, self.rows / max(rows_count, 1))
+
+    def get_interval(self, fails_count: int, rows_count: int) -> tuple[float, float]:
+        """
+        Failure rate confidence interval (Wilson score)
+
+        Parameters
+        ----------
+        fails_count:
+            Number of failed rows in the sample
+        rows_count:
+            Number of rows in the sample
+
+        Returns
+        -------
+        :
+            Lower and upper bounds of the failure rate
+        """
+        z = NormalDist().inv_cdf(0.5 + self.confidence / 2)
+        n = rows_count
+        p = fails_count / n
+        d = 1 + z**2 / n
+        center = (p + z**2 / (2 * n)) / d
+        half = z * math.sqrt(p * (1 - p) / n + z**2 / (4 * n**2)) / d
+        return max(0.0, center - half), min(1.0, center + half)
+
+
 class DataQualityExpectation(BaseModel):
     """
     Data Quality Expectation for a given DataFrame expressed as a row-specific
@@ -71,6 +162,18 @@ class DataQualityExpectation(BaseModel):
     tolerance:
         Tolerance for non-matching rows before resulting in failure. Only
         available for "ROW" type expectation.
+    approx_relative_error:
+        If set, distinct counts and percentiles of "AGGREGATE" type
+        expectations are replaced with their approximate counterparts
+        (HyperLogLog++ sketch and approximate percentiles) with this maximum relative
+        error. With Spark, `COUNT(DISTINCT x)`, `percentile` and `median`
+        (and their `F.` equivalents) are approximated. With Polars, only
+        `n_unique()` is approximated, with a fixed error (a warning is
+        issued). Must be at most 0.39.
+    sample:
+        If set, the failure rate of a "ROW" type expectation is first
+        estimated from a sample of rows. The full DataFrame is only checked
+        when the estimate is too close to the relative tolerance to decide.
 
     Examples
     --------
@@ -85,7 +188,7 @@ class DataQualityExpectation(BaseModel):
     )
     print(dqe)
     '''
-    variables={} action='WARN' type='ROW' name='price higher than 10' expr=DataFrameColumnExpression(variables={}, value='close > 127', type='SQL') tolerance=ExpectationTolerance(variables={}, abs=None, rel=0.05)
+    variables={} action='WARN' type='ROW' name='price higher than 10' expr=DataFrameColumnExpression(variables={}, value='close > 127', type='SQL') tolerance=ExpectationTolerance(variables={}, abs=None, rel=0.05) approx_relative_error=None sample=None
     '''
 
     dqe = models.DataQualityExpectation(
@@ -95,7 +198,7 @@ class DataQualityExpectation(BaseModel):
     )
     print(dqe)
     '''
-    variables={} action='WARN' type='AGGREGATE' name='rows count' expr=DataFrameColumnExpression(variables={}, value='COUNT(*) > 50', type='SQL') tolerance=ExpectationTolerance(variables={}, abs=0, rel=None)
+    variables={} action='WARN' type='AGGREGATE' name='rows count' expr=DataFrameColumnExpression(variables={}, value='COUNT(*) > 50', type='SQL') tolerance=ExpectationTolerance(variables={}, abs=0, rel=None) approx_relative_error=None sample=None
     '''
     ```
 
@@ -110,6 +213,8 @@ class DataQualityExpectation(BaseModel):
     name: str
     expr: Union[str, DataFrameColumnExpression] = None
     tolerance: ExpectationTolerance = ExpectationTolerance(abs=0)
+    approx_relative_error: float = None
+    sample: ExpectationSample = None
     _dataframe_backend: Literal["SPARK", "POLARS"] = None
     _check: DataQualityCheck = None
 
@@ -127,6 +232,31 @@ class DataQualityExpectation(BaseModel):
             )
         return self
 
+    @model_validator(mode="after")
+    def validate_approx(self) -> Any:
+        if self.approx_relative_error is None:
+            return self
+        if self.type != "AGGREGATE":
+            raise ValueError(
+                "`approx_relative_error` is only supported for 'AGGREGATE' type."
+            )
+        # Spark HyperLogLog++ sketch requires a relative error of at most 39%
+        if not 0 < self.approx_relative_error <= APPROX_RELATIVE_ERROR_MAX:
+            raise ValueError(
+                f"`approx_relative_error` must be greater than 0 and at most {APPROX_RELATIVE_ERROR_MAX}."
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_sample(self) -> Any:
+        if self.sample is None:
+            return self
+        if self.type != "ROW" or self.tolerance.rel is None:
+            raise ValueError(
+                "`sample` is only supported for 'ROW' type with a relative tolerance."
+            )
+        return self
+
     @model_validator(mode="after")
     def warn_invalid_type(self):
         msg = self.type_warning_msg
@@ -150,6 +280,33 @@ class DataQualityExpectation(BaseModel):
         """Expression representing all rows not meeting the expectation."""
         return ~self.expr.eval(dataframe_backend=self._dataframe_backend)
 
+    @property
+    def agg_expr(self) -> Union[AnyDataFrameColumn, None]:
+        """
+        Aggregation expression of an "AGGREGATE" expectation, approximated
+        when `approx_relative_error` is set.
+        """
+        if self.type != "AGGREGATE":
+            return None
+        expr = self.expr
+        if self.approx_relative_error is not None:
+            if self._dataframe_backend == "POLARS":
+                warnings.warn(
+                    f"`approx_relative_error` of expectation '{self.name}' is not "
+                    "configurable with Polars. `n_unique()` is approximated with "
+                    "a fixed error."
+                )
+            expr = DataFrameColumnExpression(
+                value=_approximate(
+                    expr.value,
+                    expr.type,
+                    self._dataframe_backend,
+                    self.approx_relative_error,
+                ),
+                type=expr.type,
+            )
+        return expr.eval(dataframe_backend=self._dataframe_backend)
+
     @property
     def keep_filter(self) -> Union[AnyDataFrameColumn, None]:
         """
@@ -228,6 +385,8 @@ class DataQualityExpectation(BaseModel):
         msg = f"expr: {self.expr.value} | status: {self.check.status}"
         if self.type == "ROW" and self.check.fails_count:
             msg += f" | fails count: {self.check.fails_count} / {self.check.rows_count} ({100 * self.check.failure_rate:5.2f} %)"
+            if self.check.sample_rows_count is not None:
+                msg += f" estimated from {self.check.sample_rows_count} rows"
         return msg
 
     # ----------------------------------------------------------------------- #
@@ -261,101 +420,75 @@ class DataQualityExpectation(BaseModel):
         output: DataQualityCheck
             Check result.
         """
+        return run_checks([self], df, raise_or_warn=raise_or_warn, node=node)[0]
 
-        logger.info(
-            f"Checking expectation '{self.name}' | {self.expr.value} (type: {self.type})"
-        )
-
-        # Assign DataFrame type
-        dtype = str(type(df)).lower()
-        if "spark" in dtype:
-            self._dataframe_backend = "SPARK"
-        elif "polars" in dtype:
-            self._dataframe_backend = "POLARS"
-        else:
-            raise ValueError(f"DataFrame type '{dtype}' not supported")
-
-        # Run Check
-        self._check = self._check_df(df)
-
-        if raise_or_warn:
-            self.raise_or_warn(node)
-
-        return self._check
+    def _check_rows(self, df, rows_count):
+        try:
+            df_fail = df.filter(self.fail_filter)
+        except Exception as e:
+            if "Rewrite the query to avoid window functions" in getattr(e, "desc", ""):
+                e.desc += f"\n{self.type_warning_msg}"
+            raise e
 
-    def _check_df(self, df):
         if self._dataframe_backend == "SPARK":
-            rows_count = df.count()
+            fails_count = df_fail.count()
         elif self._dataframe_backend == "POLARS":
             import polars as pl
 
-            rows_count = df.select(pl.len()).collect().item()
+            fails_count = df_fail.lazy().select(pl.len()).collect().item()
 
-        if rows_count == 0:
-            _check = DataQualityCheck(
-                fails_count=0,
-                status="PASS",
-                rows_count=0,
-            )
-            return _check
+        status = "PASS"
+        if self.tolerance.abs is not None:
+            if fails_count > self.tolerance.abs:
+                status = "FAIL"
+        elif self.tolerance.rel is not None:
+            if rows_count > 0 and fails_count / rows_count > self.tolerance.rel:
+                status = "FAIL"
 
-        if self.type == "ROW":
-            try:
-                df_fail = df.filter(self.fail_filter)
-            except Exception as e:
-                if "Rewrite the query to avoid window functions" in getattr(
-                    e, "desc", ""
-                ):
-                    e.desc += f"\n{self.type_warning_msg}"
-                raise e
+        _check = DataQualityCheck(
+            fails_count=fails_count,
+            status=status,
+            rows_count=rows_count,
+        )
+        failure_str = f"({100 * _check.failure_rate:5.2f}%)"
+        if status == "PASS":
+            logger.info(f"Checking expectation '{self.name}' | status : {status}")
+        else:
+            logger.info(
+                f"Checking expectation '{self.name}' | status : {status} - failed rows : {fails_count} {failure_str}"
+            )
+        return _check
 
-            if self._dataframe_backend == "SPARK":
-                fails_count = df_fail.count()
-            elif self._dataframe_backend == "POLARS":
-                import polars as pl
+    def _estimate_check(self, sample_rows_count, sample_fails_count, rows_count):
+        if sample_rows_count == 0:
+            return None
 
-                fails_count = df_fail.select(pl.len()).collect().item()
+        lower, upper = self.sample.get_interval(sample_fails_count, sample_rows_count)
+        rate = sample_fails_count / sample_rows_count
+        rate_str = f"{100 * rate:5.2f}% [{100 * lower:5.2f}%, {100 * upper:5.2f}%]"
 
+        tol = self.tolerance.rel
+        if upper + self.sample.margin < tol:
             status = "PASS"
-            if self.tolerance.abs is not None:
-                if fails_count > self.tolerance.abs:
-                    status = "FAIL"
-            elif self.tolerance.rel is not None:
-                if rows_count > 0 and fails_count / rows_count > self.tolerance.rel:
-                    status = "FAIL"
-
-            _check = DataQualityCheck(
-                fails_count=fails_count,
-                status=status,
-                rows_count=rows_count,
+        elif lower - self.sample.margin > tol:
+            status = "FAIL"
+        else:
+            logger.info(
+                f"Checking expectation '{self.name}' | estimated failure rate : {rate_str} too close to tolerance, checking all rows"
             )
-            failure_str = f"({100 * _check.failure_rate:5.2f}%)"
-            if status == "PASS":
-                logger.info(f"Checking expectation '{self.name}' | status : {status}")
-            else:
-                logger.info(
-                    f"Checking expectation '{self.name}' | status : {status} - failed rows : {fails_count} {failure_str}"
-                )
-            return _check
-
-        if self.type == "AGGREGATE":
-            import pyspark.sql.functions as F  # noqa: F401
-
-            if self.expr.type == "SQL":
-                _df = df.select(self.expr.eval()).toPandas()
-            else:
-                _df = df.agg(self.expr.eval()).toPandas()
-
-            status = _df.iloc[0].values[0]
-
-            status = "PASS" if status else "FAIL"
+            return None
 
-            _check = DataQualityCheck(
-                status=status,
-                rows_count=rows_count,
-            )
-            logger.info(f"Checking expectation '{self.name}' | status : {status}")
-            return _check
+        logger.info(
+            f"Checking expectation '{self.name}' | status : {status} - estimated failure rate : {rate_str} from {sample_rows_count} rows"
+        )
+        return DataQualityCheck(
+            fails_count=round(rate * rows_count),
+            status=status,
+            rows_count=rows_count,
+            sample_rows_count=sample_rows_count,
+            sample_fails_count=sample_fails_count,
+            failure_rate_interval=(lower, upper),
+        )
 
     def raise_or_warn(self, node=None) -> None:
         """
@@ -377,3 +510,280 @@ class DataQualityExpectation(BaseModel):
         else:
             # actions: WARN, DROP, QUARANTINE
             warnings.warn(msg)
+
+
+# --------------------------------------------------------------------------- #
+# Checks                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+def run_checks(
+    expectations: list[DataQualityExpectation],
+    df: AnyDataFrame,
+    raise_or_warn: bool = False,
+    node=None,
+) -> list[DataQualityCheck]:
+    """
+    Check if expectations are met and save results. Rows count and all
+    "AGGREGATE" expectations are computed in a single aggregation of `df`.
+    "ROW" expectations are then checked individually.
+
+    Parameters
+    ----------
+    expectations:
+        Expectations to check
+    df:
+        Input DataFrame for checking the expectations.
+    raise_or_warn:
+        Raise exception or issue warning if an expectation is not met.
+    node:
+        Pipeline Node
+
+    Returns
+    -------
+    output: list[DataQualityCheck]
+        Checks results.
+    """
+
+    # Assign DataFrame type
+    dtype = str(type(df)).lower()
+    if "spark" in dtype:
+        backend = "SPARK"
+    elif "polars" in dtype:
+        backend = "POLARS"
+    else:
+        raise ValueError(f"DataFrame type '{dtype}' not supported")
+
+    for e in expectations:
+        e._dataframe_backend = backend
+
+    # Rows count and aggregates
+    aggs = [e for e in expectations if e.type == "AGGREGATE"]
+    exprs = [e.agg_expr for e in aggs]
+    if backend == "SPARK":
+        import pyspark.sql.functions as F
+
+        row = df.agg(
+            F.count(F.lit(1)).alias("__rows_count"),
+            *[expr.alias(f"__agg_{i}") for i, expr in enumerate(exprs)],
+        ).collect()[0]
+        rows_count = row[0]
+        values = list(row[1:])
+    else:
+        import polars as pl
+
+        row = (
+            df.lazy()
+            .select(
+                pl.len().alias("__rows_count"),
+                *[expr.alias(f"__agg_{i}") for i, expr in enumerate(exprs)],
+            )
+            .collect()
+            .row(0)
+        )
+        rows_count = row[0]
+        values = list(row[1:])
+    agg_values = {id(e): v for e, v in zip(aggs, values)}
+
+    # Sampled estimates
+    estimates = _estimate_checks(
+        [e for e in expectations if e.type == "ROW" and e.sample],
+        df,
+        rows_count,
+    )
+
+    for e in expectations:
+        logger.info(
+            f"Checking expectation '{e.name}' | {e.expr.value} (type: {e.type})"
+        )
+
+        if rows_count == 0:
+            e._check = DataQualityCheck(
+                fails_count=0,
+                status="PASS",
+                rows_count=0,
+            )
+
+        elif e.type == "ROW":
+            e._check = estimates.get(id(e), None)
+            if e._check is None:
+                e._check = e._check_rows(df, rows_count)
+
+        else:
+            status = "PASS" if agg_values[id(e)] else "FAIL"
+            e._check = DataQualityCheck(
+                status=status,
+                rows_count=rows_count,
+            )
+            logger.info(f"Checking expectation '{e.name}' | status : {status}")
+
+        if raise_or_warn:
+            e.raise_or_warn(node)
+
+    return [e.check for e in expectations]
+
+
+def _estimate_checks(expectations, df, rows_count) -> dict:
+    """
+    Estimate checks of sampled expectations. Expectations sharing the same
+    sample are estimated with a single aggregation. Checks that can't be
+    decided from the sample are omitted.
+    """
+    checks = {}
+    if rows_count == 0:
+        return checks
+
+    samples = {}
+    for e in expectations:
+        key = (e.sample.get_fraction(rows_count), e.sample.seed)
+        samples[key] = samples.get(key, []) + [e]
+
+    for (fraction, seed), _expectations in samples.items():
+        # Full check is cheaper than sampling all rows
+        if fraction >= 1:
+            continue
+
+        if _expectations[0]._dataframe_backend == "SPARK":
+            import pyspark.sql.functions as F
+
+            row = (
+                df.sample(fraction=fraction, seed=seed)
+                .agg(
+                    F.count(F.lit(1)).alias("__rows_count"),
+                    *[
+                        F.sum(e.fail_filter.cast("int")).alias(f"__fails_{i}")
+                        for i, e in enumerate(_expectations)
+                    ],
+                )
+                .collect()[0]
+            )
+        else:
+            import polars as pl
+
+            row = (
+                df.lazy()
+                .laktory.sample(fraction=fraction, seed=seed)
+                .select(
+                    pl.len().alias("__rows_count"),
+                    *[
+                        e.fail_filter.sum().alias(f"__fails_{i}")
+                        for i, e in enumerate(_expectations)
+                    ],
+                )
+                .collect()
+                .row(0)
+            )
+
+        for e, fails_count in zip(_expectations, row[1:]):
+            check = e._estimate_check(row[0], fails_count or 0, rows_count)
+            if check is not None:
+                checks[id(e)] = check
+
+    return checks
+
+
+# --------------------------------------------------------------------------- #
+# Approximations                                                              #
+# --------------------------------------------------------------------------- #
+
+
+def _split_args(args: str) -> list[str]:
+    """Split function arguments on top-level commas"""
+    out = [""]
+    depth = 0
+    for c in args:
+        if c == "," and depth == 0:
+            out += [""]
+            continue
+        if c in "([":
+            depth += 1
+        elif c in ")]":
+            depth -= 1
+        out[-1] += c
+    return [a.strip() for a in out]
+
+
+def _replace_calls(value: str, pattern: str, build) -> str:
+    """
+    Replace function calls matching `pattern` (up to the opening parenthesis)
+    with the output of `build(args)`. Calls are left unchanged when `build`
+    returns `None`.
+    """
+    out = ""
+    pos = 0
+    for m in re.finditer(pattern, value, flags=re.IGNORECASE):
+        if m.start() < pos:
+            continue
+
+        # Find closing parenthesis
+        depth = 1
+        i = m.end()
+        while i < len(value) and depth > 0:
+            if value[i] == "(":
+                depth += 1
+            elif value[i] == ")":
+                depth -= 1
+            i += 1
+        if depth > 0:
+            break
+
+        new = build(_split_args(value[m.end() : i - 1]))
+        if new is None:
+            continue
+        out += value[pos : m.start()] + new
+        pos = i
+
+    return out + value[pos:]
+
+
+def _approximate(value: str, expr_type: str, backend: str, error: float) -> str:
+    """
+    Replace exact distinct counts and percentiles of an aggregation expression
+    with their approximate counterparts.
+    """
+    accuracy = int(round(1.0 / error))
+
+    if backend == "POLARS":
+        if expr_type == "DF":
+            value = re.sub(r"\.n_unique\(\)", ".approx_n_unique()", value)
+        return value
+
+    if expr_type == "SQL":
+
+        def _count(args):
+            if len(args) != 1 or not args[0].lower().startswith("distinct "):
+                return None
+            return f"approx_count_distinct({args[0][9:].strip()}, {error})"
+
+        def _percentile(args):
+            if len(args) != 2:
+                return None
+            return f"percentile_approx({args[0]}, {args[1]}, {accuracy})"
+
+        def _median(args):
+            return f"percentile_approx({args[0]}, 0.5, {accuracy})"
+
+        value = _replace_calls(value, r"(?<![\w.])count\s*\(", _count)
+        value = _replace_calls(value, r"(?<![\w.])percentile\s*\(", _percentile)
+        value = _replace_calls(value, r"(?<![\w.])median\s*\(", _median)
+
+    else:
+
+        def _count(args):
+            if len(args) != 1:
+                return None
+            return f"F.approx_count_distinct({args[0]}, rsd={error})"
+
+        def _percentile(args):
+            if len(args) != 2:
+                return None
+            return f"F.percentile_approx({args[0]}, {args[1]}, {accuracy})"
+
+        def _median(args):
+            return f"F.percentile_approx({args[0]}, 0.5, {accuracy})"
+
+        value = _replace_calls(value, r"\bF\.count_?distinct\s*\(", _count)
+        value = _replace_calls(value, r"\bF\.percentile\s*\(", _percentile)
+        value = _replace_calls(value, r"\bF\.median\s*\(", _median)
+
+    return value
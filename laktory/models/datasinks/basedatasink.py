@@ -1,6 +1,4 @@
 import hashlib
-import os
-import shutil
 import uuid
 from pathlib import Path
 from typing import Any
@@ -16,6 +14,7 @@ from laktory.polars import PolarsLazyFrame
 from laktory.polars import is_polars_dataframe
 from laktory.spark import SparkDataFrame
 from laktory.spark import is_spark_dataframe
+from laktory.storage import purge_paths
 from laktory.typing import AnyDataFrame
 
 logger = get_logger(__name__)
@@ -707,47 +706,7 @@ class BaseDataSink(BaseModel, PipelineChild):
 
     def _purge_checkpoint(self, spark=None):
         if self._checkpoint_location:
-            if os.path.exists(self._checkpoint_location):
-                logger.info(
-                    f"Deleting checkpoint at {self._checkpoint_location}",
-                )
-                shutil.rmtree(self._checkpoint_location)
-
-            if spark is None:
-                return
-
-            try:
-                from pyspark.dbutils import DBUtils
-            except ModuleNotFoundError:
-                return
-
-            dbutils = DBUtils(spark)
-
-            _path = self._checkpoint_location.as_posix()
-            try:
-                dbutils.fs.ls(
-                    _path
-                )  # TODO: Figure out why this does not work with databricks connect
-                logger.info(
-                    f"Deleting checkpoint at dbfs {_path}",
-                )
-                dbutils.fs.rm(_path, True)
-
-            except Exception as e:
-                if "java.io.FileNotFoundException" in str(e):
-                    pass
-                elif "databricks.sdk.errors.platform.ResourceDoesNotExist" in str(
-                    type(e)
-                ):
-                    pass
-                elif "databricks.sdk.errors.platform.InvalidParameterValue" in str(
-                    type(e)
-                ):
-                    # TODO: Figure out why this is happening. It seems that the databricks SDK
-                    #       modify the path before sending to REST API.
-                    logger.warn(f"dbutils could not delete checkpoint {_path}: {e}")
-                else:
-                    raise e
+            purge_paths([self._checkpoint_location], spark=spark)
 
     def purge(self):
         """
@@ -1,5 +1,3 @@
-import os
-import shutil
 from pathlib import Path
 from typing import Any
 from typing import Literal
@@ -14,6 +12,7 @@ from laktory.models.datasources.filedatasource import FileDataSource
 from laktory.polars import PolarsDataFrame
 from laktory.polars import PolarsLazyFrame
 from laktory.spark import SparkDataFrame
+from laktory.storage import get_storage
 
 logger = get_logger(__name__)
 
@@ -197,6 +196,10 @@ class FileDataSink(BaseDataSink):
         if isinstance(df, PolarsLazyFrame):
             df = df.collect()
 
+        # Local parent directory might not exist yet
+        if "://" not in self.path and self.format.lower() != "delta":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
         if self.format.lower() == "csv":
             df.write_csv(self.path, **self.write_options)
         elif self.format.lower() == "delta":
@@ -222,14 +225,7 @@ class FileDataSink(BaseDataSink):
         # instead of dropping it.
 
         # Remove Data
-        if os.path.exists(self.path):
-            is_dir = os.path.isdir(self.path)
-            if is_dir:
-                logger.info(f"Deleting data dir {self.path}")
-                shutil.rmtree(self.path)
-            else:
-                logger.info(f"Deleting data file {self.path}")
-                os.remove(self.path)
+        get_storage(self.path).rm(self.path)
 
         # TODO: Add support for Databricks dbfs / workspace / Volume?
 
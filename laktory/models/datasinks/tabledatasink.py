@@ -1,5 +1,3 @@
-import os
-import shutil
 from typing import Literal
 from typing import Union
 
@@ -10,6 +8,7 @@ from laktory.models.datasinks.basedatasink import BaseDataSink
 from laktory.models.datasources.tabledatasource import TableDataSource
 from laktory.models.transformers.basechainnode import BaseChainNodeSQLExpr
 from laktory.spark import SparkDataFrame
+from laktory.storage import get_storage
 
 logger = get_logger(__name__)
 
@@ -256,14 +255,8 @@ class TableDataSink(BaseDataSink):
             spark.sql(f"DROP {self.table_type} IF EXISTS {self.full_name}")
 
             path = self.write_options.get("path", None)
-            if path and os.path.exists(path):
-                is_dir = os.path.isdir(path)
-                if is_dir:
-                    logger.info(f"Deleting data dir {path}")
-                    shutil.rmtree(path)
-                else:
-                    logger.info(f"Deleting data file {path}")
-                    os.remove(path)
+            if path:
+                get_storage(path).rm(path)
         else:
             raise NotImplementedError(
                 f"Warehouse '{self.warehouse}' is not yet supported."
@@ -1,4 +1,8 @@
+import json
+import re
+from pathlib import Path
 from typing import Any
+from typing import Callable
 from typing import Literal
 from typing import Union
 
@@ -12,12 +16,27 @@ from laktory.polars import PolarsDataFrame
 from laktory.polars import is_polars_dataframe
 from laktory.spark import SparkDataFrame
 from laktory.spark import is_spark_dataframe
+from laktory.storage import get_storage
 from laktory.typing import AnyDataFrame
 
 logger = get_logger(__name__)
 
+CHANGE_COLUMNS = ["_change_type", "_commit_version", "_commit_timestamp"]
+
 
 class DataFrameSample(BaseModel):
+    """
+    Definition of a DataFrame sample. With Polars, rows are selected from
+    their hashed index so that LazyFrames stay lazy.
+
+    Attributes
+    ----------
+    fraction:
+        Fraction of rows to keep, between 0 and 1.
+    seed:
+        Seed for sampling. If `None`, a random seed is used.
+    """
+
     fraction: float
     seed: Union[int, None] = None
 
@@ -44,6 +63,37 @@ class Watermark(BaseModel):
     threshold: str
 
 
+class IncrementalRead(BaseModel):
+    """
+    Definition of a batch incremental read of a Delta table. The last Delta
+    version processed by the consumer is stored in a checkpoint file and only
+    the changes committed since then are read from the table change data
+    feed. The first read returns the full table. The checkpoint is only
+    updated once the consumer pipeline node has been successfully executed.
+
+    Attributes
+    ----------
+    change_types:
+        Change types to keep from the change data feed.
+    checkpoint_location:
+        Path of the file storing the last processed version. Default to
+        `{node root path}/checkpoints/incremental/{source id}.json`
+    keep_change_columns:
+        If `True`, change data feed columns `_change_type`, `_commit_version`
+        and `_commit_timestamp` are kept.
+
+    References
+    ----------
+    https://docs.delta.io/latest/delta-change-data-feed.html
+    """
+
+    change_types: list[
+        Literal["insert", "update_preimage", "update_postimage", "delete"]
+    ] = ["insert", "update_postimage"]
+    checkpoint_location: Union[str, None] = None
+    keep_change_columns: bool = False
+
+
 class BaseDataSource(BaseModel, PipelineChild):
     """
     Base class for building data source
@@ -60,8 +110,15 @@ class BaseDataSource(BaseModel, PipelineChild):
         List of columns to drop
     filter:
         SQL expression used to select specific rows from the source table
+    incremental:
+        Batch incremental read specifications. Only the data committed since
+        the last successful execution of the consumer pipeline node is read.
+        Only supported for Delta sources.
     renames:
         Mapping between the source table column names and new column names
+    sample:
+        Sample specifications. With Polars, rows are sampled from their
+        hashed index.
     selects:
         Columns to select from the source table. Can be specified as a list
         or as a dictionary to rename the source columns
@@ -74,12 +131,14 @@ class BaseDataSource(BaseModel, PipelineChild):
     dataframe_backend: Literal["SPARK", "POLARS"] = None
     drops: Union[list, None] = None
     filter: Union[str, None] = None
+    incremental: Union[IncrementalRead, None] = None
     limit: Union[int, None] = None
     mock_df: Any = Field(default=None, exclude=True)
     renames: Union[dict[str, str], None] = None
     sample: Union[DataFrameSample, None] = None
     selects: Union[list[str], dict[str, str], None] = None
     watermark: Union[Watermark, None] = None
+    _incremental_version: int = None
 
     @model_validator(mode="after")
     def options(self) -> Any:
@@ -90,6 +149,9 @@ class BaseDataSource(BaseModel, PipelineChild):
             elif is_polars_dataframe(self.mock_df):
                 self.dataframe_backend = "POLARS"
 
+            if self.incremental and self.as_stream:
+                raise ValueError("Incremental read is not supported with streaming.")
+
             if self.df_backend == "SPARK":
                 pass
             elif self.df_backend == "POLARS":
@@ -121,6 +183,148 @@ class BaseDataSource(BaseModel, PipelineChild):
 
         return pl.is_orchestrator_dlt
 
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def get_fingerprint(self, spark=None) -> Union[str, None]:
+        """
+        Fingerprint of the data available from the source, used to detect
+        that the source has not changed since the last execution of a
+        pipeline node. `None` when the data state can't be determined.
+
+        Parameters
+        ----------
+        spark:
+            Spark session
+
+        Returns
+        -------
+        :
+            Fingerprint
+        """
+        return None
+
+    # ----------------------------------------------------------------------- #
+    # Incremental                                                             #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def _incremental_checkpoint_path(self) -> Union[Path, None]:
+        if self.incremental is None:
+            return None
+
+        if self.incremental.checkpoint_location:
+            return Path(self.incremental.checkpoint_location)
+
+        node = self.parent_pipeline_node
+        if node is None:
+            return None
+
+        name = re.sub(r"[^\w.-]+", "_", self._id).strip("_")
+        return node._root_path / "checkpoints" / "incremental" / f"{name}.json"
+
+    def read_incremental_version(self) -> Union[int, None]:
+        """
+        Last Delta version processed by the consumer of the source.
+
+        Returns
+        -------
+        :
+            Delta version. `None` if the source has never been processed.
+        """
+        path = self._incremental_checkpoint_path
+        if path is None:
+            raise ValueError(
+                f"Incremental source '{self._id}' requires a `checkpoint_location` when not used in a pipeline node"
+            )
+        content = get_storage(path).read_text(path)
+        if content is None:
+            return None
+        return json.loads(content)["version"]
+
+    def commit_incremental(self) -> None:
+        """
+        Store the Delta version of the last incremental read as processed.
+        Called once the consumer pipeline node has been successfully executed.
+        """
+        if self._incremental_version is None:
+            return
+
+        path = self._incremental_checkpoint_path
+        logger.info(
+            f"Committing source {self._id} incremental version {self._incremental_version}"
+        )
+        content = json.dumps({"version": self._incremental_version})
+        get_storage(path).write_text(path, content)
+        self._incremental_version = None
+
+    def purge_incremental(self) -> None:
+        """Delete incremental read checkpoint"""
+        path = self._incremental_checkpoint_path
+        if path is not None:
+            get_storage(path).rm(path)
+
+    def _get_incremental_versions(
+        self, version: int
+    ) -> tuple[Union[int, None], Union[int, None]]:
+        """
+        Starting version of the changes to read (`None` for a full read) and
+        ending version for a given latest version of the table.
+        """
+        start = self.read_incremental_version()
+        if start is not None:
+            start += 1
+        self._incremental_version = version
+        if start is None:
+            logger.info(f"Reading {self._id} full snapshot at version {version}")
+        else:
+            logger.info(f"Reading {self._id} changes from version {start} to {version}")
+        return start, version
+
+    def _read_spark_delta_incremental(
+        self, spark, name: str, load: Callable
+    ) -> SparkDataFrame:
+        """
+        Read Delta table `name` incrementally. `load` is called with a
+        configured reader and returns the resulting DataFrame.
+        """
+        row = spark.sql(f"DESCRIBE HISTORY {name} LIMIT 1").collect()[0]
+        start, end = self._get_incremental_versions(row["version"])
+
+        reader = spark.read.format("delta")
+
+        # First read
+        if start is None:
+            return load(reader.option("versionAsOf", end))
+
+        # No new commit
+        if start > end:
+            return load(reader.option("versionAsOf", end)).limit(0)
+
+        reader = (
+            reader.option("readChangeFeed", "true")
+            .option("startingVersion", start)
+            .option("endingVersion", end)
+        )
+        return self._post_read_changes_spark(load(reader))
+
+    def _post_read_changes_spark(self, df: SparkDataFrame) -> SparkDataFrame:
+        import pyspark.sql.functions as F
+
+        df = df.filter(F.col("_change_type").isin(self.incremental.change_types))
+        if not self.incremental.keep_change_columns:
+            df = df.drop(*CHANGE_COLUMNS)
+        return df
+
+    def _post_read_changes_polars(self, df: PolarsDataFrame) -> PolarsDataFrame:
+        import polars as pl
+
+        df = df.filter(pl.col("_change_type").is_in(self.incremental.change_types))
+        if not self.incremental.keep_change_columns:
+            df = df.drop(*CHANGE_COLUMNS)
+        return df
+
     # ----------------------------------------------------------------------- #
     # Readers                                                                 #
     # ----------------------------------------------------------------------- #
@@ -249,10 +453,7 @@ class BaseDataSource(BaseModel, PipelineChild):
 
         # Sample
         if self.sample:
-            raise NotImplementedError(
-                "Broadcasting not supported with POLARS lazyframe"
-            )
-            # df = df.sample(fraction=self.sample.fraction, seed=self.sample.seed)
+            df = df.laktory.sample(fraction=self.sample.fraction, seed=self.sample.seed)
 
         # Limit
         if self.limit:
@@ -93,6 +93,14 @@ class FileDataSource(BaseDataSource):
 
     @model_validator(mode="after")
     def options(self) -> Any:
+        if self.incremental:
+            if self.format != "DELTA":
+                raise ValueError(
+                    "Incremental read is only supported with 'DELTA' format"
+                )
+            if self.as_stream:
+                raise ValueError("Incremental read is not supported with streaming.")
+
         if self.dataframe_backend == "SPARK":
             if self.format in [
                 "EXCEL",
@@ -119,6 +127,58 @@ class FileDataSource(BaseDataSource):
     def _id(self):
         return str(self.path)
 
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def get_fingerprint(self, spark=None) -> Union[str, None]:
+        """
+        Fingerprint of the source files. For a Delta table, the latest
+        transaction log file is used. For other formats, the manifest (path,
+        size and modification time) of all the files is used. Only supported
+        for paths accessible through the local file system.
+
+        Parameters
+        ----------
+        spark:
+            Spark session
+
+        Returns
+        -------
+        :
+            Fingerprint
+        """
+        import glob
+        import hashlib
+
+        path = str(self.path)
+        if "://" in path or path.startswith("dbfs:"):
+            return None
+
+        if self.format == "DELTA":
+            log_files = glob.glob(os.path.join(path, "_delta_log", "*.json"))
+            if not log_files:
+                return None
+            return f"delta-{os.path.basename(max(log_files))}"
+
+        manifest = []
+        for _path in sorted(glob.glob(path)):
+            filepaths = [_path]
+            if os.path.isdir(_path):
+                filepaths = [
+                    os.path.join(root, f)
+                    for root, _, files in os.walk(_path)
+                    for f in files
+                ]
+            for filepath in sorted(filepaths):
+                stat = os.stat(filepath)
+                manifest += [f"{filepath}|{stat.st_size}|{stat.st_mtime_ns}"]
+
+        if not manifest:
+            return None
+
+        return hashlib.sha256("\n".join(manifest).encode()).hexdigest()
+
     @property
     def _schema(self):
         schema = self.schema_definition
@@ -149,6 +209,14 @@ class FileDataSource(BaseDataSource):
     # ----------------------------------------------------------------------- #
 
     def _read_spark(self, spark) -> SparkDataFrame:
+        if self.incremental:
+            logger.info(f"Reading {self._id} as incremental")
+            return self._read_spark_delta_incremental(
+                spark,
+                name=f"delta.`{self.path}`",
+                load=lambda reader: reader.options(**self.read_options).load(self.path),
+            )
+
         _options = {}
         _mode = "stream"
 
@@ -223,6 +291,9 @@ class FileDataSource(BaseDataSource):
                 "Streaming read not supported with Pandas DataFrame. Please switch to Spark"
             )
 
+        if self.incremental:
+            return self._read_polars_incremental()
+
         logger.info(f"Reading {self._id} as static")
 
         if self.format.lower() == "csv":
@@ -250,3 +321,39 @@ class FileDataSource(BaseDataSource):
             df = df.lazy()
 
         return df
+
+    def _read_polars_incremental(self) -> PolarsLazyFrame:
+        import polars as pl
+        from deltalake import DeltaTable
+
+        logger.info(f"Reading {self._id} as incremental")
+
+        dt = DeltaTable(
+            self.path, storage_options=self.read_options.get("storage_options")
+        )
+        start, end = self._get_incremental_versions(dt.version())
+
+        # First read
+        if start is None:
+            return pl.scan_delta(self.path, version=end, **self.read_options)
+
+        # No new commit
+        if start > end:
+            return pl.scan_delta(self.path, version=end, **self.read_options).limit(0)
+
+        cdf = dt.metadata().configuration.get("delta.enableChangeDataFeed", "false")
+        if cdf.lower() != "true":
+            raise ValueError(
+                f"Incremental read of {self._id} requires change data feed. Set "
+                "table property `delta.enableChangeDataFeed` to `true` or disable "
+                "`incremental`."
+            )
+
+        # Changes are filtered batch by batch to avoid loading the whole
+        # versions range in memory
+        changes = dt.load_cdf(starting_version=start, ending_version=end)
+        dfs = [self._post_read_changes_polars(pl.DataFrame(batch)) for batch in changes]
+        if not dfs:
+            return pl.scan_delta(self.path, version=end, **self.read_options).limit(0)
+
+        return pl.concat(dfs, rechunk=False).lazy()
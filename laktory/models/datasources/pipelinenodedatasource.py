@@ -19,6 +19,9 @@ class PipelineNodeDataSource(BaseDataSource):
     - upstream node sink
     - DLT table
 
+    When `incremental` is set, only the changes committed to the upstream node
+    primary sink since the last execution of the current node are read.
+
     Attributes
     ----------
     node_name:
@@ -48,9 +51,19 @@ class PipelineNodeDataSource(BaseDataSource):
     """
 
     node_name: Union[str, None]
+    _incremental_sink_source: BaseDataSource = None
     # include_failed_expectations: bool = True  # TODO: Implement
     # include_passed_expectations: bool = True  # TODO: Implement
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+
+        # Reset parent pipeline graph index when node dependencies change
+        if name == "node_name":
+            pl = self.parent_pipeline
+            if pl is not None:
+                pl._graph_index = None
+
     # ----------------------------------------------------------------------- #
     # Properties                                                              #
     # ----------------------------------------------------------------------- #
@@ -66,7 +79,7 @@ class PipelineNodeDataSource(BaseDataSource):
         if pl is None:
             raise ValueError(f"Source '{self.node_name}' is not attached to a pipeline")
 
-        if self.node_name not in pl.sorted_node_names:
+        if self.node_name not in pl.nodes_dict:
             raise ValueError(
                 f"Node '{self.node_name}' does not exists in pipeline '{pl.name}'"
             )
@@ -88,6 +101,29 @@ class PipelineNodeDataSource(BaseDataSource):
             )
         return node.primary_sink.full_name
 
+    # ----------------------------------------------------------------------- #
+    # Incremental                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def _get_incremental_sink_source(self) -> BaseDataSource:
+        """Upstream node primary sink as an incremental source"""
+        node = self.node
+        if not node.primary_sink:
+            raise ValueError(
+                f"Source node '{self.node_name}' must have a sink to be read incrementally"
+            )
+        source = node.primary_sink.as_source()
+        source.incremental = self.incremental.model_copy(
+            update={"checkpoint_location": str(self._incremental_checkpoint_path)}
+        )
+        source.parent = self.parent
+        self._incremental_sink_source = source
+        return source
+
+    def commit_incremental(self) -> None:
+        if self._incremental_sink_source is not None:
+            self._incremental_sink_source.commit_incremental()
+
     # ----------------------------------------------------------------------- #
     # Readers                                                                 #
     # ----------------------------------------------------------------------- #
@@ -111,7 +147,15 @@ class PipelineNodeDataSource(BaseDataSource):
                 logger.info(f"Reading pipeline node {self._id} with DLT as static")
                 df = dlt_read(self.node.name)
 
-        elif stream_to_batch or self.node.output_df is None:
+        elif self.incremental:
+            logger.info(f"Reading pipeline node {self._id} from primary sink")
+            df = self._get_incremental_sink_source().read(spark=spark)
+
+        elif (
+            stream_to_batch
+            or self.node.output_df is None
+            or self.node._output_from_sink
+        ):
             logger.info(f"Reading pipeline node {self._id} from primary sink")
             df = self.node.primary_sink.read(spark=spark, as_stream=self.as_stream)
 
@@ -125,8 +169,13 @@ class PipelineNodeDataSource(BaseDataSource):
         return df
 
     def _read_polars(self) -> PolarsDataFrame:
-        # Read from node output DataFrame (if available)
-        if self.node.output_df is not None:
+        # Read changes from node sink
+        if self.incremental:
+            logger.info(f"Reading pipeline node {self._id} from sink")
+            df = self._get_incremental_sink_source().read()
+
+        # Read from node output DataFrame (if available and up to date)
+        elif self.node.output_df is not None and not self.node._output_from_sink:
             logger.info(f"Reading pipeline node {self._id} from output DataFrame")
             df = self.node.output_df
 
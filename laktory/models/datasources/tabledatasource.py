@@ -75,6 +75,34 @@ class TableDataSource(BaseDataSource):
     def _id(self) -> str:
         return self.full_name
 
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    def get_fingerprint(self, spark=None) -> Union[str, None]:
+        """
+        Fingerprint of the table, based on its latest Delta version.
+
+        Parameters
+        ----------
+        spark:
+            Spark session
+
+        Returns
+        -------
+        :
+            Fingerprint
+        """
+        if spark is None or self.full_name is None:
+            return None
+
+        try:
+            row = spark.sql(f"DESCRIBE HISTORY {self.full_name} LIMIT 1").collect()[0]
+        except Exception:
+            return None
+
+        return f"delta-{row['version']}"
+
     # ----------------------------------------------------------------------- #
     # Readers                                                                 #
     # ----------------------------------------------------------------------- #
@@ -88,7 +116,14 @@ class TableDataSource(BaseDataSource):
             )
 
     def _read_spark_databricks(self, spark) -> SparkDataFrame:
-        if self.as_stream:
+        if self.incremental:
+            logger.info(f"Reading {self._id} as incremental")
+            df = self._read_spark_delta_incremental(
+                spark,
+                name=self.full_name,
+                load=lambda reader: reader.table(self.full_name),
+            )
+        elif self.as_stream:
             logger.info(f"Reading {self._id} as stream")
             df = spark.readStream.table(self.full_name)
         else:
@@ -1,12 +1,35 @@
-from laktory.models.grants.cataloggrant import CatalogGrant
-from laktory.models.grants.connectiongrant import ConnectionGrant
-from laktory.models.grants.externallocationgrant import ExternalLocationGrant
-from laktory.models.grants.functiongrant import FunctionGrant
-from laktory.models.grants.metastoregrant import MetastoreGrant
-from laktory.models.grants.registeredmodelgrant import RegisteredModelGrant
-from laktory.models.grants.schemagrant import SchemaGrant
-from laktory.models.grants.sharegrant import ShareGrant
-from laktory.models.grants.storagecredentialgrant import StorageCredentialGrant
-from laktory.models.grants.tablegrant import TableGrant
-from laktory.models.grants.viewgrant import ViewGrant
-from laktory.models.grants.volumegrant import VolumeGrant
+from typing import TYPE_CHECKING
+
+from laktory._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "CatalogGrant": ".cataloggrant",
+        "ConnectionGrant": ".connectiongrant",
+        "ExternalLocationGrant": ".externallocationgrant",
+        "FunctionGrant": ".functiongrant",
+        "MetastoreGrant": ".metastoregrant",
+        "RegisteredModelGrant": ".registeredmodelgrant",
+        "SchemaGrant": ".schemagrant",
+        "ShareGrant": ".sharegrant",
+        "StorageCredentialGrant": ".storagecredentialgrant",
+        "TableGrant": ".tablegrant",
+        "ViewGrant": ".viewgrant",
+        "VolumeGrant": ".volumegrant",
+    },
+)
+
+if TYPE_CHECKING:
+    from .cataloggrant import CatalogGrant
+    from .connectiongrant import ConnectionGrant
+    from .externallocationgrant import ExternalLocationGrant
+    from .functiongrant import FunctionGrant
+    from .metastoregrant import MetastoreGrant
+    from .registeredmodelgrant import RegisteredModelGrant
+    from .schemagrant import SchemaGrant
+    from .sharegrant import ShareGrant
+    from .storagecredentialgrant import StorageCredentialGrant
+    from .tablegrant import TableGrant
+    from .viewgrant import ViewGrant
+    from .volumegrant import VolumeGrant
@@ -1,9 +1,13 @@
+from typing import Literal
 from typing import Union
 
 from laktory._settings import settings
 from laktory.models.pipeline.orchestrators.pipelineconfigworkspacefile import (
     PipelineConfigWorkspaceFile,
 )
+from laktory.models.pipeline.orchestrators.pipelinenodesconfigworkspacefile import (
+    PipelineNodesConfigWorkspaceFile,
+)
 from laktory.models.pipeline.orchestrators.pipelinerequirementsworkspacefile import (
     PipelineRequirementsWorkspaceFile,
 )
@@ -38,17 +42,165 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
         by the job to read and execute the pipeline.
     node_max_retries:
         An optional maximum number of times to retry an unsuccessful run for each node.
+    nodes_config_file:
+        Compact configuration (json) file of each pipeline node deployed to the
+        workspace and used by each task to read and execute its node without
+        validating the full pipeline.
     requirements_file:
         Pipeline requirements (json) file deployed to the workspace and used
         by the job to install the required python dependencies.
+    task_grouping:
+        Strategy for packing pipeline nodes into job tasks. Nodes of a task
+        are executed in-process and in topological order, using the output
+        DataFrame of upstream nodes from the same task instead of reading
+        their sink.
+
+        - `node`: one task per node
+        - `chain`: one task per linear chain of nodes (each node having a
+          single downstream node which has itself a single upstream node)
+        - `layer`: one task per topological generation of nodes
+        - `custom`: one task per group defined in `task_groups`. Nodes not
+          assigned to a group get their own task.
+    task_groups:
+        Names of the nodes for each task group when `task_grouping` is
+        `custom`.
+    task_max_workers:
+        Maximum number of nodes executed concurrently within a task.
+    skip_unchanged:
+        If `True`, nodes whose inputs are unchanged since their last successful
+        execution are skipped. Execution of all nodes can be forced by setting
+        the `skip_unchanged` job parameter to `false` (`laktory run --force`).
+
+    Examples
+    --------
+    ```py
+    from laktory import models
+
+    pl = models.Pipeline(
+        name="pl-chain",
+        orchestrator="DATABRICKS_JOB",
+        databricks_job={"name": "job-pl-chain", "task_grouping": "chain"},
+        nodes=[
+            {"name": "brz", "source": {"path": "/brz/"}, "sinks": [{"path": "/brz"}]},
+            {
+                "name": "slv",
+                "source": {"node_name": "brz"},
+                "sinks": [{"path": "/slv"}],
+            },
+            {
+                "name": "gld",
+                "source": {"node_name": "slv"},
+                "sinks": [{"path": "/gld"}],
+            },
+        ],
+    )
+    print([t.task_key for t in pl.databricks_job.tasks])
+    # > ['chain-brz']
+    ```
     """
 
     notebook_path: Union[str, None] = None
     config_file: PipelineConfigWorkspaceFile = PipelineConfigWorkspaceFile()
     node_max_retries: int = None
+    nodes_config_file: PipelineNodesConfigWorkspaceFile = (
+        PipelineNodesConfigWorkspaceFile()
+    )
     requirements_file: PipelineRequirementsWorkspaceFile = (
         PipelineRequirementsWorkspaceFile()
     )
+    skip_unchanged: bool = False
+    task_grouping: Literal["node", "chain", "layer", "custom"] = "node"
+    task_groups: dict[str, list[str]] = None
+    task_max_workers: int = 1
+
+    # ----------------------------------------------------------------------- #
+    # Task Groups                                                             #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def node_groups(self) -> dict[str, list[str]]:
+        """
+        Topologically sorted node names of each task, according to the task
+        grouping strategy. Keys are the task keys.
+
+        Returns
+        -------
+        :
+            Node names for each task
+        """
+        import networkx as nx
+
+        pl = self.parent_pipeline
+        dag = pl.dag
+        sorted_node_names = pl.sorted_node_names
+
+        groups = []
+        if self.task_grouping == "node":
+            groups = [(None, [n]) for n in sorted_node_names]
+
+        elif self.task_grouping == "chain":
+            assigned = set()
+            for node_name in sorted_node_names:
+                if node_name in assigned:
+                    continue
+                chain = [node_name]
+                while dag.out_degree(chain[-1]) == 1:
+                    _node_name = next(iter(dag.successors(chain[-1])))
+                    if dag.in_degree(_node_name) != 1:
+                        break
+                    chain += [_node_name]
+                assigned.update(chain)
+                groups += [(f"chain-{chain[0]}", chain)]
+
+        elif self.task_grouping == "layer":
+            for i, layer in enumerate(nx.topological_generations(dag)):
+                layer = [n for n in sorted_node_names if n in layer]
+                groups += [(f"layer-{i}", layer)]
+
+        elif self.task_grouping == "custom":
+            assigned = {}
+            for group_name, node_names in (self.task_groups or {}).items():
+                for node_name in node_names:
+                    if node_name not in pl.nodes_dict:
+                        raise ValueError(
+                            f"Node '{node_name}' of task group '{group_name}' does not exists in pipeline '{pl.name}'"
+                        )
+                    if node_name in assigned:
+                        raise ValueError(
+                            f"Node '{node_name}' is assigned to task groups '{assigned[node_name]}' and '{group_name}'"
+                        )
+                    assigned[node_name] = group_name
+                node_names = set(node_names)
+                groups += [
+                    (
+                        f"group-{group_name}",
+                        [n for n in sorted_node_names if n in node_names],
+                    )
+                ]
+            groups += [(None, [n]) for n in sorted_node_names if n not in assigned]
+
+        # Single node tasks keep the node task key
+        node_groups = {}
+        for task_key, node_names in groups:
+            if len(node_names) == 0:
+                continue
+            if task_key is None or len(node_names) == 1:
+                task_key = "node-" + node_names[0]
+            node_groups[task_key] = node_names
+
+        # Validate groups dependencies
+        task_keys = {n: k for k, node_names in node_groups.items() for n in node_names}
+        tasks_dag = nx.DiGraph()
+        tasks_dag.add_nodes_from(node_groups)
+        for e in dag.edges:
+            if task_keys[e[0]] != task_keys[e[1]]:
+                tasks_dag.add_edge(task_keys[e[0]], task_keys[e[1]])
+        if not nx.is_directed_acyclic_graph(tasks_dag):
+            raise ValueError(
+                f"Task groups of pipeline '{pl.name}' have circular dependencies. Please review `task_groups`."
+            )
+
+        return node_groups
 
     # ----------------------------------------------------------------------- #
     # Update Job                                                              #
@@ -95,27 +247,41 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
                 name="install_dependencies", default=str(not cluster_found).lower()
             ),
         ]
+        if self.skip_unchanged:
+            self.parameters += [JobParameter(name="skip_unchanged", default="true")]
 
         notebook_path = self.notebook_path
         if notebook_path is None:
             notebook_path = f"{settings.workspace_laktory_root}jobs/job_laktory_pl.py"
 
-        self.tasks = []
+        # Tasks are assigned once to avoid validating the list at each update
+        tasks = []
 
-        # Sorting Node Names to prevent job update trigger with Pulumi
-        node_names = [node.name for node in pl.nodes]
-        node_names.sort()
-        for node_name in node_names:
-            node = pl.nodes_dict[node_name]
+        dag = pl.dag
+        node_groups = self.node_groups
+        task_keys = {n: k for k, node_names in node_groups.items() for n in node_names}
+
+        # Sorting task keys to prevent job update trigger with Pulumi
+        for task_key in sorted(node_groups):
+            node_names = node_groups[task_key]
 
             depends_on = []
-            for edge in pl.dag.in_edges(node.name):
-                depends_on += [{"task_key": "node-" + edge[0]}]
+            for node_name in node_names:
+                for _node_name in dag.predecessors(node_name):
+                    _task_key = task_keys[_node_name]
+                    if _task_key == task_key:
+                        continue
+                    if {"task_key": _task_key} not in depends_on:
+                        depends_on += [{"task_key": _task_key}]
+
+            base_parameters = {"node_name": ",".join(node_names)}
+            if len(node_names) > 1 and self.task_max_workers > 1:
+                base_parameters["max_workers"] = str(self.task_max_workers)
 
             task = JobTask(
-                task_key="node-" + node.name,
+                task_key=task_key,
                 notebook_task={
-                    "base_parameters": {"node_name": node.name},
+                    "base_parameters": base_parameters,
                     "notebook_path": notebook_path,
                 },
                 depends_ons=depends_on,
@@ -134,12 +300,13 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
             if self.node_max_retries:
                 task.max_retries = self.node_max_retries
 
-            self.tasks += [task]
+            tasks += [task]
 
-        self.sort_tasks(self.tasks)
+        self.tasks = self.sort_tasks(tasks)
 
-        # Config file
+        # Config files
         self.config_file.update_from_parent()
+        self.nodes_config_file.update_from_parent()
 
         # Requirements file
         self.requirements_file.update_from_parent()
@@ -150,7 +317,7 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
 
     @property
     def child_attribute_names(self):
-        return ["config_file", "requirements_file"]
+        return ["config_file", "nodes_config_file", "requirements_file"]
 
     # ----------------------------------------------------------------------- #
     # Resource Properties                                                     #
@@ -166,7 +333,12 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
             "notebook_path",
             "config_file",
             "node_max_retries",
+            "nodes_config_file",
             "requirements_file",
+            "skip_unchanged",
+            "task_grouping",
+            "task_groups",
+            "task_max_workers",
         ]
 
     @property
@@ -174,6 +346,8 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
         """
         - configuration workspace file
         - configuration workspace file permissions
+        - nodes configuration workspace file
+        - nodes configuration workspace file permissions
         - requirements workspace file
         - requirements workspace file permissions
         """
@@ -181,6 +355,8 @@ class DatabricksJobOrchestrator(Job, PipelineChild):
         resources = super().additional_core_resources
         resources += [self.config_file]
         resources[-1].write_source()
+        resources += [self.nodes_config_file]
+        resources[-1].write_source()
         resources += [self.requirements_file]
         resources[-1].write_source()
 
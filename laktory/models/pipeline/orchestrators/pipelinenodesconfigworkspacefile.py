@@ -0,0 +1,63 @@
+import json
+import os
+
+from laktory._settings import settings
+from laktory.constants import CACHE_ROOT
+from laktory.models.pipeline.pipelinechild import PipelineChild
+from laktory.models.resources.databricks.accesscontrol import AccessControl
+from laktory.models.resources.databricks.workspacefile import WorkspaceFile
+
+
+class PipelineNodesConfigWorkspaceFile(WorkspaceFile, PipelineChild):
+    """
+    Workspace File storing the compact configuration of each pipeline node
+    (or group of nodes executed by the same task). Used by job tasks to
+    validate only the nodes they execute instead of the full pipeline.
+
+    Default values for path and access controls. Forced value for source.
+
+    Attributes
+    ----------
+    access_controls:
+        List of file access controls
+    path:
+         Workspace filepath for the file. Overwrite `rootpath` and `dirpath`.
+         Default value `{settings.workspace_laktory_root}pipelines/{pl_name}/nodes_config.json`
+    """
+
+    source: str = "{pl_name}"
+    access_controls: list[AccessControl] = [
+        AccessControl(permission_level="CAN_READ", group_name="users")
+    ]
+
+    def update_from_parent(self):
+        pl = self.parent_pipeline
+        pl_name = pl.name
+        self.source = os.path.join(CACHE_ROOT, f"tmp-{pl_name}-nodes_config.json")
+        if "{pl_name}" in self.path:
+            self.path = f"{settings.workspace_laktory_root}pipelines/{pl_name}/nodes_config.json"
+        self.set_paths()
+
+    def write_source(self):
+        pl = self.parent_pipeline
+
+        pl.root_path = pl._root_path.as_posix()
+        pl = pl.inject_vars(inplace=False)
+
+        # One configuration per job task
+        d = {}
+        for node_names in self.parent.node_groups.values():
+            d[",".join(node_names)] = pl.get_node_config(node_names)
+        s = json.dumps(d, indent=4)
+
+        source = self.inject_vars_into_dump({"source": self.source})["source"]
+        with open(source, "w", newline="\n") as fp:
+            fp.write(s)
+
+    # ----------------------------------------------------------------------- #
+    # Resource Properties                                                     #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def resource_type_id(self):
+        return "workspace-file"
@@ -55,6 +55,134 @@ class PipelineUDF(BaseModel):
     module_path: str = None
 
 
+class PipelineNodes(list):
+    """
+    List of pipeline nodes keeping track of its mutations with a version
+    counter, so that the pipeline graph index is invalidated without
+    rescanning the nodes.
+    """
+
+    version = 0
+
+    def _mutated(self):
+        self.version += 1
+
+
+def _mutating(name):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        out = method(self, *args, **kwargs)
+        self._mutated()
+        return out
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in [
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+]:
+    setattr(PipelineNodes, _name, _mutating(_name))
+
+
+class PipelineGraphIndex:
+    """
+    Index of the pipeline nodes and of their dependencies, cached by the
+    pipeline.
+
+    Parameters
+    ----------
+    nodes:
+        Pipeline nodes
+    """
+
+    def __init__(self, nodes: PipelineNodes):
+        self.nodes = nodes
+        self.version = getattr(nodes, "version", None)
+        self.nodes_dict = {n.name: n for n in nodes}
+        self.upstream = None
+        self.downstream = None
+        self.dag = None
+        self.sorted_node_names = None
+
+    def is_valid(self, nodes: PipelineNodes) -> bool:
+        """
+        `True` if the index has been built from the same nodes list and the
+        list has not been mutated since.
+
+        Parameters
+        ----------
+        nodes:
+            Pipeline nodes
+        """
+        return self.nodes is nodes and self.version == getattr(nodes, "version", -1)
+
+    def build_edges(self, nodes: list[PipelineNode], pl_name: str = None) -> None:
+        """
+        Build adjacency lists, graph and topological order.
+
+        Parameters
+        ----------
+        nodes:
+            Pipeline nodes
+        pl_name:
+            Pipeline name used in error messages
+        """
+        import networkx as nx
+
+        # Build adjacency lists
+        names = [n.name for n in nodes]
+        upstream = {}
+        downstream = {n: [] for n in names}
+        for node in nodes:
+            node_name = node.name
+            if node_name in upstream:
+                raise ValueError(
+                    f"Pipeline node '{node_name}' is declared twice in pipeline '{pl_name}'"
+                )
+            upstream[node_name] = node.upstream_node_names
+            for _node_name in upstream[node_name]:
+                if _node_name not in downstream:
+                    raise ValueError(
+                        f"Pipeline node data source '{_node_name}' is not defined in pipeline '{pl_name}'"
+                    )
+                downstream[_node_name] += [node_name]
+
+        # Build graph
+        dag = nx.DiGraph()
+        dag.add_nodes_from(names)
+        dag.add_edges_from((u, n) for n in names for u in upstream[n])
+
+        try:
+            sorted_node_names = tuple(nx.topological_sort(dag))
+        except nx.NetworkXUnfeasible:
+            for n in dag.nodes:
+                logger.info(f"Pipeline {pl_name} node: {n}")
+            for e in dag.edges:
+                logger.info(f"Pipeline {pl_name} edge: {e[0]} -> {e[1]}")
+            raise ValueError(
+                f"Pipeline '{pl_name}' is not a DAG (directed acyclic graph)."
+                " A circular dependency has been detected. Please review nodes dependencies."
+            )
+
+        self.upstream = upstream
+        self.downstream = downstream
+        self.dag = dag
+        self.sorted_node_names = sorted_node_names
+
+
 # --------------------------------------------------------------------------- #
 # Main Class                                                                  #
 # --------------------------------------------------------------------------- #
@@ -350,6 +478,12 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
     orchestrator: Literal["DATABRICKS_DLT", "DATABRICKS_JOB", None] = None
     udfs: list[PipelineUDF] = []
     root_path: str = None
+    _graph_index: PipelineGraphIndex = None
+
+    @field_validator("nodes", mode="after")
+    @classmethod
+    def track_nodes(cls, value: list[PipelineNode]) -> PipelineNodes:
+        return PipelineNodes(value)
 
     @field_validator("root_path", mode="before")
     @classmethod
@@ -486,6 +620,29 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
     # Nodes                                                                   #
     # ----------------------------------------------------------------------- #
 
+    def _get_graph_index(self, with_edges: bool = True) -> PipelineGraphIndex:
+        """
+        Graph index of the pipeline nodes. The index is cached and rebuilt
+        only when `nodes` is re-assigned or mutated (node added, removed or
+        replaced). Nodes reset the index of their parent pipeline when their
+        name, source or transformer is re-assigned and pipeline node data
+        sources when their `node_name` is re-assigned.
+        """
+        index = self._graph_index
+        if index is None or not index.is_valid(self.nodes):
+            # Nodes added to the list are attached so that their updates
+            # reset the index
+            for n in self.nodes:
+                if n._parent is not self:
+                    n.parent = self
+            index = PipelineGraphIndex(nodes=self.nodes)
+            self._graph_index = index
+
+        if with_edges and index.dag is None:
+            index.build_edges(self.nodes, pl_name=self.name)
+
+        return index
+
     @property
     def nodes_dict(self) -> dict[str, PipelineNode]:
         """
@@ -496,84 +653,226 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
         :
             Nodes
         """
-        return {n.name: n for n in self.nodes}
+        return self._get_graph_index(with_edges=False).nodes_dict
 
     @property
     def dag(self) -> nx.DiGraph:
         """
         Networkx Directed Acyclic Graph representation of the pipeline. Useful
-        to identify interdependencies between nodes.
+        to identify interdependencies between nodes. The graph is cached and
+        should not be modified.
 
         Returns
         -------
         :
             Directed Acyclic Graph
         """
-        import networkx as nx
+        return self._get_graph_index().dag
 
-        # TODO: Review if this needs to be computed dynamically or if we can
-        #       compute it only after initialization. It depends if we believe
-        #       that the nodes will be changed after initialization.
+    @property
+    def sorted_node_names(self):
+        return list(self._get_graph_index().sorted_node_names)
 
-        dag = nx.DiGraph()
+    @property
+    def sorted_nodes(self) -> list[PipelineNode]:
+        """
+        Topologically sorted nodes.
 
-        # Build nodes
-        for n in self.nodes:
-            dag.add_node(n.name)
-        # Build edges and assign nodes to pipeline node data sources
-        node_names = []
-        for n in self.nodes:
-            if n.name in node_names:
-                raise ValueError(
-                    f"Pipeline node '{n.name}' is declared twice in pipeline '{self.name}'"
-                )
-            node_names += [n.name]
+        Returns
+        -------
+        :
+            List of Topologically sorted nodes.
+        """
+        index = self._get_graph_index()
+        return [index.nodes_dict[n] for n in index.sorted_node_names]
 
-            # for s in n.get_sources(PipelineNodeDataSource):
-            for _node_name in n.upstream_node_names:
-                dag.add_edge(_node_name, n.name)
-                if _node_name not in self.nodes_dict:
-                    raise ValueError(
-                        f"Pipeline node data source '{_node_name}' is not defined in pipeline '{self.name}'"
-                    )
+    def select_node_names(
+        self, select: list[str] = None, exclude: list[str] = None
+    ) -> list[str]:
+        """
+        Topologically sorted names of the nodes matching the selectors. Each
+        selector is a node name or a glob pattern, optionally combined with
+        graph operators:
 
-        if not nx.is_directed_acyclic_graph(dag):
-            for n in dag.nodes:
-                logger.info(f"Pipeline {self.name} node: {n}")
-            for e in dag.edges:
-                logger.info(f"Pipeline {self.name} edge: {e[0]} -> {e[1]}")
+        - `+name`: node and all its upstream nodes
+        - `name+`: node and all its downstream nodes
+        - `2+name` or `name+1`: expansion limited to a number of levels
+
+        Node names are matched exactly before being used as glob patterns.
+
+        Parameters
+        ----------
+        select:
+            Selectors of the nodes to include. If `None`, all nodes are
+            included.
+        exclude:
+            Selectors of the nodes to exclude.
+
+        Returns
+        -------
+        :
+            Selected node names
+
+        Examples
+        --------
+        ```py
+        from laktory import models
+
+        pl = models.Pipeline(
+            name="pl",
+            nodes=[
+                {"name": "brz", "source": {"path": "/brz/"}},
+                {"name": "slv", "source": {"node_name": "brz"}},
+                {"name": "gld_a", "source": {"node_name": "slv"}},
+                {"name": "gld_b", "source": {"node_name": "slv"}},
+            ],
+        )
+        print(pl.select_node_names(select=["slv+"], exclude=["*_b"]))
+        # > ['slv', 'gld_a']
+        print(pl.select_node_names(select=["+gld_b"]))
+        # > ['brz', 'slv', 'gld_b']
+        ```
+        """
+        index = self._get_graph_index()
+
+        if select is None:
+            selected = set(index.nodes_dict)
+        else:
+            selected = set()
+            for selector in select:
+                selected |= self._select_node_names(selector)
+
+        for selector in exclude or []:
+            selected -= self._select_node_names(selector)
+
+        return [n for n in index.sorted_node_names if n in selected]
+
+    def _select_node_names(self, selector: str) -> set[str]:
+        import fnmatch
+        import re
+
+        index = self._get_graph_index()
+
+        # Exact node name, which may contain graph operators or wildcards
+        selector = selector.strip()
+        if selector in index.nodes_dict:
+            return {selector}
+
+        m = re.fullmatch(r"(?:(\d*)\+)?(.+?)(?:\+(\d*))?", selector)
+        if m is None:
+            raise ValueError(f"Invalid node selector '{selector}'")
+        up_depth, pattern, down_depth = m.groups()
+
+        if pattern in index.nodes_dict:
+            names = {pattern}
+        else:
+            names = set(fnmatch.filter(index.nodes_dict.keys(), pattern))
+        if not names:
             raise ValueError(
-                f"Pipeline '{self.name}' is not a DAG (directed acyclic graph)."
-                " A circular dependency has been detected. Please review nodes dependencies."
+                f"Node selector '{selector}' does not match any node of pipeline '{self.name}'"
             )
 
-        return dag
+        def _expand(adjacency, depth):
+            depth = int(depth) if depth else None
+            expanded = set(names)
+            frontier = set(names)
+            level = 0
+            while frontier and (depth is None or level < depth):
+                frontier = {n for f in frontier for n in adjacency[f]} - expanded
+                expanded |= frontier
+                level += 1
+            return expanded
+
+        selected = set(names)
+        if up_depth is not None:
+            selected |= _expand(index.upstream, up_depth)
+        if down_depth is not None:
+            selected |= _expand(index.downstream, down_depth)
+
+        return selected
 
-    @property
-    def sorted_node_names(self):
-        import networkx as nx
+    # ----------------------------------------------------------------------- #
+    # Node Configs                                                            #
+    # ----------------------------------------------------------------------- #
 
-        return list(nx.topological_sort(self.dag))
+    def get_node_config(self, node_name: Union[str, list[str]]) -> dict[str, Any]:
+        """
+        Compact pipeline configuration required to execute node `node_name`
+        only. It includes the node, the UDFs and, for each upstream node, its
+        name, primary sink and a source reading from that sink. Upstream nodes
+        without sink are fully included, along with their own upstream nodes.
 
-    @property
-    def sorted_nodes(self) -> list[PipelineNode]:
+        Parameters
+        ----------
+        node_name:
+            Name of the node or list of names for nodes executed together
+            (task group).
+
+        Returns
+        -------
+        :
+            Pipeline configuration
         """
-        Topologically sorted nodes.
+        data = self.model_dump(
+            include={"dataframe_backend", "name", "root_path", "udfs"},
+            exclude_unset=True,
+        )
+
+        node_names = node_name
+        if isinstance(node_names, str):
+            node_names = [node_names]
+
+        nodes = {}
+
+        def _add_node(node):
+            nodes[node.name] = node.model_dump(exclude_unset=True)
+            for _node_name in node.upstream_node_names:
+                if _node_name in nodes or _node_name in node_names:
+                    continue
+                up = self.nodes_dict[_node_name]
+                sink = up.primary_sink
+                if sink is None:
+                    _add_node(up)
+                    continue
+                source = sink.as_source(as_stream=up.source.as_stream)
+                nodes[_node_name] = {
+                    "name": _node_name,
+                    "source": source.model_dump(exclude_unset=True),
+                    "sinks": [sink.model_dump(exclude_unset=True)],
+                }
+                if up.dataframe_backend:
+                    nodes[_node_name]["dataframe_backend"] = up.dataframe_backend
+
+        for _node_name in node_names:
+            _add_node(self.nodes_dict[_node_name])
+        data["nodes"] = list(nodes.values())
+
+        return data
+
+    @classmethod
+    def model_validate_node_json(cls, json_data: str, node_name: str) -> Pipeline:
+        """
+        Validate the compact pipeline configuration of node `node_name` from a
+        json document mapping node names to configurations, as generated by
+        the `DATABRICKS_JOB` orchestrator. Only the configuration of the
+        selected node is validated.
+
+        Parameters
+        ----------
+        json_data:
+            Json document of nodes configuration
+        node_name:
+            Name of the node or comma-separated names of the nodes of a task
+            group
 
         Returns
         -------
         :
-            List of Topologically sorted nodes.
+            Pipeline reduced to the selected node and its upstream nodes
         """
-        node_names = self.sorted_node_names
-        nodes = []
-        for node_name in node_names:
-            for node in self.nodes:
-                if node.name == node_name:
-                    nodes += [node]
-                    break
+        import json
 
-        return nodes
+        return cls.model_validate(json.loads(json_data)[node_name])
 
     # ----------------------------------------------------------------------- #
     # Data Sources                                                            #
@@ -590,21 +889,49 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
     # Methods                                                                 #
     # ----------------------------------------------------------------------- #
 
-    def purge(self, spark=None) -> None:
+    def purge(self, spark=None, max_workers: int = 1) -> None:
+        """
+        Delete sinks data, checkpoints and execution state of all the nodes.
+
+        Parameters
+        ----------
+        spark:
+            Spark session
+        max_workers:
+            Maximum number of nodes purged concurrently
+        """
         logger.info("Purging Pipeline")
 
-        for inode, node in enumerate(self.sorted_nodes):
-            node.purge(
-                spark=spark,
-            )
+        nodes = self.sorted_nodes
+        if max_workers <= 1 or len(nodes) <= 1:
+            for node in nodes:
+                node.purge(spark=spark)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(node.purge, spark=spark) for node in nodes]
+            for future in futures:
+                future.result()
 
     def execute(
-        self, spark=None, udfs=None, write_sinks=True, full_refresh: bool = False
+        self,
+        spark=None,
+        udfs=None,
+        write_sinks=True,
+        full_refresh: bool = False,
+        node_names: list[str] = None,
+        select: list[str] = None,
+        exclude: list[str] = None,
+        max_workers: int = 1,
+        skip_unchanged: bool = False,
     ) -> None:
         """
-        Execute the pipeline (read sources and write sinks) by sequentially
-        executing each node. The selected orchestrator might impact how
-        data sources or sinks are processed.
+        Execute the pipeline (read sources and write sinks) by executing each
+        node in topological order. The output DataFrame of an executed node is
+        directly used by its downstream nodes. The selected orchestrator might
+        impact how data sources or sinks are processed.
 
         Parameters
         ----------
@@ -617,10 +944,69 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
         full_refresh:
             If `True` all nodes will be completely re-processed by deleting
             existing data and checkpoints before processing.
+        node_names:
+            Names of the nodes to execute. If `None`, all nodes are executed.
+            Other nodes are not executed and their output is read from their
+            sink. Upstream nodes without sink are always executed.
+        select:
+            Selectors of the nodes to execute, in addition to `node_names`.
+            See `select_node_names` for the selectors syntax.
+        exclude:
+            Selectors of the nodes not to execute.
+        max_workers:
+            Maximum number of nodes executed concurrently. A node is submitted
+            as soon as all its upstream nodes have been executed.
+        skip_unchanged:
+            If `True`, a node with a sink is skipped when the fingerprint of
+            its inputs (configuration, user-defined functions and data sources)
+            matches the one stored after its last successful execution. Nodes
+            with data sources of unknown state are always executed.
         """
         logger.info("Executing Pipeline")
 
-        for inode, node in enumerate(self.sorted_nodes):
+        node_names = self._get_execution_node_names(
+            node_names=node_names, select=select, exclude=exclude
+        )
+
+        # Nodes not executed are read from their sink, even if an output
+        # DataFrame is available from a previous execution
+        for node_name in self.sorted_node_names:
+            self.nodes_dict[node_name]._output_from_sink = node_name not in node_names
+
+        # Sinks are required to read the output of skipped nodes
+        skip_unchanged = (
+            skip_unchanged
+            and write_sinks
+            and not full_refresh
+            and not self.is_orchestrator_dlt
+        )
+        fingerprints = {}
+        if skip_unchanged:
+            # Nodes not executed are represented by their stored fingerprint
+            for node_name in self.sorted_node_names:
+                if node_name not in node_names:
+                    fingerprints[node_name] = self.nodes_dict[
+                        node_name
+                    ].read_fingerprint()
+
+        def _execute(node_name):
+            node = self.nodes_dict[node_name]
+
+            fingerprint = None
+            if skip_unchanged:
+                fingerprint = node.get_fingerprint(
+                    upstream_fingerprints=fingerprints, udfs=udfs, spark=spark
+                )
+                fingerprints[node_name] = fingerprint
+                if (
+                    fingerprint is not None
+                    and node.primary_sink is not None
+                    and fingerprint == node.read_fingerprint()
+                ):
+                    logger.info(f"Node '{node_name}' inputs are unchanged. Skipping.")
+                    node._output_from_sink = True
+                    return
+
             node.execute(
                 spark=spark,
                 udfs=udfs,
@@ -628,6 +1014,79 @@ class Pipeline(BaseModel, PulumiResource, TerraformResource, PipelineChild):
                 full_refresh=full_refresh,
             )
 
+            if fingerprint is not None:
+                node.write_fingerprint(fingerprint)
+
+        if max_workers <= 1 or len(node_names) <= 1:
+            for node_name in node_names:
+                _execute(node_name)
+            return
+
+        from concurrent.futures import FIRST_COMPLETED
+        from concurrent.futures import ThreadPoolExecutor
+        from concurrent.futures import wait
+
+        dag = self.dag.subgraph(node_names)
+        in_degrees = dict(dag.in_degree())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_execute, n): n for n, d in in_degrees.items() if d == 0
+            }
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node_name = futures.pop(future)
+                    # Raise node exception and cancel pending nodes
+                    try:
+                        future.result()
+                    except Exception:
+                        for f in futures:
+                            f.cancel()
+                        raise
+                    for _node_name in dag.successors(node_name):
+                        in_degrees[_node_name] -= 1
+                        if in_degrees[_node_name] == 0:
+                            futures[executor.submit(_execute, _node_name)] = _node_name
+
+    def _get_execution_node_names(
+        self,
+        node_names: list[str] = None,
+        select: list[str] = None,
+        exclude: list[str] = None,
+    ) -> list[str]:
+        if node_names is None and select is None and exclude is None:
+            return self.sorted_node_names
+
+        for node_name in node_names or []:
+            if node_name not in self.nodes_dict:
+                raise ValueError(
+                    f"Node '{node_name}' does not exists in pipeline '{self.name}'"
+                )
+
+        # Node names are matched exactly, selectors may be patterns
+        selected = set(node_names or [])
+        if select is not None or node_names is None:
+            selected |= set(self.select_node_names(select=select))
+        if exclude:
+            selected -= set(self.select_node_names(select=exclude))
+
+        # Unselected upstream nodes are read from their sink. Upstream nodes
+        # without sink have to be executed.
+        index = self._get_graph_index()
+        stack = list(selected)
+        while stack:
+            for _node_name in index.upstream[stack.pop()]:
+                if _node_name in selected:
+                    continue
+                if self.nodes_dict[_node_name].primary_sink is None:
+                    logger.info(
+                        f"Node '{_node_name}' has no sink and is executed as an upstream node"
+                    )
+                    selected.add(_node_name)
+                    stack.append(_node_name)
+
+        return [n for n in index.sorted_node_names if n in selected]
+
     def dag_figure(self) -> Figure:
         """
         [UNDER DEVELOPMENT] Generate a figure representation of the pipeline
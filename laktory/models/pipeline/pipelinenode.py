@@ -1,5 +1,6 @@
-import os
-import shutil
+import hashlib
+import inspect
+import json
 import uuid
 import warnings
 from pathlib import Path
@@ -16,6 +17,7 @@ from laktory._settings import settings
 from laktory.exceptions import DataQualityExpectationsNotSupported
 from laktory.models.basemodel import BaseModel
 from laktory.models.dataquality.expectation import DataQualityExpectation
+from laktory.models.dataquality.expectation import run_checks
 from laktory.models.datasinks import DataSinksUnion
 from laktory.models.datasinks import TableDataSink
 from laktory.models.datasources import BaseDataSource
@@ -28,6 +30,8 @@ from laktory.models.transformers.polarschainnode import PolarsChainNode
 from laktory.models.transformers.sparkchain import SparkChain
 from laktory.models.transformers.sparkchainnode import SparkChainNode
 from laktory.spark import SparkSession
+from laktory.storage import get_storage
+from laktory.storage import purge_paths
 from laktory.typing import AnyDataFrame
 
 logger = get_logger(__name__)
@@ -174,6 +178,7 @@ class PipelineNode(BaseModel, PipelineChild):
     _view_definition: str = None
     _stage_df: Any = None
     _output_df: Any = None
+    _output_from_sink: bool = False
     _quarantine_df: Any = None
     _source_columns: list[str] = []
 
@@ -335,6 +340,15 @@ class PipelineNode(BaseModel, PipelineChild):
             "sinks",
         ]
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+
+        # Reset parent pipeline graph index when node dependencies change
+        if name in ["name", "source", "transformer"]:
+            pl = self.parent_pipeline
+            if pl is not None:
+                pl._graph_index = None
+
     # ----------------------------------------------------------------------- #
     # Orchestrator                                                            #
     # ----------------------------------------------------------------------- #
@@ -708,6 +722,107 @@ class PipelineNode(BaseModel, PipelineChild):
 
         return sources
 
+    # ----------------------------------------------------------------------- #
+    # Fingerprint                                                             #
+    # ----------------------------------------------------------------------- #
+
+    @property
+    def _fingerprint_path(self) -> Path:
+        return Path(self._root_path) / "fingerprint.json"
+
+    def get_fingerprint(
+        self,
+        upstream_fingerprints: dict[str, str] = None,
+        udfs: list[Callable] = None,
+        spark: SparkSession = None,
+    ) -> Union[str, None]:
+        """
+        Fingerprint of the node inputs, combining the node configuration, the
+        source code of the user-defined functions and the fingerprint of each
+        data source. `None` when the state of any of the data sources can't be
+        determined.
+
+        Parameters
+        ----------
+        upstream_fingerprints:
+            Fingerprint of each upstream node, used for pipeline node data
+            sources.
+        udfs:
+            User-defined functions
+        spark:
+            Spark session
+
+        Returns
+        -------
+        :
+            Fingerprint
+        """
+        if upstream_fingerprints is None:
+            upstream_fingerprints = {}
+
+        # Children backend is propagated at runtime and is not part of the
+        # configuration
+        def _clean(o):
+            if isinstance(o, dict):
+                return {k: _clean(v) for k, v in o.items() if k != "dataframe_backend"}
+            if isinstance(o, list):
+                return [_clean(v) for v in o]
+            return o
+
+        config = {k: _clean(v) for k, v in self.model_dump().items()}
+        components = [json.dumps(config, default=str, sort_keys=True)]
+
+        for udf in udfs or []:
+            try:
+                components += [inspect.getsource(udf)]
+            except (OSError, TypeError):
+                components += [f"{udf.__module__}.{udf.__qualname__}"]
+
+        for source in self.data_sources:
+            if isinstance(source, PipelineNodeDataSource):
+                fingerprint = upstream_fingerprints.get(source.node_name)
+            else:
+                fingerprint = source.get_fingerprint(spark=spark)
+            if fingerprint is None:
+                return None
+            components += [fingerprint]
+
+        return hashlib.sha256("\n".join(components).encode()).hexdigest()
+
+    def read_fingerprint(self) -> Union[str, None]:
+        """
+        Fingerprint stored after the last successful execution of the node.
+
+        Returns
+        -------
+        :
+            Fingerprint
+        """
+        path = self._fingerprint_path
+        try:
+            content = get_storage(path).read_text(path)
+            if content is None:
+                return None
+            return json.loads(content).get("fingerprint")
+        except (OSError, ValueError):
+            return None
+
+    def write_fingerprint(self, fingerprint: str) -> None:
+        """
+        Store fingerprint of the last successful execution of the node.
+
+        Parameters
+        ----------
+        fingerprint:
+            Fingerprint
+        """
+        path = self._fingerprint_path
+        try:
+            content = json.dumps({"fingerprint": fingerprint})
+            get_storage(path).write_text(path, content)
+        except OSError as e:
+            logger.warning(f"Could not write node '{self.name}' fingerprint: {e}")
+
     # ----------------------------------------------------------------------- #
     # Execution                                                               #
     # ----------------------------------------------------------------------- #
@@ -722,48 +837,12 @@ class PipelineNode(BaseModel, PipelineChild):
         if self.has_sinks:
             for s in self.sinks:
                 s.purge(spark=spark)
-        if self._expectations_checkpoint_location:
-            if os.path.exists(self._expectations_checkpoint_location):
-                logger.info(
-                    f"Deleting expectations checkpoint at {self._expectations_checkpoint_location}",
-                )
-                shutil.rmtree(self._expectations_checkpoint_location)
-
-            if spark is None:
-                return
-
-            try:
-                from pyspark.dbutils import DBUtils
-            except ModuleNotFoundError:
-                return
-
-            dbutils = DBUtils(spark)
-
-            _path = self._expectations_checkpoint_location.as_posix()
-            try:
-                dbutils.fs.ls(
-                    _path
-                )  # TODO: Figure out why this does not work with databricks connect
-                logger.info(
-                    f"Deleting checkpoint at dbfs {_path}",
-                )
-                dbutils.fs.rm(_path, True)
-
-            except Exception as e:
-                if "java.io.FileNotFoundException" in str(e):
-                    pass
-                elif "databricks.sdk.errors.platform.ResourceDoesNotExist" in str(
-                    type(e)
-                ):
-                    pass
-                elif "databricks.sdk.errors.platform.InvalidParameterValue" in str(
-                    type(e)
-                ):
-                    # TODO: Figure out why this is happening. It seems that the databricks SDK
-                    #       modify the path before sending to REST API.
-                    logger.warn(f"dbutils could not delete checkpoint {_path}: {e}")
-                else:
-                    raise e
+        for s in self.data_sources:
+            s.purge_incremental()
+        purge_paths(
+            [self._fingerprint_path, self._expectations_checkpoint_location],
+            spark=spark,
+        )
 
     def execute(
         self,
@@ -801,6 +880,7 @@ class PipelineNode(BaseModel, PipelineChild):
             output Spark DataFrame
         """
         logger.info(f"Executing pipeline node {self.name}")
+        self._output_from_sink = False
 
         # Parse DLT
         if self.is_orchestrator_dlt:
@@ -864,6 +944,10 @@ class PipelineNode(BaseModel, PipelineChild):
                 for s in self.quarantine_sinks:
                     s.write(self._quarantine_df, full_refresh=full_refresh)
 
+            # Incremental sources
+            for s in self.data_sources:
+                s.commit_incremental()
+
         return self._output_df
 
     def check_expectations(self):
@@ -880,8 +964,6 @@ class PipelineNode(BaseModel, PipelineChild):
 
         # Data Quality Checks
         is_streaming = getattr(self._stage_df, "isStreaming", False)
-        qfilter = None  # Quarantine filter
-        kfilter = None  # Keep filter
         if not self.expectations:
             self._output_df = self._stage_df
             self._quarantine_df = None
@@ -890,16 +972,20 @@ class PipelineNode(BaseModel, PipelineChild):
         logger.info("Checking Data Quality Expectations")
 
         def _batch_check(df, node):
-            for e in node.expectations:
-                is_dlt_managed = node.is_dlt_run and e.is_dlt_compatible
-
-                # Run Check
-                if not is_dlt_managed:
-                    e.run_check(
-                        df,
-                        raise_or_warn=True,
-                        node=node,
-                    )
+            expectations = [
+                e
+                for e in node.expectations
+                if not (node.is_dlt_run and e.is_dlt_compatible)
+            ]
+
+            # Run Checks (single aggregation for all expectations)
+            if expectations:
+                run_checks(
+                    expectations,
+                    df,
+                    raise_or_warn=True,
+                    node=node,
+                )
 
         def _stream_check(batch_df, batch_id, node):
             _batch_check(
@@ -935,7 +1021,13 @@ class PipelineNode(BaseModel, PipelineChild):
                 self,
             )
 
-        # Build Filters
+        # Apply Filters
+        self._output_df = self.filter_output_df(self._stage_df)
+        self._quarantine_df = self.filter_quarantine_df(self._stage_df)
+
+    def _get_expectations_filters(self) -> tuple[Any, Any]:
+        qfilter = None  # Quarantine filter
+        kfilter = None  # Keep filter
         for e in self.expectations:
             is_dlt_managed = self.is_dlt_run and e.is_dlt_compatible
 
@@ -956,14 +1048,46 @@ class PipelineNode(BaseModel, PipelineChild):
                 else:
                     qfilter = qfilter & _filter
 
-        if qfilter is not None:
-            logger.info("Building quarantine DataFrame")
-            self._quarantine_df = self._stage_df.filter(qfilter)
-        else:
-            self._quarantine_df = self._stage_df.filter("False")
+        return kfilter, qfilter
+
+    def filter_output_df(self, df: AnyDataFrame) -> AnyDataFrame:
+        """
+        Drop rows of a staged DataFrame not meeting data quality
+        expectations.
 
+        Parameters
+        ----------
+        df:
+            Staged DataFrame
+
+        Returns
+        -------
+        :
+            Output DataFrame
+        """
+        kfilter, _ = self._get_expectations_filters()
         if kfilter is not None:
             logger.info("Dropping invalid rows")
-            self._output_df = self._stage_df.filter(kfilter)
-        else:
-            self._output_df = self._stage_df
+            df = df.filter(kfilter)
+        return df
+
+    def filter_quarantine_df(self, df: AnyDataFrame) -> AnyDataFrame:
+        """
+        Select rows of a staged DataFrame not meeting data quality
+        expectations.
+
+        Parameters
+        ----------
+        df:
+            Staged DataFrame
+
+        Returns
+        -------
+        :
+            Quarantine DataFrame
+        """
+        _, qfilter = self._get_expectations_filters()
+        if qfilter is not None:
+            logger.info("Building quarantine DataFrame")
+            return df.filter(qfilter)
+        return df.filter("False")
@@ -1,6 +1,32 @@
-import laktory.models.resources.databricks
-import laktory.models.resources.providers
-from laktory.models.resources.baseresource import BaseResource
-from laktory.models.resources.providers import *
-from laktory.models.resources.pulumiresource import PulumiResource
-from laktory.models.resources.terraformresource import TerraformResource
+from typing import TYPE_CHECKING
+
+from laktory._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "baseresource",
+        "databricks",
+        "providers",
+        "pulumiresource",
+        "terraformresource",
+    ],
+    attributes={
+        "AWSProvider": ".providers",
+        "AzureProvider": ".providers",
+        "AzurePulumiProvider": ".providers",
+        "BaseResource": ".baseresource",
+        "DatabricksProvider": ".providers",
+        "PulumiResource": ".pulumiresource",
+        "TerraformResource": ".terraformresource",
+    },
+)
+
+if TYPE_CHECKING:
+    from .baseresource import BaseResource
+    from .providers import AWSProvider
+    from .providers import AzureProvider
+    from .providers import AzurePulumiProvider
+    from .providers import DatabricksProvider
+    from .pulumiresource import PulumiResource
+    from .terraformresource import TerraformResource
@@ -137,9 +137,7 @@ class BaseResource(_BaseModel):
 
         for fname, f in cls.model_fields.items():
             if f.is_required():
-                # Since all field type hints include `var`, we need to isolate
-                # intended type hint
-                ann = get_args(f.annotation)[0]
+                ann = f.annotation
                 origin = get_origin(ann)
                 args = get_args(ann)
 
@@ -147,7 +145,7 @@ class BaseResource(_BaseModel):
                     data[fname] = ""
                 elif origin == Literal:
                     data[fname] = args[0]
-                elif str(f.annotation).startswith("list"):
+                elif origin is list:
                     data[fname] = []
 
         for k, v in cls.lookup_defaults().items():
@@ -1,40 +1,91 @@
-from .accesscontrol import AccessControl
-from .alert import Alert
-from .catalog import Catalog
-from .cluster import Cluster
-from .clusterpolicy import ClusterPolicy
-from .dashboard import Dashboard
-from .dbfsfile import DbfsFile
-from .directory import Directory
-from .dltpipeline import DLTPipeline
-from .externallocation import ExternalLocation
-from .grants import Grants
-from .group import Group
-from .job import Job
-from .metastore import Metastore
-from .metastoreassignment import MetastoreAssignment
-from .metastoredataaccess import MetastoreDataAccess
-from .mlflowexperiment import MLflowExperiment
-from .mlflowmodel import MLflowModel
-from .mlflowwebhook import MLflowWebhook
-from .mwsnccbinding import MwsNccBinding
-from .mwsnetworkconnectivityconfig import MwsNetworkConnectivityConfig
-from .mwspermissionassignment import MwsPermissionAssignment
-from .notebook import Notebook
-from .permissions import Permissions
-from .query import Query
-from .repo import Repo
-from .schema import Schema
-from .secret import Secret
-from .secretacl import SecretAcl
-from .secretscope import SecretScope
-from .serviceprincipal import ServicePrincipal
-from .serviceprincipalrole import ServicePrincipalRole
-from .table import Table
-from .user import User
-from .userrole import UserRole
-from .vectorsearchendpoint import VectorSearchEndpoint
-from .vectorsearchindex import VectorSearchIndex
-from .volume import Volume
-from .warehouse import Warehouse
-from .workspacefile import WorkspaceFile
+from typing import TYPE_CHECKING
+
+from laktory._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "AccessControl": ".accesscontrol",
+        "Alert": ".alert",
+        "Catalog": ".catalog",
+        "Cluster": ".cluster",
+        "ClusterPolicy": ".clusterpolicy",
+        "Dashboard": ".dashboard",
+        "DbfsFile": ".dbfsfile",
+        "Directory": ".directory",
+        "DLTPipeline": ".dltpipeline",
+        "ExternalLocation": ".externallocation",
+        "Grants": ".grants",
+        "Group": ".group",
+        "Job": ".job",
+        "Metastore": ".metastore",
+        "MetastoreAssignment": ".metastoreassignment",
+        "MetastoreDataAccess": ".metastoredataaccess",
+        "MLflowExperiment": ".mlflowexperiment",
+        "MLflowModel": ".mlflowmodel",
+        "MLflowWebhook": ".mlflowwebhook",
+        "MwsNccBinding": ".mwsnccbinding",
+        "MwsNetworkConnectivityConfig": ".mwsnetworkconnectivityconfig",
+        "MwsPermissionAssignment": ".mwspermissionassignment",
+        "Notebook": ".notebook",
+        "Permissions": ".permissions",
+        "Query": ".query",
+        "Repo": ".repo",
+        "Schema": ".schema",
+        "Secret": ".secret",
+        "SecretAcl": ".secretacl",
+        "SecretScope": ".secretscope",
+        "ServicePrincipal": ".serviceprincipal",
+        "ServicePrincipalRole": ".serviceprincipalrole",
+        "Table": ".table",
+        "User": ".user",
+        "UserRole": ".userrole",
+        "VectorSearchEndpoint": ".vectorsearchendpoint",
+        "VectorSearchIndex": ".vectorsearchindex",
+        "Volume": ".volume",
+        "Warehouse": ".warehouse",
+        "WorkspaceFile": ".workspacefile",
+    },
+)
+
+if TYPE_CHECKING:
+    from .accesscontrol import AccessControl
+    from .alert import Alert
+    from .catalog import Catalog
+    from .cluster import Cluster
+    from .clusterpolicy import ClusterPolicy
+    from .dashboard import Dashboard
+    from .dbfsfile import DbfsFile
+    from .directory import Directory
+    from .dltpipeline import DLTPipeline
+    from .externallocation import ExternalLocation
+    from .grants import Grants
+    from .group import Group
+    from .job import Job
+    from .metastore import Metastore
+    from .metastoreassignment import MetastoreAssignment
+    from .metastoredataaccess import MetastoreDataAccess
+    from .mlflowexperiment import MLflowExperiment
+    from .mlflowmodel import MLflowModel
+    from .mlflowwebhook import MLflowWebhook
+    from .mwsnccbinding import MwsNccBinding
+    from .mwsnetworkconnectivityconfig import MwsNetworkConnectivityConfig
+    from .mwspermissionassignment import MwsPermissionAssignment
+    from .notebook import Notebook
+    from .permissions import Permissions
+    from .query import Query
+    from .repo import Repo
+    from .schema import Schema
+    from .secret import Secret
+    from .secretacl import SecretAcl
+    from .secretscope import SecretScope
+    from .serviceprincipal import ServicePrincipal
+    from .serviceprincipalrole import ServicePrincipalRole
+    from .table import Table
+    from .user import User
+    from .userrole import UserRole
+    from .vectorsearchendpoint import VectorSearchEndpoint
+    from .vectorsearchindex import VectorSearchIndex
+    from .volume import Volume
+    from .warehouse import Warehouse
+    from .workspacefile import WorkspaceFile
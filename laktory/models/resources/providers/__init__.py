@@ -1,4 +1,19 @@
-from .awsprovider import AWSProvider
-from .azureprovider import AzureProvider
-from .azurepulumiprovider import AzurePulumiProvider
-from .databricksprovider import DatabricksProvider
+from typing import TYPE_CHECKING
+
+from laktory._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "AWSProvider": ".awsprovider",
+        "AzureProvider": ".azureprovider",
+        "AzurePulumiProvider": ".azurepulumiprovider",
+        "DatabricksProvider": ".databricksprovider",
+    },
+)
+
+if TYPE_CHECKING:
+    from .awsprovider import AWSProvider
+    from .azureprovider import AzureProvider
+    from .azurepulumiprovider import AzurePulumiProvider
+    from .databricksprovider import DatabricksProvider
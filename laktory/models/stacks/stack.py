@@ -3,6 +3,7 @@ from typing import Any
 from typing import Literal
 from typing import Union
 
+from pydantic import Field
 from pydantic import model_validator
 
 from laktory._logger import get_logger
@@ -293,7 +294,7 @@ class EnvironmentStack(BaseModel):
     name: str
     organization: str = None
     pulumi: Pulumi = Pulumi()
-    resources: Union[StackResources, None] = StackResources()
+    resources: Union[StackResources, None] = Field(default_factory=StackResources)
     settings: LaktorySettings = None
     terraform: Terraform = Terraform()
     variables: dict[str, Any] = {}
@@ -431,7 +432,7 @@ class Stack(BaseModel):
     name: str
     organization: Union[str, None] = None
     pulumi: Pulumi = Pulumi()
-    resources: Union[StackResources, None] = StackResources()
+    resources: Union[StackResources, None] = Field(default_factory=StackResources)
     settings: LaktorySettings = None
     terraform: Terraform = Terraform()
     variables: dict[str, Any] = {}
@@ -2,12 +2,15 @@ from functools import wraps
 
 import polars as pl
 
+from laktory.polars.dataframe.flatten import flatten
 from laktory.polars.dataframe.groupby_and_agg import groupby_and_agg
 from laktory.polars.dataframe.has_column import has_column
+from laktory.polars.dataframe.sample import sample
 from laktory.polars.dataframe.schema_flat import schema_flat
 from laktory.polars.dataframe.signature import signature
 from laktory.polars.dataframe.smart_join import smart_join
 from laktory.polars.dataframe.union import union
+from laktory.polars.dataframe.union_by_name import union_by_name
 from laktory.polars.dataframe.window_filter import window_filter
 
 
@@ -16,6 +19,10 @@ class LaktoryDataFrame:  # noqa: F811
     def __init__(self, df: pl.DataFrame):
         self._df = df
 
+    @wraps(flatten)
+    def flatten(self, *args, **kwargs):
+        return flatten(self._df, *args, **kwargs)
+
     @wraps(groupby_and_agg)
     def groupby_and_agg(self, *args, **kwargs):
         return groupby_and_agg(self._df, *args, **kwargs)
@@ -24,6 +31,10 @@ class LaktoryDataFrame:  # noqa: F811
     def has_column(self, *args, **kwargs):
         return has_column(self._df, *args, **kwargs)
 
+    @wraps(sample)
+    def sample(self, *args, **kwargs):
+        return sample(self._df, *args, **kwargs)
+
     @wraps(signature)
     def signature(self, *args, **kwargs):
         return signature(self._df, *args, **kwargs)
@@ -40,6 +51,10 @@ class LaktoryDataFrame:  # noqa: F811
     def union(self, *args, **kwargs):
         return union(self._df, *args, **kwargs)
 
+    @wraps(union_by_name)
+    def union_by_name(self, *args, **kwargs):
+        return union_by_name(self._df, *args, **kwargs)
+
     @wraps(window_filter)
     def window_filter(self, *args, **kwargs):
         return window_filter(self._df, *args, **kwargs)
@@ -50,6 +65,10 @@ class LaktoryDataFrame:  # noqa: F811
     def __init__(self, df: pl.LazyFrame):
         self._df = df
 
+    @wraps(flatten)
+    def flatten(self, *args, **kwargs):
+        return flatten(self._df, *args, **kwargs)
+
     @wraps(groupby_and_agg)
     def groupby_and_agg(self, *args, **kwargs):
         return groupby_and_agg(self._df, *args, **kwargs)
@@ -58,6 +77,10 @@ class LaktoryDataFrame:  # noqa: F811
     def has_column(self, *args, **kwargs):
         return has_column(self._df, *args, **kwargs)
 
+    @wraps(sample)
+    def sample(self, *args, **kwargs):
+        return sample(self._df, *args, **kwargs)
+
     @wraps(signature)
     def signature(self, *args, **kwargs):
         return signature(self._df, *args, **kwargs)
@@ -74,6 +97,10 @@ class LaktoryDataFrame:  # noqa: F811
     def union(self, *args, **kwargs):
         return union(self._df, *args, **kwargs)
 
+    @wraps(union_by_name)
+    def union_by_name(self, *args, **kwargs):
+        return union_by_name(self._df, *args, **kwargs)
+
     @wraps(window_filter)
     def window_filter(self, *args, **kwargs):
         return window_filter(self._df, *args, **kwargs)
@@ -0,0 +1,154 @@
+import fnmatch
+from typing import Union
+
+import polars as pl
+
+
+def flatten(
+    df: pl.DataFrame,
+    columns: Union[str, list[str]] = None,
+    include: list[str] = None,
+    exclude: list[str] = None,
+    separator: str = None,
+    max_depth: int = None,
+    explode: Union[str, list[str]] = None,
+) -> pl.DataFrame:
+    """
+    Expand struct columns into top-level columns. All fields are selected in a
+    single projection, so that only the selected nested fields are read from
+    the source (projection pushdown). Exploded array of structs are expanded
+    in a second projection.
+
+    Parameters
+    ----------
+    df:
+        Input DataFrame
+    columns:
+        Struct column(s) to expand. If `None`, all struct columns are expanded.
+    include:
+        Glob patterns of the (dot separated) fields paths to keep. Fields of
+        exploded structs are referenced from the path of the exploded column
+        (ex.: `data.prices.open`). Other columns are not affected.
+    exclude:
+        Glob patterns of the (dot separated) fields paths to drop. Other
+        columns are not affected.
+    separator:
+        If `None`, output columns are named after the fields names. Otherwise,
+        output columns are named after the fields paths joined with the
+        separator.
+    max_depth:
+        Maximum number of struct levels to expand. If `None`, nested structs
+        are fully expanded.
+    explode:
+        Output column(s) to explode. Empty or null lists result in a null row.
+        Exploded array of structs are expanded as well.
+
+    Returns
+    -------
+    :
+        Output DataFrame
+
+    Examples
+    --------
+    ```py
+    import polars as pl
+
+    import laktory  # noqa: F401
+
+    df = pl.DataFrame(
+        {
+            "name": ["stock_price"],
+            "data": [
+                {
+                    "symbol": "AAPL",
+                    "_created_at": "2023-09-01",
+                    "prices": [{"open": 1, "close": 2}, {"open": 3, "close": 4}],
+                }
+            ],
+        }
+    )
+
+    df = df.laktory.flatten(columns="data", exclude=["data._*"], explode="prices")
+    print(df.glimpse(return_as_string=True))
+    '''
+    Rows: 2
+    Columns: 4
+    $ name   <str> 'stock_price', 'stock_price'
+    $ symbol <str> 'AAPL', 'AAPL'
+    $ open   <i64> 1, 3
+    $ close  <i64> 2, 4
+    '''
+    ```
+    """
+    if isinstance(columns, str):
+        columns = [columns]
+    if isinstance(explode, str):
+        explode = [explode]
+
+    paths = {name: (name,) for name in df.collect_schema().names()}
+    df, paths = _flatten(df, columns, paths, include, exclude, separator, max_depth)
+
+    if explode:
+        # Fields of exploded structs keep the path of their parent
+        explode_paths = {c: paths[c] for c in explode}
+        for c in explode:
+            # Empty lists are exploded as null, consistently across Polars
+            # versions and with Spark `explode_outer`
+            df = df.with_columns(
+                pl.when(pl.col(c).list.len() > 0).then(pl.col(c)).alias(c)
+            ).explode(c)
+        schema = df.collect_schema()
+        structs = [c for c in explode if isinstance(schema[c], pl.Struct)]
+        if structs:
+            paths = {c: explode_paths.get(c, (c,)) for c in schema.names()}
+            df, _ = _flatten(df, structs, paths, include, exclude, separator, max_depth)
+
+    return df
+
+
+def _flatten(df, columns, paths, include, exclude, separator, max_depth):
+    """Expand `columns` and return output DataFrame and columns paths"""
+
+    def _is_selected(path):
+        path = ".".join(path)
+        # Parents of included paths are kept so that they can be exploded
+        if include and not any(
+            fnmatch.fnmatch(path, p) or p.startswith(path + ".") for p in include
+        ):
+            return False
+        if exclude and any(fnmatch.fnmatch(path, p) for p in exclude):
+            return False
+        return True
+
+    def _get_fields(expr, dtype, path, depth):
+        if not isinstance(dtype, pl.Struct) or depth == max_depth:
+            return [(path, expr)] if _is_selected(path) else []
+        fields = []
+        for f in dtype.fields:
+            _expr = expr.struct.field(f.name)
+            fields += _get_fields(_expr, f.dtype, path + (f.name,), depth + 1)
+        return fields
+
+    schema = df.collect_schema()
+    if columns is None:
+        columns = [c for c, t in schema.items() if isinstance(t, pl.Struct)]
+
+    exprs = []
+    _paths = {}
+    for name, dtype in schema.items():
+        fields = [(paths[name], pl.col(name))]
+        if name in columns:
+            fields = _get_fields(pl.col(name), dtype, paths[name], 0)
+
+        for path, expr in fields:
+            _name = name
+            if name in columns:
+                _name = path[-1] if separator is None else separator.join(path)
+            if _name in _paths:
+                raise ValueError(
+                    f"Column '{_name}' is duplicated. Set `separator` or `exclude` to prevent conflicts."
+                )
+            exprs += [expr.alias(_name)]
+            _paths[_name] = path
+
+    return df.select(exprs), _paths
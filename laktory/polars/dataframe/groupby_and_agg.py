@@ -1,6 +1,11 @@
+import re
+from datetime import timedelta
 from typing import Any
+from typing import Union
 
 import polars as pl
+from pydantic import BaseModel
+from pydantic import model_validator
 
 from laktory._logger import get_logger
 
@@ -9,19 +14,115 @@ from laktory._logger import get_logger
 
 logger = get_logger(__name__)
 
+DURATION_UNITS = {
+    "us": ["microsecond", "microseconds", "us"],
+    "ms": ["millisecond", "milliseconds", "ms"],
+    "s": ["second", "seconds", "sec", "secs", "s"],
+    "m": ["minute", "minutes", "min", "mins", "m"],
+    "h": ["hour", "hours", "h"],
+    "d": ["day", "days", "d"],
+    "w": ["week", "weeks", "w"],
+}
+
+
+class TimeWindow(BaseModel):
+    """
+    Specifications for Time Window Aggregation
+
+    Attributes
+    ----------
+    time_column:
+        Timestamp column used for grouping rows
+    window_duration:
+        Duration of the window e.g. ‘1 second’, ‘1 day 12 hours’, ‘2 minutes’.
+        Polars durations (‘1d12h’) are also supported.
+    slide_duration
+        Duration of the slide. If a slide is smaller than the window, windows
+        are overlapping
+    start_time
+        Offset with respect to 1970-01-01 00:00:00 UTC with which to start
+        window intervals.
+    rolling:
+        If `True`, a window of `window_duration` ending at each row is used
+        instead of fixed windows. Output has one row per input row.
+    is_sorted:
+        If `True`, rows are assumed to be sorted by `time_column` and are not
+        sorted before the aggregation.
+
+    References
+    ----------
+
+    * [polars group_by_dynamic](https://docs.pola.rs/api/python/stable/reference/dataframe/api/polars.DataFrame.group_by_dynamic.html)
+    * [polars rolling](https://docs.pola.rs/api/python/stable/reference/dataframe/api/polars.DataFrame.rolling.html)
+    """
+
+    time_column: str
+    window_duration: str
+    slide_duration: Union[str, None] = None
+    start_time: Union[str, None] = None
+    rolling: bool = False
+    is_sorted: bool = False
+
+    @model_validator(mode="after")
+    def rolling_options(self) -> Any:
+        if self.rolling and (self.slide_duration or self.start_time):
+            raise ValueError(
+                "`slide_duration` and `start_time` are not supported with `rolling` windows"
+            )
+        return self
+
+
+def _parse_duration(duration: str) -> timedelta:
+    """
+    Convert Spark (‘1 day 12 hours’) or Polars (‘1d12h’) duration string to
+    timedelta.
+    """
+    units = {v: k for k, values in DURATION_UNITS.items() for v in values}
+    tokens = re.findall(r"(-?\d+)\s*([a-zA-Z]+)", duration)
+    if not tokens or re.sub(r"(-?\d+)\s*([a-zA-Z]+)|\s", "", duration):
+        raise ValueError(f"Duration '{duration}' is not supported.")
+
+    td = timedelta()
+    for value, unit in tokens:
+        unit = units.get(unit.lower())
+        if unit is None:
+            raise ValueError(f"Duration '{duration}' is not supported.")
+        td += {
+            "us": timedelta(microseconds=1),
+            "ms": timedelta(milliseconds=1),
+            "s": timedelta(seconds=1),
+            "m": timedelta(minutes=1),
+            "h": timedelta(hours=1),
+            "d": timedelta(days=1),
+            "w": timedelta(weeks=1),
+        }[unit] * int(value)
+    return td
+
+
+def _is_sorted(df, column: str) -> bool:
+    if isinstance(df, pl.LazyFrame):
+        return False
+    s = df[column]
+    return s.flags["SORTED_ASC"] or s.is_sorted()
+
 
 def groupby_and_agg(
     df,
+    groupby_window: TimeWindow = None,
     groupby_columns: list[str] = None,
     agg_expressions: list[Any] = None,
 ) -> pl.DataFrame:
     """
-    Apply a groupby and create aggregation columns.
+    Apply a groupby and create aggregation columns. When a `groupby_window`
+    is provided, rows are grouped by time windows (`group_by_dynamic`) or,
+    for rolling windows, by the window ending at each row (`rolling`).
 
     Parameters
     ----------
     df:
         DataFrame
+    groupby_window:
+        Aggregation window definition
     groupby_columns:
         List of column names to group by
     agg_expressions:
@@ -59,17 +160,48 @@ def groupby_and_agg(
     $ symbol     <str> 'AAPL'
     $ mean_price <f64> 202.5
     '''
+
+    df = df0.laktory.groupby_and_agg(
+        groupby_window={
+            "time_column": "tstamp",
+            "window_duration": "1 day",
+        },
+        agg_expressions=[
+            {
+                "name": "mean_price",
+                "expr": "pl.col('price').mean()",
+            },
+        ],
+    )
+
+    print(df.unnest("window").glimpse(return_as_string=True))
+    '''
+    Rows: 2
+    Columns: 3
+    $ start      <datetime[μs]> 2023-09-01 00:00:00, 2023-09-02 00:00:00
+    $ end        <datetime[μs]> 2023-09-02 00:00:00, 2023-09-03 00:00:00
+    $ mean_price          <f64> 200.0, 205.0
+    '''
     ```
+
+    References
+    ----------
+
+    * [polars group_by_dynamic](https://docs.pola.rs/api/python/stable/reference/dataframe/api/polars.DataFrame.group_by_dynamic.html)
     """
     from laktory.models.transformers.basechainnode import ChainNodeColumn
 
     # Parse inputs
+    if groupby_window and not isinstance(groupby_window, TimeWindow):
+        groupby_window = TimeWindow(**groupby_window)
     if agg_expressions is None:
         raise ValueError("`agg_expressions` must be specified")
     if groupby_columns is None:
         groupby_columns = []
 
-    logger.info(f"Executing groupby ({groupby_columns}) with {agg_expressions}")
+    logger.info(
+        f"Executing groupby ({groupby_window} & {groupby_columns}) with {agg_expressions}"
+    )
 
     # Groupby arguments
     groupby = []
@@ -86,4 +218,66 @@ def groupby_and_agg(
         expr.type = None
         aggs += [expr.eval(dataframe_backend="POLARS").alias(expr.name)]
 
-    return df.group_by(groupby).agg(*aggs)
+    if groupby_window is None:
+        return df.group_by(groupby).agg(*aggs)
+
+    return _groupby_window_and_agg(df, groupby_window, groupby, aggs)
+
+
+def _groupby_window_and_agg(
+    df, window: TimeWindow, groupby: list[str], aggs: list[pl.Expr]
+) -> pl.DataFrame:
+    time_column = window.time_column
+
+    # Time column
+    dtype = df.collect_schema()[time_column]
+    if dtype == pl.String:
+        df = df.with_columns(pl.col(time_column).str.to_datetime())
+    elif dtype == pl.Date:
+        df = df.with_columns(pl.col(time_column).cast(pl.Datetime))
+
+    # Windows require rows sorted by time (within each group)
+    if window.is_sorted or _is_sorted(df, time_column):
+        df = df.with_columns(pl.col(time_column).set_sorted())
+    else:
+        df = df.sort(time_column)
+
+    group_by = groupby or None
+    period = _parse_duration(window.window_duration)
+
+    if window.rolling:
+        df = df.rolling(time_column, period=period, group_by=group_by).agg(*aggs)
+        columns = [time_column] + groupby
+        return df.select(columns + [c for c in df.collect_schema() if c not in columns])
+
+    every = period
+    if window.slide_duration:
+        every = _parse_duration(window.slide_duration)
+    offset = timedelta()
+    if window.start_time:
+        offset = _parse_duration(window.start_time)
+
+    # Windows are aligned on multiples of `every` (shifted by `start_time`).
+    # Starting windows early ensures that the windows overlapping the first
+    # rows are included. Windows without rows are not returned.
+    n = -(-period // every)
+    offset = (offset % every) - n * every
+
+    df = df.group_by_dynamic(
+        time_column,
+        every=every,
+        period=period,
+        offset=offset,
+        closed="left",
+        label="left",
+        start_by="window",
+        group_by=group_by,
+    ).agg(*aggs)
+
+    window_column = pl.struct(
+        pl.col(time_column).alias("start"),
+        (pl.col(time_column) + period).alias("end"),
+    ).alias("window")
+    aggs_columns = [c for c in df.collect_schema() if c not in groupby + [time_column]]
+
+    return df.select([window_column] + groupby + aggs_columns)
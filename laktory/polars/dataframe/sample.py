@@ -0,0 +1,63 @@
+import random
+from typing import Union
+
+import polars as pl
+
+AnyFrame = Union[pl.DataFrame, pl.LazyFrame]
+
+HASH_MAX = 2**64 - 1
+
+
+def sample(
+    df: AnyFrame,
+    fraction: float,
+    seed: int = None,
+) -> AnyFrame:
+    """
+    Return a sampled subset of the rows. Each row is independently kept by
+    comparing the seeded hash of its index to a threshold (Bernoulli
+    sampling), which makes the sample deterministic for a given seed and
+    allows LazyFrames to stay lazy (and compatible with the streaming
+    engine). Samples are not guaranteed to be identical across Polars
+    versions.
+
+    Parameters
+    ----------
+    df:
+        Input DataFrame
+    fraction:
+        Expected fraction of rows to keep, between 0 and 1.
+    seed:
+        Seed of the rows hash. If `None`, a random seed is used.
+
+    Returns
+    -------
+    :
+        Output DataFrame
+
+    Examples
+    --------
+    ```py
+    import polars as pl
+
+    import laktory  # noqa: F401
+
+    df0 = pl.DataFrame({"x": range(1000)})
+
+    df = df0.lazy().laktory.sample(fraction=0.1, seed=42).collect()
+    print(df.height < df0.height)
+    # > True
+    ```
+    """
+    if not 0 <= fraction <= 1:
+        raise ValueError(f"`fraction` must be between 0 and 1, got {fraction}")
+
+    if fraction == 1:
+        return df
+
+    if seed is None:
+        seed = random.randrange(2**32)
+
+    threshold = min(int(fraction * 2**64), HASH_MAX)
+    h = pl.int_range(pl.len(), dtype=pl.UInt64).hash(seed=seed)
+    return df.filter(h < pl.lit(threshold, dtype=pl.UInt64))
@@ -0,0 +1,90 @@
+from typing import Union
+
+import polars as pl
+
+AnyFrame = Union[pl.DataFrame, pl.LazyFrame]
+
+
+def union_by_name(
+    df: AnyFrame,
+    *others: Union[AnyFrame, list[AnyFrame]],
+    allow_missing_columns: bool = True,
+) -> AnyFrame:
+    """
+    Return a new DataFrame containing the union of rows in this and other
+    DataFrames, resolving columns by name. Columns order may differ, missing
+    columns are filled with nulls and columns with different types are cast
+    to their supertype. The concatenation is done in parallel, without
+    rechunking, and stays lazy (and compatible with the streaming engine)
+    when `df` is a LazyFrame.
+
+    Parameters
+    ----------
+    df:
+        Input DataFrame
+    others:
+        Other DataFrame(s) or list(s) of DataFrames
+    allow_missing_columns:
+        If `False`, an exception is raised when DataFrames don't have the same
+        set of columns.
+
+    Returns
+    -------
+    :
+        Output DataFrame
+
+    Examples
+    --------
+    ```py
+    import polars as pl
+
+    import laktory  # noqa: F401
+
+    df0 = pl.DataFrame(
+        {
+            "symbol": ["AAPL", "AAPL"],
+            "price": [200, 205],
+        }
+    )
+    df1 = pl.DataFrame(
+        {
+            "price": [135.5],
+            "symbol": ["GOOGL"],
+            "tstamp": ["2023-09-01"],
+        }
+    )
+
+    df = df0.laktory.union_by_name(df1)
+    print(df.glimpse(return_as_string=True))
+    '''
+    Rows: 3
+    Columns: 3
+    $ symbol <str> 'AAPL', 'AAPL', 'GOOGL'
+    $ price  <f64> 200.0, 205.0, 135.5
+    $ tstamp <str> None, None, '2023-09-01'
+    '''
+    ```
+    """
+    is_lazy = isinstance(df, pl.LazyFrame)
+
+    dfs = [df]
+    for other in others:
+        if not isinstance(other, (list, tuple)):
+            other = [other]
+        for _df in other:
+            if is_lazy and isinstance(_df, pl.DataFrame):
+                _df = _df.lazy()
+            elif not is_lazy and isinstance(_df, pl.LazyFrame):
+                _df = _df.collect()
+            dfs += [_df]
+
+    if not allow_missing_columns:
+        columns = set(df.collect_schema().names())
+        for _df in dfs[1:]:
+            _columns = set(_df.collect_schema().names())
+            if _columns != columns:
+                raise ValueError(
+                    f"Union requires the same columns. Missing columns: {sorted(columns ^ _columns)}"
+                )
+
+    return pl.concat(dfs, how="diagonal_relaxed", rechunk=False, parallel=True)
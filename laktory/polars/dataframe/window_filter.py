@@ -8,11 +8,43 @@ from laktory._logger import get_logger
 logger = get_logger(__name__)
 
 
+TOP_K_MAX_ROWS = 10
+
+
 class OrderBy(BaseModel):
     sql_expression: str
     desc: bool = False
 
 
+def _select_top_k(
+    df, partition_by: list[str], bys: list[str], descs: list[bool], k: int
+) -> pl.DataFrame:
+    """
+    Select the `k` first rows of each window with a partial selection
+    (`top_k_by`) instead of a full sort. Rows order is preserved.
+    """
+    index = "__window_filter_index"
+
+    # Nulls are sorted first, as with `sort_by`
+    by = []
+    reverse = []
+    for b, desc in zip(bys, descs):
+        by += [pl.col(b).is_null(), pl.col(b)]
+        reverse += [False, not desc]
+
+    # Ties are broken by rows order, as with a stable sort
+    by += [pl.col(index)]
+    reverse += [True]
+
+    df = df.with_row_index(index)
+    keep = (
+        df.group_by(partition_by)
+        .agg(pl.col(index).top_k_by(by, k=k, reverse=reverse))
+        .select(pl.col(index).explode())
+    )
+    return df.join(keep, on=index, how="semi").sort(index).drop(index)
+
+
 def window_filter(
     df,
     partition_by: Union[list[str], None],
@@ -37,8 +69,9 @@ def window_filter(
     row_index_name:
         Group-specific and sorted rows index name
     rows_to_keep:
-        How many rows to keep per window
-
+        How many rows to keep per window. When `order_by` is specified and
+        `rows_to_keep` is small (<= 10), the top rows of each window are
+        selected before being numbered, avoiding a full sort of each window.
 
     Examples
     --------
@@ -97,7 +130,13 @@ def window_filter(
                 o = OrderBy(**o)
             bys += [o.sql_expression]
             descs += [o.desc]
-        e = e.sort_by(by=bys, descending=descs)
+        # Rank of each row in the sorted window (ties keep rows order)
+        e = pl.arg_sort_by(bys, descending=descs, maintain_order=True)
+        e = (e.arg_sort() + 1).cast(pl.UInt32)
+
+        # Only the top rows of each window need to be numbered
+        if partition_by and rows_to_keep <= TOP_K_MAX_ROWS:
+            df = _select_top_k(df, partition_by, bys, descs, rows_to_keep)
 
     # Partition By
     e = e.over(*partition_by)
@@ -1,3 +1,10 @@
+import hashlib
+import os
+import time
+import uuid as _uuid
+from typing import Literal
+from typing import Union
+
 import polars as pl
 
 __all__ = [
@@ -5,6 +12,8 @@ __all__ = [
     "uuid",
 ]
 
+_VARIANTS = dict(zip("0123456789abcdef", "89ab89ab89ab89ab"))
+
 
 # --------------------------------------------------------------------------- #
 # string_split                                                                #
@@ -62,9 +71,32 @@ def string_split(
 # --------------------------------------------------------------------------- #
 
 
-def uuid() -> pl.Expr:
+def uuid(
+    columns: list[Union[str, pl.Expr]] = None,
+    version: Literal[4, 5, 7] = None,
+    namespace: str = str(_uuid.NAMESPACE_URL),
+) -> pl.Expr:
     """
-    Create a unique id for each row.
+    Create a unique id for each row. Random bytes are generated in bulk for
+    each batch of rows and formatted with vectorized string operations.
+
+    - version 4: random UUID
+    - version 7: UUID starting with the Unix timestamp (ms) of the batch
+      generation, followed by random bits. Ids are sortable by generation
+      time across batches.
+    - version 5: deterministic UUID computed from the SHA-1 hash of the
+      `columns` values (joined with `|`), identical to
+      `uuid.uuid5(namespace, value)`. Useful for idempotent reprocessing.
+
+    Parameters
+    ----------
+    columns:
+        Key columns of the deterministic (version 5) UUID. Null values are
+        replaced with an empty string.
+    version:
+        UUID version. Default to 5 when `columns` are provided, 4 otherwise.
+    namespace:
+        Namespace of the deterministic (version 5) UUID
 
     Returns
     -------
@@ -79,13 +111,91 @@ def uuid() -> pl.Expr:
     import laktory  # noqa: F401
 
     df = pl.DataFrame({"id": [0, 1, 2]})
-    df = df.with_columns(uuid=pl.Expr.laktory.uuid())
+    df = df.with_columns(
+        uuid=pl.Expr.laktory.uuid(),
+        uuid7=pl.Expr.laktory.uuid(version=7),
+        key=pl.Expr.laktory.uuid(columns=["id"]),
+    )
+    print(df["key"].to_list())
+    # > ['035c4ea0-d73b-5bde-bd6f-c806b04f2ec3', 'b80c8fef-a677-5340-85fb-2c162d75df03', '334b6b31-12a2-5bfc-bf4f-870c0954b343']
     ```
     """
+    if version is None:
+        version = 4 if columns is None else 5
+
+    if version == 5:
+        if columns is None:
+            raise ValueError("Version 5 UUID requires key `columns`.")
+        if not isinstance(columns, (list, tuple)):
+            columns = [columns]
+        columns = [pl.col(c) if isinstance(c, str) else c for c in columns]
+        key = pl.concat_str(
+            [c.cast(pl.String).fill_null("") for c in columns], separator="|"
+        )
+        namespace = _uuid.UUID(str(namespace)).bytes
+
+        def _generate(s: pl.Series) -> pl.Series:
+            return _format_uuid(_hash_hex(s, namespace), version=5)
+
+        return key.map_batches(_generate, return_dtype=pl.String, is_elementwise=True)
+
+    if columns is not None:
+        raise ValueError(
+            f"Key `columns` are not supported with version {version} UUID."
+        )
+
+    if version not in [4, 7]:
+        raise ValueError(f"UUID version {version} is not supported.")
+
+    def _generate(s: pl.Series) -> pl.Series:
+        return _format_uuid(_random_hex(len(s)), version=version)
+
+    return pl.first().map_batches(
+        _generate, return_dtype=pl.String, is_elementwise=True
+    )
+
+
+def _random_hex(n: int) -> pl.Series:
+    """Series of `n` random 32-characters hexadecimal strings"""
+    h = os.urandom(16 * n).hex()
+    return pl.Series([h[i : i + 32] for i in range(0, 32 * n, 32)], dtype=pl.String)
+
 
-    def generate_uuid():
-        import uuid
+def _hash_hex(s: pl.Series, namespace: bytes) -> pl.Series:
+    """Series of SHA-1 hexadecimal digests of namespace + value"""
+    return pl.Series(
+        [hashlib.sha1(namespace + v.encode()).hexdigest() for v in s],
+        dtype=pl.String,
+    )
 
-        return str(uuid.uuid4())
 
-    return pl.first().map_elements(lambda _: generate_uuid(), return_dtype=pl.Utf8)
+def _format_uuid(values: pl.Series, version: int) -> pl.Series:
+    """
+    Format hexadecimal strings as UUIDs, setting version and variant bits
+    with vectorized string operations.
+    """
+    h = pl.col("h")
+
+    prefix = [h.str.slice(0, 8), h.str.slice(8, 4)]
+    if version == 7:
+        ts = f"{time.time_ns() // 1_000_000:012x}"
+        prefix = [pl.lit(ts[:8]), pl.lit(ts[8:])]
+
+    # Variant bits `10`: first character of the 4th group in [89ab]
+    variant = h.str.slice(16, 1).replace_strict(_VARIANTS, return_dtype=pl.String)
+
+    return (
+        values.to_frame("h")
+        .select(
+            pl.concat_str(
+                prefix
+                + [
+                    pl.lit(str(version)) + h.str.slice(13, 3),
+                    variant + h.str.slice(17, 3),
+                    h.str.slice(20, 12),
+                ],
+                separator="-",
+            )
+        )
+        .to_series()
+    )
@@ -1,5 +1,8 @@
+from typing import Union
+
 import polars as pl
-from planck import units
+
+from laktory._units import get_conversion
 
 __all__ = [
     "convert_units",
@@ -12,17 +15,20 @@ __all__ = [
 
 
 def convert_units(
-    x: pl.Expr,
+    x: Union[pl.Expr, str, list[str]],
     input_unit: str,
     output_unit: str,
 ) -> pl.Expr:
     """
-    Units conversion
+    Units conversion. The conversion is resolved once, for each pair of units,
+    as a scale and an offset and applied as a single multiply-add expression.
+    Multiple columns can be converted at once by selecting them with the
+    input expression.
 
     Parameters
     ----------
     x:
-        Input column
+        Input column(s) expression or name(s)
     input_unit:
         Input units
     output_unit:
@@ -51,10 +57,29 @@ def convert_units(
     $ x <f64> 1.0
     $ y <f64> 3.280839895013124
     '''
+
+    df = pl.DataFrame({"x": [0.0], "y": [100.0]})
+    df = df.with_columns(
+        pl.col("x", "y").laktory.convert_units(input_unit="C", output_unit="F")
+    )
+    print(df.glimpse(return_as_string=True))
+    '''
+    Rows: 1
+    Columns: 2
+    $ x <f64> 32.0
+    $ y <f64> 212.0
+    '''
     ```
 
     References
     ----------
-    The units conversion function use [planck](https://www.okube.ai/planck/) convert as a backend.
+    The units conversion factors are provided by [planck](https://www.okube.ai/planck/).
     """
-    return units.convert(x, input_unit, output_unit)
+    scale, offset = get_conversion(input_unit, output_unit)
+
+    if not isinstance(x, pl.Expr):
+        x = pl.col(x)
+    x = x * scale
+    if offset != 0.0:
+        x = x + offset
+    return x
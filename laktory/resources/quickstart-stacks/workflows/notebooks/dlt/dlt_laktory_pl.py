@@ -53,54 +53,6 @@ for udf in pl.udfs:
     globals()[udf.module_name] = module
     udfs += [getattr(module, udf.function_name)]
 
-# --------------------------------------------------------------------------- #
-# Tables and Views Definition                                                 #
-# --------------------------------------------------------------------------- #
-
-
-def define_table(node, sink):
-    # Get Expectations
-    dlt_warning_expectations = {}
-    dlt_drop_expectations = {}
-    dlt_fail_expectations = {}
-    if sink and not sink.is_quarantine:
-        dlt_warning_expectations = node.dlt_warning_expectations
-        dlt_drop_expectations = node.dlt_drop_expectations
-        dlt_fail_expectations = node.dlt_fail_expectations
-
-    # Get Name
-    name = node.name
-    if sink is not None:
-        name = sink.table_name
-
-    @dlt.table_or_view(
-        name=name,
-        comment=node.description,
-        as_view=sink is None,
-    )
-    @dlt.expect_all(dlt_warning_expectations)
-    @dlt.expect_all_or_drop(dlt_drop_expectations)
-    @dlt.expect_all_or_fail(dlt_fail_expectations)
-    def get_df():
-        sink_str = ""
-        if sink is not None:
-            sink_str = f" | sink: {sink.full_name}"
-        logger.info(f"Building {node.name} node{sink_str}")
-
-        # Execute node
-        node.execute(spark=spark, udfs=udfs)
-        if sink and sink.is_quarantine:
-            df = node.quarantine_df
-        else:
-            df = node.output_df
-        df.printSchema()
-
-        # Return
-        return df
-
-    return get_df
-
-
 # --------------------------------------------------------------------------- #
 # CDC tables                                                                  #
 # --------------------------------------------------------------------------- #
@@ -131,18 +83,14 @@ for node in pl.nodes:
     if node.dlt_template != "DEFAULT":
         continue
 
-    if node.sinks is None or node.sinks == []:
-        wrapper = define_table(node, None)
+    # Tables and views. A node with multiple sinks is executed once through
+    # an intermediate view.
+    for wrapper in dlt.define_node(node, udfs=udfs):
         df = dlt.get_df(wrapper)
         display(df)
 
-    else:
-        for sink in node.sinks:
-            if sink.is_cdc:
-                df = define_cdc_table(node, sink)
-                display(df)
-
-            else:
-                wrapper = define_table(node, sink)
-                df = dlt.get_df(wrapper)
-                display(df)
+    # CDC tables
+    for sink in node.sinks or []:
+        if sink.is_cdc:
+            df = define_cdc_table(node, sink)
+            display(df)
@@ -4,6 +4,8 @@ dbutils.widgets.text("pipeline_name", "pl-stocks-job")
 dbutils.widgets.text("node_name", "")
 dbutils.widgets.text("full_refresh", "False")
 dbutils.widgets.text("install_dependencies", "True")
+dbutils.widgets.text("max_workers", "1")
+dbutils.widgets.text("skip_unchanged", "false")
 
 # COMMAND ----------
 install_dependencies = dbutils.widgets.get("install_dependencies").lower() == "true"
@@ -49,9 +51,17 @@ laktory_root = "/Workspace" + notebook_path.split("/jobs/")[0]
 pl_name = dbutils.widgets.get("pipeline_name")
 node_name = dbutils.widgets.get("node_name")
 full_refresh = dbutils.widgets.get("full_refresh").lower() == "true"
+max_workers = int(dbutils.widgets.get("max_workers"))
+skip_unchanged = dbutils.widgets.get("skip_unchanged").lower() == "true"
 filepath = f"{laktory_root}/pipelines/{pl_name}/config.json"
-with open(filepath, "r") as fp:
-    pl = models.Pipeline.model_validate_json(fp.read())
+nodes_filepath = f"{laktory_root}/pipelines/{pl_name}/nodes_config.json"
+if node_name and os.path.exists(nodes_filepath):
+    # Only validate the node and the sources it reads from
+    with open(nodes_filepath, "r") as fp:
+        pl = models.Pipeline.model_validate_node_json(fp.read(), node_name)
+else:
+    with open(filepath, "r") as fp:
+        pl = models.Pipeline.model_validate_json(fp.read())
 
 # Import User Defined Functions
 sys.path.append(f"{laktory_root}/pipelines/")
@@ -68,7 +78,13 @@ for udf in pl.udfs:
 # Execution                                                                   #
 # --------------------------------------------------------------------------- #
 
-if node_name:
-    pl.nodes_dict[node_name].execute(spark=spark, udfs=udfs, full_refresh=full_refresh)
-else:
-    pl.execute(spark=spark, udfs=udfs, full_refresh=full_refresh)
+# Task nodes are comma-separated and executed in-process
+node_names = [n for n in node_name.split(",") if n] or None
+pl.execute(
+    spark=spark,
+    udfs=udfs,
+    full_refresh=full_refresh,
+    node_names=node_names,
+    max_workers=max_workers,
+    skip_unchanged=skip_unchanged,
+)
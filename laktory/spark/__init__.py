@@ -1,28 +1,47 @@
-spark_installed = True
-try:
-    import pyspark
-except ModuleNotFoundError:
-    spark_installed = False
+import importlib.util
+import sys
+
+from laktory._lazy import when_imported
+
+spark_installed = importlib.util.find_spec("pyspark") is not None
 
 if spark_installed:
     from pyspark.sql.column import Column as SparkColumn
-    from pyspark.sql.connect.dataframe import DataFrame as SparkConnectDataFrame
     from pyspark.sql.dataframe import DataFrame as SparkDataFrame
     from pyspark.sql.session import SparkSession
 
-    import laktory.spark.connectsession
     import laktory.spark.dataframe
     import laktory.spark.functions
     import laktory.spark.session
     from laktory.spark.datatypes import DATATYPES_MAP
 
+    # Spark Connect requires pandas and pyarrow and is expensive to import. Its
+    # extensions are registered only once it is imported.
+    when_imported(
+        "pyspark.sql.connect.dataframe",
+        lambda m: laktory.spark.dataframe.register_namespace(m.DataFrame),
+    )
+    when_imported(
+        "pyspark.sql.connect.session",
+        lambda _: importlib.import_module("laktory.spark.connectsession"),
+    )
+
+    def __getattr__(name):
+        if name == "SparkConnectDataFrame":
+            from pyspark.sql.connect.dataframe import DataFrame
+
+            return DataFrame
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
     def is_spark_dataframe(df):
         """Check if dataframe is Spark DataFrame or Spark Connect DataFrame"""
 
-        if isinstance(df, SparkConnectDataFrame):
+        if isinstance(df, SparkDataFrame):
             return True
 
-        if isinstance(df, SparkDataFrame):
+        # A Spark Connect DataFrame can't exist if its module is not imported
+        connect = sys.modules.get("pyspark.sql.connect.dataframe", None)
+        if connect is not None and isinstance(df, connect.DataFrame):
             return True
 
         return False
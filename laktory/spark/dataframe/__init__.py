@@ -3,9 +3,11 @@ from functools import wraps
 from pyspark.sql.dataframe import DataFrame
 
 from laktory.spark.dataframe.display import display
+from laktory.spark.dataframe.flatten import flatten
 from laktory.spark.dataframe.groupby_and_agg import groupby_and_agg
 from laktory.spark.dataframe.has_column import has_column
 from laktory.spark.dataframe.is_aggregate import is_aggregate
+from laktory.spark.dataframe.plan import get_plan
 from laktory.spark.dataframe.schema_flat import schema_flat
 from laktory.spark.dataframe.show_string import show_string
 from laktory.spark.dataframe.smart_join import smart_join
@@ -21,6 +23,14 @@ class LaktoryDataFrame:
     def display(self, *args, **kwargs):
         return display(self._df, *args, **kwargs)
 
+    @wraps(flatten)
+    def flatten(self, *args, **kwargs):
+        return flatten(self._df, *args, **kwargs)
+
+    @wraps(get_plan)
+    def get_plan(self, *args, **kwargs):
+        return get_plan(self._df, *args, **kwargs)
+
     @wraps(groupby_and_agg)
     def groupby_and_agg(self, *args, **kwargs):
         return groupby_and_agg(self._df, *args, **kwargs)
@@ -54,13 +64,9 @@ class LaktoryDataFrame:
         return window_filter(self._df, *args, **kwargs)
 
 
-DataFrame.laktory: LaktoryDataFrame = property(lambda self: LaktoryDataFrame(self))
-
+def register_namespace(cls) -> None:
+    """Register `laktory` namespace on a Spark DataFrame class"""
+    cls.laktory = property(lambda self: LaktoryDataFrame(self))
 
-# Spark Connect DataFrame Extensions
-try:
-    from pyspark.sql.connect.dataframe import DataFrame
 
-    DataFrame.laktory = property(lambda self: LaktoryDataFrame(self))
-except:  # noqa: E722
-    pass
+register_namespace(DataFrame)
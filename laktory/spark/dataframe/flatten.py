@@ -0,0 +1,159 @@
+import fnmatch
+from typing import Union
+
+from pyspark.sql.dataframe import DataFrame
+
+
+def flatten(
+    df: DataFrame,
+    columns: Union[str, list[str]] = None,
+    include: list[str] = None,
+    exclude: list[str] = None,
+    separator: str = None,
+    max_depth: int = None,
+    explode: Union[str, list[str]] = None,
+) -> DataFrame:
+    """
+    Expand struct columns into top-level columns. All fields are selected in a
+    single projection, so that only the selected nested fields are read from
+    the source (projection pushdown). Exploded array of structs are expanded
+    in a second projection.
+
+    Parameters
+    ----------
+    df:
+        Input DataFrame
+    columns:
+        Struct column(s) to expand. If `None`, all struct columns are expanded.
+    include:
+        Glob patterns of the (dot separated) fields paths to keep. Fields of
+        exploded structs are referenced from the path of the exploded column
+        (ex.: `data.prices.open`). Other columns are not affected.
+    exclude:
+        Glob patterns of the (dot separated) fields paths to drop. Other
+        columns are not affected.
+    separator:
+        If `None`, output columns are named after the fields names. Otherwise,
+        output columns are named after the fields paths joined with the
+        separator.
+    max_depth:
+        Maximum number of struct levels to expand. If `None`, nested structs
+        are fully expanded.
+    explode:
+        Output column(s) to explode. Empty or null arrays result in a null row.
+        Exploded array of structs are expanded as well.
+
+    Returns
+    -------
+    :
+        Output DataFrame
+
+    Examples
+    --------
+    ```py
+    import laktory  # noqa: F401
+
+    df = spark.createDataFrame(
+        [
+            {
+                "name": "stock_price",
+                "data": {
+                    "symbol": "AAPL",
+                    "_created_at": "2023-09-01",
+                    "prices": [{"open": 1, "close": 2}, {"open": 3, "close": 4}],
+                },
+            }
+        ],
+        schema="name string, data struct<symbol string, _created_at string, prices array<struct<open long, close long>>>",
+    )
+
+    df = df.laktory.flatten(columns="data", exclude=["data._*"], explode="prices")
+    print(df.laktory.show_string())
+    '''
+    +-----------+------+----+-----+
+    |       name|symbol|open|close|
+    +-----------+------+----+-----+
+    |stock_price|  AAPL|   1|    2|
+    |stock_price|  AAPL|   3|    4|
+    +-----------+------+----+-----+
+    '''
+    ```
+    """
+    import pyspark.sql.functions as F
+    import pyspark.sql.types as T
+
+    if isinstance(columns, str):
+        columns = [columns]
+    if isinstance(explode, str):
+        explode = [explode]
+
+    paths = {name: (name,) for name in df.columns}
+    df, paths = _flatten(df, columns, paths, include, exclude, separator, max_depth)
+
+    if explode:
+        # Fields of exploded structs keep the path of their parent
+        explode_paths = {c: paths[c] for c in explode}
+        for c in explode:
+            df = df.withColumn(c, F.explode_outer(_col(c)))
+        schema = {f.name: f.dataType for f in df.schema.fields}
+        structs = [c for c in explode if isinstance(schema[c], T.StructType)]
+        if structs:
+            paths = {c: explode_paths.get(c, (c,)) for c in schema}
+            df, _ = _flatten(df, structs, paths, include, exclude, separator, max_depth)
+
+    return df
+
+
+def _flatten(df, columns, paths, include, exclude, separator, max_depth):
+    """Expand `columns` and return output DataFrame and columns paths"""
+    import pyspark.sql.types as T
+
+    def _is_selected(path):
+        path = ".".join(path)
+        # Parents of included paths are kept so that they can be exploded
+        if include and not any(
+            fnmatch.fnmatch(path, p) or p.startswith(path + ".") for p in include
+        ):
+            return False
+        if exclude and any(fnmatch.fnmatch(path, p) for p in exclude):
+            return False
+        return True
+
+    def _get_fields(expr, dtype, path, depth):
+        if not isinstance(dtype, T.StructType) or depth == max_depth:
+            return [(path, expr)] if _is_selected(path) else []
+        fields = []
+        for f in dtype.fields:
+            _expr = expr.getField(f.name)
+            fields += _get_fields(_expr, f.dataType, path + (f.name,), depth + 1)
+        return fields
+
+    schema = {f.name: f.dataType for f in df.schema.fields}
+    if columns is None:
+        columns = [c for c, t in schema.items() if isinstance(t, T.StructType)]
+
+    exprs = []
+    _paths = {}
+    for name, dtype in schema.items():
+        fields = [(paths[name], _col(name))]
+        if name in columns:
+            fields = _get_fields(_col(name), dtype, paths[name], 0)
+
+        for path, expr in fields:
+            _name = name
+            if name in columns:
+                _name = path[-1] if separator is None else separator.join(path)
+            if _name in _paths:
+                raise ValueError(
+                    f"Column '{_name}' is duplicated. Set `separator` or `exclude` to prevent conflicts."
+                )
+            exprs += [expr.alias(_name)]
+            _paths[_name] = path
+
+    return df.select(exprs), _paths
+
+
+def _col(name):
+    import pyspark.sql.functions as F
+
+    return F.col(f"`{name}`")
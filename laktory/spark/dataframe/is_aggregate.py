@@ -1,6 +1,3 @@
-import io
-import sys
-
 from pyspark.sql.dataframe import DataFrame
 
 
@@ -41,10 +38,6 @@ def is_aggregate(df: DataFrame) -> bool:
     dfa.laktory.is_aggregate()
     ```
     """
-    buffer = io.StringIO()
-    stdout0 = sys.stdout
-    sys.stdout = buffer
-    df.explain(mode="simple")
-    sys.stdout = stdout0
-    plan = buffer.getvalue()
-    return "HashAggregate".lower() in plan.lower()
+    from laktory.spark.dataframe.plan import get_plan
+
+    return get_plan(df).is_aggregate
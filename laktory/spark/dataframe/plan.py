@@ -0,0 +1,243 @@
+import io
+import re
+import sys
+import threading
+from contextlib import redirect_stdout
+from functools import cached_property
+
+from pyspark.sql.dataframe import DataFrame
+
+from laktory._logger import get_logger
+from laktory.spark.dataframe.watermark import Watermark
+
+logger = get_logger(__name__)
+
+# Only used when the plan can't be reached through JVM or Spark Connect APIs
+_explain_lock = threading.Lock()
+
+SIZE_UNITS = ["B", "KiB", "MiB", "GiB", "TiB", "PiB", "EiB"]
+
+
+class DataFramePlan:
+    """
+    Inspector of a DataFrame logical plan. The plan is walked through the JVM
+    (Spark Classic) or the client plan and analyze requests (Spark Connect)
+    instead of capturing `explain()` output. Each answer is computed once and
+    cached. Use `get_plan` to get the cached inspector of a DataFrame.
+
+    Parameters
+    ----------
+    df:
+        Input DataFrame
+    """
+
+    def __init__(self, df: DataFrame):
+        self._df = df
+        self._explain_strings = {}
+
+    @cached_property
+    def is_connect(self) -> bool:
+        """`True` if DataFrame is a Spark Connect DataFrame"""
+        connect = sys.modules.get("pyspark.sql.connect.dataframe", None)
+        return connect is not None and isinstance(self._df, connect.DataFrame)
+
+    # ----------------------------------------------------------------------- #
+    # Plan Nodes                                                              #
+    # ----------------------------------------------------------------------- #
+
+    @cached_property
+    def _query_execution(self):
+        return self._df._jdf.queryExecution()
+
+    @staticmethod
+    def _walk_jvm(root) -> list:
+        nodes = [root]
+        i = 0
+        while i < len(nodes):
+            children = nodes[i].children()
+            nodes += [children.apply(j) for j in range(children.size())]
+            i += 1
+        return nodes
+
+    def _walk_connect(self) -> list:
+        from pyspark.sql.connect.plan import LogicalPlan
+
+        nodes = [self._df._plan]
+        i = 0
+        while i < len(nodes):
+            for attr in ["_child", "left", "right", "other"]:
+                child = getattr(nodes[i], attr, None)
+                if isinstance(child, LogicalPlan):
+                    nodes += [child]
+            i += 1
+        return nodes
+
+    @cached_property
+    def analyzed_nodes(self) -> list:
+        """
+        Analyzed logical plan nodes, from root to leaves. JVM nodes with Spark
+        Classic and client plan nodes with Spark Connect.
+        """
+        if self.is_connect:
+            return self._walk_connect()
+        return self._walk_jvm(self._query_execution.analyzed())
+
+    @cached_property
+    def optimized_nodes(self) -> list:
+        """
+        Optimized logical plan nodes, from root to leaves. Only available with
+        Spark Classic.
+        """
+        if self.is_connect:
+            raise ValueError("Optimized plan is not available with Spark Connect")
+        return self._walk_jvm(self._query_execution.optimizedPlan())
+
+    def explain_string(self, mode: str = "extended") -> str:
+        """
+        Plan description as returned by `explain()`, without printing it.
+
+        Parameters
+        ----------
+        mode:
+            Explain mode (`simple`, `extended`, `cost`, etc.)
+
+        Returns
+        -------
+        :
+            Plan description
+        """
+        if mode in self._explain_strings:
+            return self._explain_strings[mode]
+
+        df = self._df
+        if self.is_connect:
+            s = df._explain_string(mode=mode)
+        else:
+            try:
+                s = df._sc._jvm.PythonSQLUtils.explainString(
+                    self._query_execution, mode
+                )
+            except Exception:
+                # Some Databricks cluster types prevent from using private
+                # methods like ._jdf. As a last resort, explain output is
+                # captured.
+                with _explain_lock, io.StringIO() as buf, redirect_stdout(buf):
+                    df.explain(mode=mode)
+                    s = buf.getvalue()
+
+        self._explain_strings[mode] = s
+        return s
+
+    # ----------------------------------------------------------------------- #
+    # Properties                                                              #
+    # ----------------------------------------------------------------------- #
+
+    @cached_property
+    def is_aggregate(self) -> bool:
+        """`True` if DataFrame is an aggregation"""
+        if not self.is_connect:
+            try:
+                return any(n.nodeName() == "Aggregate" for n in self.optimized_nodes)
+            except Exception as e:
+                logger.debug(f"Could not walk optimized plan: {e}")
+
+        plan = self.explain_string(mode="simple")
+        return "HashAggregate".lower() in plan.lower()
+
+    @cached_property
+    def watermark(self) -> Watermark:
+        """DataFrame watermark if available, `None` otherwise"""
+        if self.is_connect:
+            for node in self.analyzed_nodes:
+                if type(node).__name__ == "WithWatermark":
+                    return Watermark(
+                        column=node._event_time.strip(),
+                        threshold=node._delay_threshold.strip(),
+                    )
+            return None
+
+        try:
+            for node in self.analyzed_nodes:
+                if node.nodeName() == "EventTimeWatermark":
+                    return Watermark(
+                        column=node.eventTime().name(),
+                        threshold=node.delay().toString(),
+                    )
+            return None
+        except Exception as e:
+            logger.debug(f"Could not walk analyzed plan: {e}")
+
+        plan = self.explain_string(mode="extended")
+        for line in plan.split("\n"):
+            if "EventTimeWatermark".lower() in line.lower():
+                c, t = line.lower().replace("'eventtimewatermark '", "").split(",")
+                return Watermark(column=c.strip(), threshold=t.strip())
+        return None
+
+    @cached_property
+    def size_in_bytes(self) -> int:
+        """
+        DataFrame size estimated from optimized plan statistics. For Delta
+        tables, statistics are read from the table metadata. `None` if not
+        available.
+        """
+        if not self.is_connect:
+            try:
+                stats = self._query_execution.optimizedPlan().stats()
+                return int(stats.sizeInBytes().toString())
+            except Exception as e:
+                logger.debug(f"Could not read plan statistics: {e}")
+
+        try:
+            plan = self.explain_string(mode="cost")
+        except Exception as e:
+            logger.warn(f"Could not estimate dataframe size: {e}")
+            return None
+
+        match = re.search(r"sizeInBytes=([0-9.]+)\s*([KMGTPE]?i?B)", plan)
+        if match is None or match.group(2) not in SIZE_UNITS:
+            return None
+        unit = SIZE_UNITS.index(match.group(2))
+        return int(float(match.group(1)) * 1024**unit)
+
+
+def get_plan(df: DataFrame) -> DataFramePlan:
+    """
+    Get DataFrame plan inspector. The inspector is cached on the DataFrame,
+    so that plan questions (aggregation, watermark, size, etc.) are answered
+    only once per DataFrame.
+
+    Parameters
+    ----------
+    df:
+        Input DataFrame
+
+    Returns
+    -------
+    :
+        Plan inspector
+
+    Examples
+    --------
+    ```py
+    import pyspark.sql.functions as F
+
+    import laktory  # noqa: F401
+
+    df = spark.createDataFrame([{"symbol": "AAPL", "close": 1}])
+    dfa = df.groupby("symbol").agg(F.mean("close"))
+
+    plan = dfa.laktory.get_plan()
+    print(plan.is_aggregate)
+    '''
+    True
+    '''
+    ```
+    """
+    # DataFrame.__getattr__ is bypassed as it may trigger a schema request
+    # with Spark Connect
+    plan = df.__dict__.get("_laktory_plan", None)
+    if plan is None:
+        plan = DataFramePlan(df)
+        df.__dict__["_laktory_plan"] = plan
+    return plan
@@ -1,13 +1,29 @@
-from collections import defaultdict
+from collections import Counter
 
 from pyspark.sql.dataframe import DataFrame
 
 from laktory._logger import get_logger
+from laktory.spark.dataframe.plan import get_plan
 from laktory.spark.dataframe.watermark import Watermark
 from laktory.spark.dataframe.watermark import watermark
 
 logger = get_logger(__name__)
 
+BROADCAST_THRESHOLD = 32 * 1024 * 1024
+
+# Join types for which the other side can be broadcasted or salted (each left
+# row is matched against other, unmatched other rows are not returned)
+LEFT_JOINS = [
+    "inner",
+    "cross",
+    "left",
+    "leftouter",
+    "semi",
+    "leftsemi",
+    "anti",
+    "leftanti",
+]
+
 
 def smart_join(
     left: DataFrame,
@@ -22,6 +38,8 @@ def smart_join(
     time_constraint_interval_lower: str = "60 seconds",
     time_constraint_interval_upper: str = None,
     coalesce: bool = False,
+    broadcast_threshold: int = BROADCAST_THRESHOLD,
+    salt_buckets: int = None,
 ) -> DataFrame:
     """
      Join tables and coalesce join columns. Optionally coalesce columns found
@@ -56,6 +74,17 @@ def smart_join(
         Upper bound for a spark streaming event-time constraint
     coalesce:
         If `True` columns present in both left and other are coalesced.
+    broadcast_threshold:
+        Maximum estimated size, in bytes, of other to be broadcasted.
+        The size is estimated from the statistics of other's optimized
+        plan, which, for Delta tables, are read from the table metadata.
+        Only applies to inner, left, semi and anti joins of a static other.
+        Set to `None` or 0 to disable.
+    salt_buckets:
+        If set, join keys are salted with this number of buckets to spread
+        skewed keys across partitions. Left rows are assigned a random salt
+        and other rows are replicated for each salt. Ignored when other is
+        broadcasted.
 
     Examples
     --------
@@ -115,6 +144,9 @@ def smart_join(
         raise ValueError(
             "Either `on` or (`left_on` and `other_on`) or `on_expression` should be set"
         )
+    _how = how.lower().replace("_", "")
+    if salt_buckets and _how not in LEFT_JOINS:
+        raise ValueError(f"Salting is not supported for '{how}' join")
 
     # Parse inputs
     if on is None:
@@ -164,6 +196,22 @@ def smart_join(
     if on:
         other = other.dropDuplicates(on)
 
+    # Broadcast or salt other
+    _broadcast = False
+    if broadcast_threshold and _how in LEFT_JOINS and not other.isStreaming:
+        size = get_plan(other).size_in_bytes
+        _broadcast = size is not None and size <= broadcast_threshold
+        if _broadcast:
+            logger.info(f"Broadcasting other ({size} bytes)")
+            other = F.broadcast(other)
+    _salted = bool(salt_buckets) and not _broadcast
+    if _salted:
+        logger.info(f"Salting join keys with {salt_buckets} buckets")
+        left = left.withColumn("__salt", F.floor(F.rand() * salt_buckets).cast("int"))
+        other = other.withColumn(
+            "__salt", F.explode(F.sequence(F.lit(0), F.lit(salt_buckets - 1)))
+        )
+
     _join = []
     for c in on:
         _join += [f"left.{c} == other.{c}"]
@@ -182,6 +230,8 @@ def smart_join(
                 f"left.{wml.column} <= other._other_wc + interval {time_constraint_interval_upper}"
             ]
     _join = " AND ".join(_join)
+    if _salted:
+        _join_salt = f"{_join} AND left.__salt == other.__salt"
 
     logger.info(f"   ON {_join}")
     logger.debug(f"Left Schema: {left.schema}")
@@ -189,30 +239,30 @@ def smart_join(
 
     df = left.alias("left").join(
         other=other.alias("other"),
-        on=F.expr(_join),
+        on=F.expr(_join_salt if _salted else _join),
         how=how,
     )
 
-    # Find duplicated columns (because of join)
-    d = defaultdict(lambda: 0)
-    for c in df.columns:
-        d[c] += 1
-
-    # Drop duplicated columns
-    for c, v in d.items():
-        if v < 2:
-            continue
-
-        if not (coalesce or c in _join):
-            continue
-        df = df.withColumn("__tmp", F.coalesce(f"left.{c}", f"other.{c}"))
-        df = df.drop(c)
-        df = df.withColumn(c, F.col("__tmp"))
-        df = df.drop("__tmp")
-
-    # Drop watermark column
-    if wmo is not None:
-        df = df.drop(F.col("other._other_wc"))
+    # Select columns in a single projection. Duplicated columns (because of
+    # join) are coalesced and moved at the end. Salt and watermark columns are
+    # dropped.
+    left_columns = [c for c in left.columns if c != "__salt"]
+    other_columns = []
+    if _how not in ["semi", "leftsemi", "anti", "leftanti"]:
+        other_columns = [c for c in other.columns if c not in ["__salt", "_other_wc"]]
+    counts = Counter(left_columns + other_columns)
+    columns = []
+    coalesced = []
+    for alias, _columns in [("left", left_columns), ("other", other_columns)]:
+        for c in _columns:
+            if counts[c] > 1 and (coalesce or c in _join):
+                if c not in coalesced:
+                    coalesced += [c]
+                continue
+            columns += [F.col(f"{alias}.`{c}`")]
+    for c in coalesced:
+        columns += [F.coalesce(F.col(f"left.`{c}`"), F.col(f"other.`{c}`")).alias(c)]
+    df = df.select(columns)
     logger.debug(f"Joined Schema: {df.schema}")
 
     return df
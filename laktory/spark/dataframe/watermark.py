@@ -1,9 +1,4 @@
-import io
-import re
-from contextlib import redirect_stdout
-
 from pydantic import BaseModel
-from pyspark.sql.connect.dataframe import DataFrame as ConnectDataFrame
 from pyspark.sql.dataframe import DataFrame
 
 
@@ -65,38 +60,6 @@ def watermark(df: DataFrame) -> Watermark:
     ```
     """
 
-    # Get plan
-    if isinstance(df, ConnectDataFrame):
-        plan = df._plan.print()
-
-        def parse_watermark(input_string):
-            match_c = re.search(r"event_time='([^']+)'", input_string)
-            match_t = re.search(r"delay_threshold='([^']+)'", input_string)
-            c = None
-            t = None
-            if match_c:
-                c = match_c.group(1)
-            if match_t:
-                t = match_t.group(1)
-
-            return c, t
-
-        lines = plan.split("\n")
-        for line in lines:
-            if "<WithWatermark".lower() in line.lower():
-                c, t = parse_watermark(line)
-                return Watermark(column=c.strip(), threshold=t.strip())
-
-    else:
-        # Some Databricks cluster types prevent from using private method
-        # like ._jdf. Instead, we use .explain() method and capture the
-        # output
-        with io.StringIO() as buf, redirect_stdout(buf):
-            df.explain(extended=True)
-            plan = buf.getvalue().strip()
+    from laktory.spark.dataframe.plan import get_plan
 
-        lines = plan.split("\n")
-        for line in lines:
-            if "EventTimeWatermark".lower() in line.lower():
-                c, t = line.lower().replace("'eventtimewatermark '", "").split(",")
-                return Watermark(column=c.strip(), threshold=t.strip())
+    return get_plan(df).watermark
@@ -13,6 +13,46 @@ class OrderBy(BaseModel):
     desc: bool = False
 
 
+def _is_max_by_supported(df, partition_by, order_by, rows_to_keep) -> bool:
+    if rows_to_keep != 1 or not partition_by or not order_by:
+        return False
+
+    # Struct comparison uses a single direction for all the fields
+    if len(set(o.desc for o in order_by)) > 1:
+        return False
+
+    # Aggregations on streaming DataFrames require a stateful output mode
+    if df.isStreaming:
+        return False
+
+    # Map columns are not comparable
+    return "map<" not in df.schema.simpleString()
+
+
+def _select_max_by(df, partition_by, order_by, drop_row_index, row_index_name):
+    """
+    Select the first row of each window with a single aggregation of the
+    struct (order by columns, row) instead of numbering sorted rows. Nulls
+    are sorted first in ascending order and last in descending order, as with
+    the default window ordering.
+    """
+    import pyspark.sql.functions as F
+
+    columns = df.columns
+    keys = [
+        F.expr(o.sql_expression).alias(f"__order_by_{i}")
+        for i, o in enumerate(order_by)
+    ]
+    s = F.struct(*keys, F.struct(*[F.col(f"`{c}`") for c in columns]).alias("__row"))
+    agg = F.max(s) if order_by[0].desc else F.min(s)
+
+    df = df.groupBy(*partition_by).agg(agg.alias("__top")).select("__top.__row.*")
+    if not drop_row_index:
+        df = df.withColumn(row_index_name, F.lit(1))
+
+    return df
+
+
 def window_filter(
     df,
     partition_by: Union[list[str], None],
@@ -37,8 +77,9 @@ def window_filter(
     row_index_name:
         Group-specific and sorted rows index name
     rows_to_keep:
-        How many rows to keep per window
-
+        How many rows to keep per window. When a single row is kept and all
+        `order_by` expressions share the same direction, the row is selected
+        with a struct max (or min) aggregation instead of a sorted window.
 
     Examples
     --------
@@ -87,6 +128,15 @@ def window_filter(
     import pyspark.sql.functions as F
     from pyspark.sql import Window
 
+    if order_by:
+        order_by = [o if isinstance(o, OrderBy) else OrderBy(**o) for o in order_by]
+
+    # Single row per window
+    if _is_max_by_supported(df, partition_by, order_by, rows_to_keep):
+        return _select_max_by(
+            df, partition_by, order_by, drop_row_index, row_index_name
+        )
+
     # Partition by
     w = Window.partitionBy(*partition_by)
 
@@ -94,8 +144,6 @@ def window_filter(
     if order_by:
         order_bys = []
         for o in order_by:
-            if not isinstance(o, OrderBy):
-                o = OrderBy(**o)
             order_bys += [F.expr(o.sql_expression)]
             if o.desc:
                 order_bys[-1] = order_bys[-1].desc()
@@ -1,7 +1,9 @@
 # import pyspark.sql.functions as F #noqa
-from planck import units
+from typing import Union
+
 from pyspark.sql.column import Column
 
+from laktory._units import get_conversion
 from laktory.spark.functions._common import COLUMN_OR_NAME
 from laktory.spark.functions._common import _col
 
@@ -16,17 +18,20 @@ __all__ = [
 
 
 def convert_units(
-    x: COLUMN_OR_NAME,
+    x: Union[COLUMN_OR_NAME, list[COLUMN_OR_NAME]],
     input_unit: str,
     output_unit: str,
-) -> Column:
+) -> Union[Column, list[Column]]:
     """
-    Units conversion
+    Units conversion. The conversion is resolved once, for each pair of units,
+    as a scale and an offset and applied as a single multiply-add expression.
+    When a list of columns is provided, a list of converted columns is
+    returned, named after the input columns.
 
     Parameters
     ----------
     x:
-        Input column
+        Input column or list of columns
     input_unit:
         Input units
     output_unit:
@@ -56,13 +61,35 @@ def convert_units(
     |1.0|3.280839895013124|
     +---+-----------------+
     '''
+
+    df = spark.createDataFrame([[0.0, 100.0]], ["x", "y"])
+    df = df.select(F.laktory.convert_units(["x", "y"], input_unit="C", output_unit="F"))
+    print(df.laktory.show_string())
+    '''
+    +----+-----+
+    |   x|    y|
+    +----+-----+
+    |32.0|212.0|
+    +----+-----+
+    '''
     ```
 
     References
     ----------
-    The units conversion function use [planck](https://www.okube.ai/planck/) convert as a backend.
+    The units conversion factors are provided by [planck](https://www.okube.ai/planck/).
     """
-    return units.convert(_col(x), input_unit, output_unit)
+    scale, offset = get_conversion(input_unit, output_unit)
+
+    def _convert(c):
+        y = _col(c) * scale
+        if offset != 0.0:
+            y = y + offset
+        return y
+
+    if isinstance(x, (list, tuple)):
+        return [_convert(c).alias(c) if isinstance(c, str) else _convert(c) for c in x]
+
+    return _convert(x)
 
 
 if __name__ == "__main__":
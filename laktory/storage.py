@@ -0,0 +1,539 @@
+import os
+import re
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Union
+
+from laktory._logger import get_logger
+
+logger = get_logger(__name__)
+
+PathLike = Union[str, Path]
+
+
+class Storage:
+    """
+    Base file system used to store pipeline state (checkpoints, fingerprints,
+    incremental versions, etc.). Bulk operations run concurrently in a thread
+    pool, unless the file system supports them natively.
+
+    Parameters
+    ----------
+    max_workers
+        Maximum number of concurrent operations for bulk deletes and listings
+    """
+
+    protocol: str = None
+
+    def __init__(self, max_workers: int = 16):
+        self.max_workers = max_workers
+
+    # ----------------------------------------------------------------------- #
+    # Single Path Operations                                                  #
+    # ----------------------------------------------------------------------- #
+
+    def exists(self, path: PathLike) -> bool:
+        """`True` if the file or directory at `path` exists"""
+        raise NotImplementedError()
+
+    def ls(self, path: PathLike) -> list[str]:
+        """Paths of the files and directories in `path`. Empty if not found."""
+        raise NotImplementedError()
+
+    def rm(self, path: PathLike) -> bool:
+        """
+        Delete the file or directory (recursively) at `path`.
+
+        Returns
+        -------
+        :
+            `True` if `path` existed and was deleted
+        """
+        raise NotImplementedError()
+
+    def rename(self, src: PathLike, dst: PathLike) -> None:
+        """Rename `src` to `dst`, overwriting `dst` if it exists"""
+        raise NotImplementedError()
+
+    def read_text(self, path: PathLike) -> Union[str, None]:
+        """Content of the file at `path`. `None` if not found."""
+        raise NotImplementedError()
+
+    def write_text(self, path: PathLike, content: str) -> None:
+        """
+        Write `content` to the file at `path`, creating parent directories.
+        The content is written to a temporary file which is then renamed so
+        that readers never see a partially written file.
+        """
+        path = to_posix(path)
+        tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        self._write_text(tmp_path, content)
+        try:
+            self.rename(tmp_path, path)
+        except Exception:
+            self.rm(tmp_path)
+            raise
+
+    def _write_text(self, path: str, content: str) -> None:
+        raise NotImplementedError()
+
+    # ----------------------------------------------------------------------- #
+    # Bulk Operations                                                         #
+    # ----------------------------------------------------------------------- #
+
+    def _map(self, func, paths: list[str]) -> list:
+        if len(paths) < 2 or self.max_workers < 2:
+            return [func(p) for p in paths]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, paths))
+
+    def rm_many(self, paths: list[PathLike]) -> list[str]:
+        """
+        Delete multiple files or directories.
+
+        Parameters
+        ----------
+        paths:
+            Paths to delete
+
+        Returns
+        -------
+        :
+            Paths that existed and were deleted
+        """
+        paths = list(dict.fromkeys(to_posix(p) for p in paths if p))
+        deleted = self._map(self.rm, paths)
+        return [p for p, d in zip(paths, deleted) if d]
+
+    def ls_many(self, paths: list[PathLike]) -> dict[str, list[str]]:
+        """
+        List content of multiple directories.
+
+        Parameters
+        ----------
+        paths:
+            Directory paths
+
+        Returns
+        -------
+        :
+            Content of each directory
+        """
+        paths = list(dict.fromkeys(to_posix(p) for p in paths if p))
+        return dict(zip(paths, self._map(self.ls, paths)))
+
+
+class LocalStorage(Storage):
+    """
+    Local file system storage. Also used for Databricks volumes and workspace
+    files when running on a cluster.
+    """
+
+    protocol = "file"
+
+    def exists(self, path: PathLike) -> bool:
+        return os.path.exists(path)
+
+    def ls(self, path: PathLike) -> list[str]:
+        path = to_posix(path)
+        try:
+            return sorted(f"{path.rstrip('/')}/{name}" for name in os.listdir(path))
+        except (FileNotFoundError, NotADirectoryError):
+            return []
+
+    def rm(self, path: PathLike) -> bool:
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            return False
+        logger.info(f"Deleted {to_posix(path)}")
+        return True
+
+    def rename(self, src: PathLike, dst: PathLike) -> None:
+        os.replace(src, dst)
+
+    def read_text(self, path: PathLike) -> Union[str, None]:
+        try:
+            with open(path) as fp:
+                return fp.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_text(self, path: str, content: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as fp:
+            fp.write(content)
+
+
+class FsspecStorage(Storage):
+    """
+    Storage backed by an fsspec-compatible file system (`s3`, `abfss`, `gs`,
+    `memory`, etc.). Requires fsspec and the package implementing the
+    protocol. Bulk deletes are delegated to the file system, which batches
+    requests when supported by the object store.
+
+    Parameters
+    ----------
+    protocol
+        fsspec protocol
+    fs
+        File system instance. Created from `protocol` and `storage_options` if
+        not provided.
+    storage_options
+        Options passed to the file system constructor
+    max_workers
+        Maximum number of concurrent listings
+    """
+
+    def __init__(
+        self,
+        protocol: str = None,
+        fs=None,
+        storage_options: dict = None,
+        max_workers: int = 16,
+    ):
+        super().__init__(max_workers=max_workers)
+        if fs is None:
+            import fsspec
+
+            fs = fsspec.filesystem(protocol, **(storage_options or {}))
+        self.fs = fs
+        self.protocol = protocol or fs.protocol
+        if isinstance(self.protocol, (list, tuple)):
+            self.protocol = self.protocol[0]
+
+    def exists(self, path: PathLike) -> bool:
+        return self.fs.exists(to_posix(path))
+
+    def ls(self, path: PathLike) -> list[str]:
+        try:
+            paths = self.fs.ls(to_posix(path), detail=False)
+        except FileNotFoundError:
+            return []
+        return sorted(paths)
+
+    def rm(self, path: PathLike) -> bool:
+        return len(self.rm_many([path])) > 0
+
+    def rm_many(self, paths: list[PathLike]) -> list[str]:
+        paths = list(dict.fromkeys(to_posix(p) for p in paths if p))
+        paths = [p for p, e in zip(paths, self._map(self.fs.exists, paths)) if e]
+        if paths:
+            self.fs.rm(paths, recursive=True)
+            for p in paths:
+                logger.info(f"Deleted {p}")
+        return paths
+
+    def rename(self, src: PathLike, dst: PathLike) -> None:
+        self.fs.mv(to_posix(src), to_posix(dst))
+
+    def read_text(self, path: PathLike) -> Union[str, None]:
+        try:
+            return self.fs.cat_file(to_posix(path)).decode()
+        except FileNotFoundError:
+            return None
+
+    def write_text(self, path: PathLike, content: str) -> None:
+        # Object stores do not support atomic renames but single object
+        # writes are atomic.
+        path = to_posix(path)
+        if self.protocol in ["file", "local"]:
+            return super().write_text(path, content)
+        self._write_text(path, content)
+
+    def _write_text(self, path: str, content: str) -> None:
+        parent = self.fs._parent(path)
+        if parent:
+            self.fs.makedirs(parent, exist_ok=True)
+        self.fs.pipe_file(path, content.encode())
+
+
+class DbutilsStorage(Storage):
+    """
+    Storage backed by Databricks `dbutils.fs`, used to reach DBFS paths from a
+    remote Spark session (e.g. Databricks Connect).
+
+    Parameters
+    ----------
+    spark
+        Spark session
+    max_workers
+        Maximum number of concurrent operations for bulk deletes and listings
+    """
+
+    protocol = "dbfs"
+
+    def __init__(self, spark, max_workers: int = 16):
+        super().__init__(max_workers=max_workers)
+        from pyspark.dbutils import DBUtils
+
+        self.dbutils = DBUtils(spark)
+
+    @staticmethod
+    def _is_not_found(e: Exception) -> bool:
+        if "java.io.FileNotFoundException" in str(e):
+            return True
+        return "databricks.sdk.errors.platform.ResourceDoesNotExist" in str(type(e))
+
+    def exists(self, path: PathLike) -> bool:
+        try:
+            self.dbutils.fs.ls(to_posix(path))
+        except Exception as e:
+            if self._is_not_found(e):
+                return False
+            raise e
+        return True
+
+    def ls(self, path: PathLike) -> list[str]:
+        try:
+            return sorted(f.path for f in self.dbutils.fs.ls(to_posix(path)))
+        except Exception as e:
+            if self._is_not_found(e):
+                return []
+            raise e
+
+    def rm(self, path: PathLike) -> bool:
+        path = to_posix(path)
+        try:
+            # TODO: Figure out why this does not work with databricks connect
+            self.dbutils.fs.ls(path)
+            self.dbutils.fs.rm(path, True)
+        except Exception as e:
+            if self._is_not_found(e):
+                return False
+            if "databricks.sdk.errors.platform.InvalidParameterValue" in str(type(e)):
+                # TODO: Figure out why this is happening. It seems that the databricks SDK
+                #       modify the path before sending to REST API.
+                logger.warning(f"dbutils could not delete {path}: {e}")
+                return False
+            raise e
+        logger.info(f"Deleted dbfs {path}")
+        return True
+
+    def rename(self, src: PathLike, dst: PathLike) -> None:
+        self.dbutils.fs.mv(to_posix(src), to_posix(dst))
+
+    def read_text(self, path: PathLike) -> Union[str, None]:
+        try:
+            return self.dbutils.fs.head(to_posix(path), 2**31 - 1)
+        except Exception as e:
+            if self._is_not_found(e):
+                return None
+            raise e
+
+    def _write_text(self, path: str, content: str) -> None:
+        self.dbutils.fs.put(path, content, True)
+
+
+class NullStorage(Storage):
+    """
+    Storage used when the file system of a protocol is not available (fsspec
+    or the package implementing the protocol is not installed). Paths are
+    considered missing and writes, renames and deletions raise an error.
+
+    Parameters
+    ----------
+    protocol
+        Path protocol
+    """
+
+    def __init__(self, protocol: str = None):
+        super().__init__()
+        self.protocol = protocol
+
+    def _raise(self, path: PathLike):
+        raise ModuleNotFoundError(
+            f"No storage available for protocol '{self.protocol}' ({to_posix(path)}). "
+            f"Install `fsspec` and the package implementing '{self.protocol}'."
+        )
+
+    def exists(self, path: PathLike) -> bool:
+        return False
+
+    def ls(self, path: PathLike) -> list[str]:
+        return []
+
+    def rm(self, path: PathLike) -> bool:
+        self._raise(path)
+
+    def rm_many(self, paths: list[PathLike]) -> list[str]:
+        paths = [p for p in paths if p]
+        if paths:
+            self._raise(paths[0])
+        return []
+
+    def rename(self, src: PathLike, dst: PathLike) -> None:
+        self._raise(src)
+
+    def read_text(self, path: PathLike) -> Union[str, None]:
+        return None
+
+    def write_text(self, path: PathLike, content: str) -> None:
+        self._raise(path)
+
+
+# --------------------------------------------------------------------------- #
+# Registry                                                                    #
+# --------------------------------------------------------------------------- #
+
+_STORAGES: dict[str, Storage] = {}
+
+
+def to_posix(path: PathLike) -> str:
+    """
+    Convert path to a posix string, restoring the `//` of URLs collapsed by
+    `pathlib` (`s3:/bucket` -> `s3://bucket`).
+    """
+    if isinstance(path, Path):
+        path = path.as_posix()
+    return re.sub(r"^([a-zA-Z][\w+.-]+):/(?!/)", r"\1://", path)
+
+
+def get_protocol(path: PathLike) -> str:
+    """Protocol of `path`. `file` for local paths."""
+    match = re.match(r"^([a-zA-Z][\w+.-]+):/", to_posix(path))
+    if match is None:
+        return "file"
+    return match.group(1)
+
+
+def register_storage(protocol: str, storage: Union[Storage, None]) -> None:
+    """
+    Register the storage used for paths with a given protocol. Use `file` for
+    local paths. Registering `None` restores the default storage.
+
+    Parameters
+    ----------
+    protocol:
+        Path protocol
+    storage:
+        Storage
+
+    Examples
+    --------
+    ```py tag:skip-run
+    import fsspec
+
+    from laktory.storage import FsspecStorage
+    from laktory.storage import register_storage
+
+    register_storage("memory", FsspecStorage(fs=fsspec.filesystem("memory")))
+    ```
+    """
+    if storage is None:
+        _STORAGES.pop(protocol, None)
+    else:
+        _STORAGES[protocol] = storage
+
+
+def get_storage(path: PathLike = None) -> Storage:
+    """
+    Get storage associated with the protocol of `path`, unless a storage has
+    been registered for the protocol:
+
+    * local paths use `LocalStorage`
+    * `dbfs` paths use `DbutilsStorage` when a Spark session with `dbutils`
+      is available
+    * other URLs use `FsspecStorage`, or `NullStorage` when fsspec or the
+      package implementing the protocol is not installed
+
+    Parameters
+    ----------
+    path:
+        File or directory path
+
+    Returns
+    -------
+    :
+        Storage
+    """
+    protocol = "file" if path is None else get_protocol(path)
+    return _get_protocol_storage(protocol)
+
+
+def _get_active_spark():
+    try:
+        from pyspark.sql import SparkSession
+
+        return SparkSession.getActiveSession()
+    except Exception:
+        return None
+
+
+def _get_protocol_storage(protocol: str, spark=None) -> Storage:
+    if protocol in _STORAGES:
+        return _STORAGES[protocol]
+
+    storage = None
+    if protocol == "file":
+        storage = LocalStorage()
+
+    elif protocol == "dbfs":
+        spark = spark or _get_active_spark()
+        if spark is not None:
+            try:
+                storage = DbutilsStorage(spark)
+            except ImportError:
+                pass
+
+    if storage is None:
+        try:
+            storage = FsspecStorage(protocol)
+        except (ImportError, ValueError) as e:
+            # Not cached so that the storage is available once installed
+            logger.debug(f"No storage available for protocol '{protocol}': {e}")
+            return NullStorage(protocol)
+
+    _STORAGES[protocol] = storage
+    return storage
+
+
+def purge_paths(paths: list[PathLike], spark=None) -> list[str]:
+    """
+    Delete multiple files or directories, grouped by storage and deleted in
+    bulk. When a `spark` session with `dbutils` is provided, the paths are
+    also deleted through `dbutils.fs` to reach DBFS from a remote session.
+
+    Parameters
+    ----------
+    paths:
+        Paths to delete
+    spark:
+        Spark session
+
+    Returns
+    -------
+    :
+        Paths that existed and were deleted
+    """
+    groups = {}
+    for p in paths:
+        if p:
+            groups.setdefault(get_protocol(p), []).append(p)
+
+    dbutils = None
+    if spark is not None:
+        try:
+            dbutils = DbutilsStorage(spark)
+        except ImportError:
+            pass
+
+    deleted = []
+    for protocol, _paths in groups.items():
+        storage = _get_protocol_storage(protocol, spark=spark)
+        if isinstance(storage, NullStorage) and dbutils is not None:
+            # Deleted through dbutils below
+            continue
+        deleted += storage.rm_many(_paths)
+
+    if dbutils is None:
+        return deleted
+
+    deleted += dbutils.rm_many([p for p in paths if p and to_posix(p) not in deleted])
+
+    return deleted
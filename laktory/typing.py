@@ -26,6 +26,54 @@ class VariableType(str):
 var = VariableType
 """Laktory variable or expression (string)"""
 
+
+class VariableOr:
+    """
+    Annotation metadata allowing a field to receive a laktory variable or
+    expression (string) in place of a value of the annotated type.
+
+    String inputs are captured by a strict string check before the annotated
+    type is validated. Values without variables are therefore validated
+    directly against their type instead of going through a smart union.
+
+    Examples
+    --------
+    ```py
+    from typing import Annotated
+
+    from laktory.models import BaseModel
+    from laktory.typing import VariableOr
+
+
+    class Cluster(BaseModel):
+        num_workers: Annotated[int, VariableOr()] = None
+
+
+    print(Cluster(num_workers=2).num_workers)
+    # > 2
+    print(Cluster(num_workers="${vars.workers}").num_workers)
+    # > ${vars.workers}
+    ```
+    """
+
+    def __get_pydantic_core_schema__(
+        self, source: type, handler: callable
+    ) -> CoreSchema:
+        return core_schema.union_schema(
+            [core_schema.str_schema(strict=True), handler(source)],
+            mode="left_to_right",
+        )
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, VariableOr)
+
+    def __hash__(self) -> int:
+        return hash(VariableOr)
+
+    def __repr__(self) -> str:
+        return "VariableOr()"
+
+
 # ResolvableBool: TypeAlias = Union[bool, var]
 # """Boolean or laktory variable that can be resolved as a boolean"""
 #
@@ -0,0 +1,41 @@
+"""
+Benchmark import time of laktory entry points. Each statement is executed in a
+fresh interpreter and the median of multiple runs is reported.
+
+Usage:
+    python scripts/benchmarks/import_time.py
+"""
+
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import laktory",
+    "import laktory.cli",
+    "from laktory import models; models.Pipeline",
+    "from laktory import models; models.Stack",
+    "from laktory import models; models.Stack(name='s')",
+]
+
+N_RUNS = 5
+
+
+def timeit(statement):
+    code = (
+        "import time; t0 = time.perf_counter(); "
+        f"{statement}; "
+        "print(time.perf_counter() - t0)"
+    )
+    durations = []
+    for _ in range(N_RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        durations.append(float(out.stdout.strip().split("\n")[-1]))
+    return statistics.median(durations)
+
+
+if __name__ == "__main__":
+    for s in STATEMENTS:
+        print(f"{timeit(s) * 1000:8.1f} ms | {s}")
@@ -0,0 +1,79 @@
+"""
+Benchmark the configuration loading time of a single node task of a pipeline
+deployed with the `DATABRICKS_JOB` orchestrator. The full pipeline
+configuration (`config.json`) is compared with the compact configuration of
+the executed node (`nodes_config.json`) for increasing pipeline sizes.
+
+Usage:
+    python scripts/benchmarks/job_task_startup.py
+"""
+
+import json
+import timeit
+
+from laktory import models
+
+N_NODES = [10, 100, 500]
+N_RUNS = 5
+
+
+def build_pipeline(n_nodes):
+    nodes = [
+        {
+            "name": "node_0",
+            "source": {"path": "/data/node_0", "format": "JSON"},
+            "sinks": [{"path": "/tables/node_0", "format": "PARQUET"}],
+        }
+    ]
+    for i in range(1, n_nodes):
+        nodes.append(
+            {
+                "name": f"node_{i}",
+                "source": {"node_name": f"node_{i - 1}"},
+                "transformer": {
+                    "nodes": [
+                        {
+                            "func_name": "withColumn",
+                            "func_kwargs": {"colName": "x", "col": "lit(1)"},
+                        }
+                    ]
+                },
+                "sinks": [{"path": f"/tables/node_{i}", "format": "PARQUET"}],
+            }
+        )
+    return models.Pipeline(name="pl-bench", nodes=nodes)
+
+
+def load_full(json_data, node_name):
+    pl = models.Pipeline.model_validate_json(json_data)
+    return pl.nodes_dict[node_name]
+
+
+def load_node(json_data, node_name):
+    pl = models.Pipeline.model_validate_node_json(json_data, node_name)
+    return pl.nodes_dict[node_name]
+
+
+if __name__ == "__main__":
+    for n in N_NODES:
+        pl = build_pipeline(n)
+        node_name = f"node_{n // 2}"
+        full_json = pl.model_dump_json(exclude_unset=True)
+        nodes_json = json.dumps(
+            {node.name: pl.get_node_config(node.name) for node in pl.nodes}
+        )
+
+        t_full = min(
+            timeit.repeat(
+                lambda: load_full(full_json, node_name), number=1, repeat=N_RUNS
+            )
+        )
+        t_node = min(
+            timeit.repeat(
+                lambda: load_node(nodes_json, node_name), number=1, repeat=N_RUNS
+            )
+        )
+        print(
+            f"{n:5d} nodes | full: {t_full * 1000:8.1f} ms | "
+            f"node: {t_node * 1000:8.1f} ms | speedup: {t_full / t_node:6.1f}x"
+        )
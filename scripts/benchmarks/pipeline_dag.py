@@ -0,0 +1,100 @@
+"""
+Benchmark pipeline graph operations for increasing pipeline sizes. Each node
+reads from the previous one and joins the node at half its index, which
+produces a DAG with a depth of about `n` and a fan-out of 2.
+
+Measured operations:
+- validation of the pipeline with the `DATABRICKS_JOB` orchestrator, which
+  builds one job task (and its dependencies) per node
+- topological sort of the nodes (`sorted_nodes`)
+- lookup of every node by name (`nodes_dict`)
+
+Lookups are expected to be constant time: the script fails if the time per
+lookup grows by more than `MAX_LOOKUP_GROWTH` between the smallest and the
+largest pipelines.
+
+Usage:
+    python scripts/benchmarks/pipeline_dag.py [max_nodes]
+"""
+
+import sys
+import time
+
+from laktory import models
+
+N_NODES = [10, 100, 500, 1000, 5000]
+MAX_LOOKUP_GROWTH = 5
+
+
+def build_data(n_nodes):
+    nodes = [
+        {
+            "name": "node_0",
+            "source": {"path": "/data/node_0", "format": "JSON"},
+            "sinks": [{"path": "/tables/node_0", "format": "PARQUET"}],
+        }
+    ]
+    for i in range(1, n_nodes):
+        nodes.append(
+            {
+                "name": f"node_{i}",
+                "source": {"node_name": f"node_{i - 1}"},
+                "transformer": {
+                    "nodes": [
+                        {
+                            "func_name": "join",
+                            "func_kwargs": {
+                                "other": {"node_name": f"node_{i // 2}"},
+                                "on": "id",
+                            },
+                        }
+                    ]
+                },
+                "sinks": [{"path": f"/tables/node_{i}", "format": "PARQUET"}],
+            }
+        )
+    return {
+        "name": "pl-bench",
+        "orchestrator": "DATABRICKS_JOB",
+        "databricks_job": {"name": "job-pl-bench"},
+        "nodes": nodes,
+    }
+
+
+def timed(func):
+    t0 = time.perf_counter()
+    output = func()
+    return output, time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    max_nodes = int(sys.argv[1]) if len(sys.argv) > 1 else max(N_NODES)
+
+    # Warm-up (lazy imports)
+    models.Pipeline.model_validate(build_data(2))
+
+    print(
+        f"{'nodes':>6s} | {'validation':>12s} | {'sorted_nodes':>12s} | {'lookups':>12s}"
+    )
+    lookup_times = {}
+    for n in N_NODES:
+        if n > max_nodes:
+            break
+        data = build_data(n)
+        pl, t_validate = timed(lambda: models.Pipeline.model_validate(data))
+        _, t_sort = timed(lambda: pl.sorted_nodes)
+        _, t_lookup = timed(lambda: [pl.nodes_dict[f"node_{i}"] for i in range(n)])
+        lookup_times[n] = t_lookup / n
+        print(
+            f"{n:6d} | {t_validate * 1000:9.1f} ms | {t_sort * 1000:9.1f} ms | "
+            f"{t_lookup * 1000:9.1f} ms"
+        )
+
+    # Lookup scaling
+    n_min, n_max = min(lookup_times), max(lookup_times)
+    growth = lookup_times[n_max] / lookup_times[n_min]
+    print(f"Lookup time growth from {n_min} to {n_max} nodes: {growth:.1f}x")
+    if growth > MAX_LOOKUP_GROWTH:
+        raise RuntimeError(
+            f"Node lookups do not scale: {growth:.1f}x slower per lookup with {n_max} nodes"
+        )
@@ -0,0 +1,49 @@
+"""
+Benchmark Polars uuid expression. The legacy implementation (one Python
+callback per row) is compared with the vectorized random (version 4 and 7)
+and deterministic (version 5) implementations.
+
+Usage:
+    python scripts/benchmarks/polars_uuid.py
+"""
+
+import timeit
+import uuid
+
+import polars as pl
+
+import laktory  # noqa: F401
+
+N_ROWS = [10_000, 100_000, 1_000_000]
+N_RUNS = 3
+
+
+def legacy_uuid() -> pl.Expr:
+    return pl.first().map_elements(lambda _: str(uuid.uuid4()), return_dtype=pl.Utf8)
+
+
+EXPRESSIONS = {
+    "legacy": legacy_uuid,
+    "v4": lambda: pl.Expr.laktory.uuid(),
+    "v7": lambda: pl.Expr.laktory.uuid(version=7),
+    "v5": lambda: pl.Expr.laktory.uuid(columns=["id", "symbol"]),
+}
+
+
+def bench(n: int) -> dict[str, float]:
+    df = pl.DataFrame({"id": range(n), "symbol": ["AAPL", "GOOGL"] * (n // 2)})
+    durations = {}
+    for _ in range(N_RUNS):
+        for name, expr in EXPRESSIONS.items():
+            t = timeit.timeit(lambda: df.with_columns(uuid=expr()), number=1)
+            durations[name] = min(durations.get(name, t), t)
+    return durations
+
+
+if __name__ == "__main__":
+    for n in N_ROWS:
+        durations = bench(n)
+        print(
+            f"{n:>9d} rows | "
+            + " | ".join(f"{k}: {v * 1000:8.1f} ms" for k, v in durations.items())
+        )
@@ -0,0 +1,140 @@
+"""
+Benchmark validation throughput of laktory models. The same model hierarchy
+is declared with plain pydantic annotations (no variables support), with the
+legacy annotations (smart union between each type and `var`) and with the
+current ones (`VariableOr`) and validated against the same payload, with and
+without variables.
+
+Usage:
+    python scripts/benchmarks/validation.py
+"""
+
+import timeit
+import typing
+from typing import Any
+from typing import Union
+from typing import get_args
+from typing import get_origin
+
+from pydantic import BaseModel
+from pydantic import ConfigDict
+from pydantic import ValidationError
+from pydantic._internal._model_construction import ModelMetaclass as _ModelMetaclass
+
+from laktory.models.basemodel import ModelMetaclass
+from laktory.typing import var
+
+N_NODES = 2000
+N_RUNS = 30
+
+
+class LegacyModelMetaclass(_ModelMetaclass):
+    def __new__(mcs, cls_name, bases, namespace, **kwargs):
+        for field_name, type_hint in namespace.get("__annotations__", {}).items():
+            if field_name.startswith("_"):
+                continue
+            if type_hint is None or type_hint is typing.Any:
+                continue
+            origin = get_origin(type_hint)
+            args = get_args(type_hint)
+            if origin is list:
+                type_hint = list[Union[args[0], var]]
+            elif origin is dict:
+                type_hint = dict[Union[args[0], var], Union[args[1], var]]
+            namespace["__annotations__"][field_name] = Union[type_hint, var]
+        return super().__new__(mcs, cls_name, bases, namespace, **kwargs)
+
+
+def build_models(metaclass):
+    class Base(BaseModel, metaclass=metaclass):
+        model_config = ConfigDict(extra="forbid")
+
+    class Column(Base):
+        name: str
+        type: str = "string"
+        nullable: bool = True
+        precision: int = None
+
+    class Expectation(Base):
+        name: str
+        expr: str = None
+        action: str = "WARN"
+        tolerance: float = 0.0
+
+    class Source(Base):
+        path: str = None
+        format: str = "DELTA"
+        as_stream: bool = False
+        read_options: dict[str, str] = {}
+
+    class Node(Base):
+        name: str
+        source: Source = None
+        columns: list[Column] = []
+        expectations: list[Expectation] = []
+        primary_keys: list[str] = None
+        timeout: int = None
+        drop_duplicates: bool = False
+        tags: dict[str, str] = {}
+
+    class Pipeline(Base):
+        name: str
+        nodes: list[Node] = []
+
+    return Pipeline
+
+
+def build_payload(with_variables=False):
+    nodes = []
+    for i in range(N_NODES):
+        nodes.append(
+            {
+                "name": f"node_{i}",
+                "source": {
+                    "path": f"/data/{i}",
+                    "as_stream": "${vars.stream}" if with_variables else True,
+                    "read_options": {"header": "true"},
+                },
+                "columns": [
+                    {"name": f"c{j}", "type": "double", "precision": 3}
+                    for j in range(5)
+                ],
+                "expectations": [
+                    {"name": "positive", "expr": "x > 0", "tolerance": 0.05}
+                ],
+                "primary_keys": ["c0"],
+                "timeout": "${vars.timeout}" if with_variables else 60,
+                "tags": {"owner": "laktory"},
+            }
+        )
+    return {"name": "pl", "nodes": nodes}
+
+
+def bench(models: dict[str, Any], payload: dict) -> dict[str, float]:
+    # Runs are interleaved and the best one kept to limit the impact of noise
+    durations = {}
+    for _ in range(N_RUNS):
+        for name, model in models.items():
+            try:
+                t = timeit.timeit(lambda: model.model_validate(payload), number=1)
+            except ValidationError:
+                continue
+            durations[name] = min(durations.get(name, t), t)
+    return durations
+
+
+if __name__ == "__main__":
+    models = {
+        "pydantic": build_models(_ModelMetaclass),
+        "legacy": build_models(LegacyModelMetaclass),
+        "current": build_models(ModelMetaclass),
+    }
+
+    for with_variables in [False, True]:
+        payload = build_payload(with_variables=with_variables)
+        durations = bench(models, payload)
+        label = "with variables" if with_variables else "without variables"
+        print(
+            f"{label:>18s} | "
+            + " | ".join(f"{k}: {v * 1000:6.1f} ms" for k, v in durations.items())
+        )
@@ -0,0 +1,65 @@
+"""
+Benchmark Polars window filter on skewed partitions (Zipf distributed
+partition keys). Selecting the top rows of each window before numbering
+them is compared with numbering all the rows of fully sorted windows.
+
+Usage:
+    python scripts/benchmarks/window_filter.py
+"""
+
+import importlib
+import random
+import timeit
+
+import polars as pl
+
+import laktory  # noqa: F401
+
+# Module (the package exposes the function under the same name)
+window_filter = importlib.import_module("laktory.polars.dataframe.window_filter")
+
+N_ROWS = 5_000_000
+N_PARTITIONS = [10, 1_000, 100_000]
+ROWS_TO_KEEP = [1, 5]
+N_RUNS = 3
+
+
+def build_df(n_partitions: int) -> pl.DataFrame:
+    rng = random.Random(0)
+    weights = [1.0 / (i + 1) ** 1.3 for i in range(n_partitions)]
+    return pl.DataFrame(
+        {
+            "symbol": rng.choices(range(n_partitions), weights=weights, k=N_ROWS),
+            "created_at": [rng.random() for _ in range(N_ROWS)],
+        }
+    )
+
+
+def bench(df: pl.DataFrame, rows_to_keep: int) -> dict[str, float]:
+    default = window_filter.TOP_K_MAX_ROWS
+    durations = {}
+    for _ in range(N_RUNS):
+        for name, top_k_max_rows in [("sort", 0), ("top_k", default)]:
+            window_filter.TOP_K_MAX_ROWS = top_k_max_rows
+            t = timeit.timeit(
+                lambda: df.laktory.window_filter(
+                    partition_by=["symbol"],
+                    order_by=[{"sql_expression": "created_at", "desc": True}],
+                    rows_to_keep=rows_to_keep,
+                ),
+                number=1,
+            )
+            durations[name] = min(durations.get(name, t), t)
+    window_filter.TOP_K_MAX_ROWS = default
+    return durations
+
+
+if __name__ == "__main__":
+    for n_partitions in N_PARTITIONS:
+        df = build_df(n_partitions)
+        for rows_to_keep in ROWS_TO_KEEP:
+            durations = bench(df, rows_to_keep)
+            print(
+                f"{n_partitions:>7d} partitions | keep {rows_to_keep} | "
+                + " | ".join(f"{k}: {v * 1000:7.1f} ms" for k, v in durations.items())
+            )
@@ -2,6 +2,7 @@ import os
 import shutil
 import uuid
 
+import pytest
 from py import path as pypath
 from typer.testing import CliRunner
 
@@ -188,6 +189,84 @@ def atest_deploy_quickstart_stacks():
         _deploy_stack(template, backend, env)
 
 
+def test_preview_multiple_envs(monkeypatch):
+    from laktory.cli._common import CLIController
+
+    dirpath = pypath.local(f"{paths.tmp}/multi_envs_{str(uuid.uuid4())}")
+    os.mkdir(dirpath)
+    shutil.copy(paths.data / "stack.yaml", dirpath / "stack.yaml")
+
+    # Fake pulumi executable
+    bin_dir = dirpath / "bin"
+    os.mkdir(bin_dir)
+    with open(bin_dir / "pulumi", "w") as fp:
+        fp.write("#!/bin/sh\necho $@\n[ -f Pulumi.yaml ]\n")
+    os.chmod(bin_dir / "pulumi", 0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    with dirpath.as_cwd():
+        controller = CLIController(env="dev,prod", max_parallel=2)
+        results = controller.envs_call("preview")
+
+        # Deploy requires auto approval
+        with pytest.raises(ValueError):
+            controller.envs_call("up")
+
+    assert results == {"dev": True, "prod": True}
+    pl_dev = (dirpath / ".laktory" / "dev" / "Pulumi.yaml").read()
+    pl_prod = (dirpath / ".laktory" / "prod" / "Pulumi.yaml").read()
+    assert "development: false" not in pl_dev
+    assert "development: false" in pl_prod
+
+    # Cleanup
+    shutil.rmtree(dirpath)
+
+
+def test_plan_multiple_envs_state(monkeypatch):
+    from laktory.cli._common import CLIController
+
+    dirpath = pypath.local(f"{paths.tmp}/multi_envs_tf_{str(uuid.uuid4())}")
+    os.mkdir(dirpath)
+    stack = (paths.data / "stack.yaml").read_text()
+    stack = stack.replace("backend: pulumi", "backend: terraform")
+    with open(dirpath / "stack.yaml", "w") as fp:
+        fp.write(stack)
+
+    # Fake terraform executable writing its local state in working directory
+    bin_dir = dirpath / "bin"
+    os.mkdir(bin_dir)
+    with open(bin_dir / "terraform", "w") as fp:
+        fp.write("#!/bin/sh\necho $@\ntouch terraform.tfstate\n")
+    os.chmod(bin_dir / "terraform", 0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    # Local state is not shared with per-environment working directories
+    with dirpath.as_cwd():
+        controller = CLIController(env="dev,prod")
+        with pytest.raises(ValueError):
+            controller.envs_call("plan")
+    assert not (dirpath / ".laktory").exists()
+
+    # Remote state backend
+    backend = "terraform:\n  backend:\n    azurerm:\n      key: laktory.tfstate\n"
+    with open(dirpath / "stack.yaml", "w") as fp:
+        fp.write(stack + backend)
+
+    with dirpath.as_cwd():
+        controller = CLIController(env="dev,prod")
+        results = controller.envs_call("plan")
+
+    assert results == {"dev": True, "prod": True}
+    for env in ["dev", "prod"]:
+        env_dirpath = dirpath / ".laktory" / env
+        assert "azurerm" in (env_dirpath / "stack.tf.json").read()
+        assert (env_dirpath / "terraform.tfstate").exists()
+    assert not (dirpath / "terraform.tfstate").exists()
+
+    # Cleanup
+    shutil.rmtree(dirpath)
+
+
 def test_quickstart_localpipeline():
     dirpath = pypath.local(f"{paths.tmp}/quickstart_local_pipeline_{str(uuid.uuid4())}")
     # stack_filepath = dirpath / "stack.yaml"
@@ -1,5 +1,7 @@
 import json
+import time
 from datetime import datetime
+from types import SimpleNamespace
 from zoneinfo import ZoneInfo
 
 import pytest
@@ -140,6 +142,168 @@ def test_event_without_tstamp():
     )
 
 
+def _get_events(events_root, n=5):
+    return [
+        models.DataEvent(
+            name="stock_price",
+            producer={"name": "yahoo-finance"},
+            events_root=events_root,
+            data={"created_at": datetime(2023, 9, 1 + i % 2), "symbol": "AAPL", "i": i},
+        )
+        for i in range(n)
+    ]
+
+
+def test_writer(tmp_path):
+    events_root = str(tmp_path) + "/"
+    events = _get_events(events_root)
+
+    # Micro-batches of 2 events for each day
+    with models.DataEventWriter(max_events=2) as writer:
+        writer.write(events)
+        assert writer.buffered_count == 1
+    assert writer.buffered_count == 0
+    assert len(writer.filepaths) == 3
+
+    dirpath = tmp_path / "yahoo-finance" / "stock_price" / "2023" / "09" / "01"
+    filepaths = sorted(dirpath.glob("stock_price_*_20230901T000000000Z.ndjson"))
+    lines = [json.loads(line) for f in filepaths for line in f.read_text().splitlines()]
+    assert sorted([line["data"]["i"] for line in lines]) == [0, 2, 4]
+    assert lines[0] == events[int(lines[0]["data"]["i"])].model_dump()
+
+
+def test_writer_interval(tmp_path):
+    events = _get_events(str(tmp_path) + "/", n=1)
+
+    writer = models.DataEventWriter(max_interval=0.05)
+    writer.write(events)
+    for _ in range(100):
+        if writer.filepaths:
+            break
+        time.sleep(0.01)
+    assert len(writer.filepaths) == 1
+    writer.close()
+
+
+def test_writer_parquet(tmp_path):
+    import polars as pl
+
+    events = _get_events(str(tmp_path) + "/")
+
+    with models.DataEventWriter(fmt="parquet") as writer:
+        writer.write(events)
+
+    df = pl.concat([pl.read_parquet(f) for f in sorted(writer.filepaths)])
+    assert df.columns == ["data", "description", "name", "producer"]
+    assert df.height == 5
+    assert df["data"].struct.field("_name").unique().to_list() == ["stock_price"]
+
+
+def test_writer_s3():
+    class StubBucket:
+        def __init__(self):
+            self.objects = {}
+
+        def put_object(self, Key, Body):
+            self.objects[Key] = Body
+
+    bucket = StubBucket()
+    s3_resource = SimpleNamespace(Bucket=lambda name: bucket)
+
+    with models.DataEventWriter(
+        destination="AWS_S3_BUCKET",
+        bucket_name="landing",
+        s3_resource=s3_resource,
+        max_workers=2,
+    ) as writer:
+        writer.write(_get_events(settings.workspace_landing_root + "events/"))
+
+    assert sorted(bucket.objects) == sorted(writer.filepaths)
+    for key, body in bucket.objects.items():
+        assert key.startswith("events/yahoo-finance/stock_price/2023/09/")
+        assert len(body.splitlines()) in [2, 3]
+
+
+def _get_batch(events_root, n=5):
+    return models.DataEventBatch(
+        name="stock_price",
+        producer={"name": "yahoo-finance"},
+        events_root=events_root,
+        data={
+            "created_at": [datetime(2023, 9, 1 + i % 2) for i in range(n)],
+            "symbol": ["AAPL"] * n,
+            "i": list(range(n)),
+        },
+    )
+
+
+def test_batch(tmp_path):
+    import polars as pl
+
+    events_root = str(tmp_path) + "/"
+    batch = _get_batch(events_root)
+    assert batch.count == 5
+    assert batch.data["_created_at"].dtype == pl.Datetime("us", "UTC")
+    assert batch.data["_name"].unique().to_list() == ["stock_price"]
+    assert list(batch.partitions()) == [
+        events_root + "yahoo-finance/stock_price/2023/09/01/",
+        events_root + "yahoo-finance/stock_price/2023/09/02/",
+    ]
+
+    # Records with mixed offsets
+    batch = models.DataEventBatch(
+        name="stock_price",
+        data=[
+            {"created_at": "2023-09-01T02:00:00+02:00", "i": 0},
+            {"created_at": "2023-09-01T00:00:00", "i": 1},
+        ],
+    )
+    assert (
+        batch.data["_created_at"].to_list()
+        == [datetime(2023, 9, 1, tzinfo=ZoneInfo("UTC"))] * 2
+    )
+
+    # Same content as individual events
+    events = _get_events(events_root)
+    assert [e.model_dump() for e in _get_batch(events_root).to_events()] == [
+        e.model_dump() for e in events
+    ]
+
+
+def test_batch_to_path(tmp_path):
+    import polars as pl
+
+    events_root = str(tmp_path) + "/"
+    batch = _get_batch(events_root)
+    events = _get_events(events_root)
+
+    filepaths = batch.to_path(fmt="ndjson", suffix="s0")
+    assert len(filepaths) == 2
+    assert filepaths[0].endswith("2023/09/01/stock_price_s0_20230901T000000000Z.ndjson")
+    with open(filepaths[0]) as fp:
+        lines = [json.loads(line) for line in fp.readlines()]
+    assert [line["data"]["i"] for line in lines] == [0, 2, 4]
+    assert lines[1] == events[2].model_dump()
+
+    filepaths = batch.to_path(fmt="parquet")
+    df = pl.concat([pl.read_parquet(f) for f in filepaths])
+    assert df.columns == ["data", "description", "name", "producer"]
+    assert df.height == 5
+
+
+def test_writer_batch(tmp_path):
+    events_root = str(tmp_path) + "/"
+
+    with models.DataEventWriter(max_events=2) as writer:
+        writer.write(_get_batch(events_root))
+        assert writer.buffered_count == 0
+    assert len(writer.filepaths) == 2
+
+    with open(sorted(writer.filepaths)[1]) as fp:
+        lines = fp.readlines()
+    assert len(lines) == 2
+
+
 @pytest.mark.skipif(
     not settings.lakehouse_sa_conn_str,
     reason="Storage account connection string missing.",
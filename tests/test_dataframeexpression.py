@@ -1,4 +1,5 @@
 import polars as pl
+import pytest
 from pyspark.sql import functions as F
 
 from laktory import models
@@ -48,6 +49,23 @@ def test_eval():
     assert str(e2.eval(dataframe_backend="POLARS")) == str(pl.col("symbol"))
 
 
+def test_units():
+    for e in [
+        "F.laktory.convert_units('x', 'm', 'ft')",
+        "pl.col('x').laktory.convert_units('C', output_unit='F')",
+        "pl.Expr.laktory.convert_units(pl.col('x'), '${vars.unit}', 'ft')",
+    ]:
+        models.DataFrameColumnExpression(value=e)
+
+    for e in [
+        "F.laktory.convert_units('x', 'm', 'kg')",
+        "pl.col('x').laktory.convert_units(input_unit='C', output_unit='ft')",
+    ]:
+        with pytest.raises(ValueError):
+            models.DataFrameColumnExpression(value=e)
+
+
 if __name__ == "__main__":
     test_expression_types()
     test_eval()
+    test_units()
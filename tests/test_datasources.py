@@ -1,4 +1,5 @@
 import pandas as pd
+import pytest
 
 from laktory._testing import Paths
 from laktory._testing import sparkf
@@ -232,9 +233,6 @@ def test_file_data_source_polars():
             "low2": "low",
             "high2": "high",
         },
-        # sample={
-        #     "fraction": 0.5,
-        # },
     )
     df = source.read().collect()
 
@@ -242,6 +240,63 @@ def test_file_data_source_polars():
     assert df.columns == ["created_at", "symbol", "open", "close", "high", "low"]
     assert df.height == 20
 
+    # Sample
+    source.sample = {"fraction": 0.5, "seed": 1}
+    df_sample = source.read().collect()
+    assert 0 < df_sample.height < 20
+    assert df_sample["open"].min() > 300
+    assert df_sample.equals(source.read().collect())
+
+
+def test_file_data_source_polars_incremental(tmp_path):
+    import polars as pl
+
+    def _write(x, mode="append"):
+        pl.DataFrame({"x": x}).write_delta(
+            tmp_path / "table",
+            mode=mode,
+            delta_write_options={
+                "configuration": {"delta.enableChangeDataFeed": "true"}
+            },
+        )
+
+    source = FileDataSource(
+        path=tmp_path / "table",
+        format="DELTA",
+        dataframe_backend="POLARS",
+        incremental={"checkpoint_location": str(tmp_path / "checkpoint.json")},
+    )
+
+    # Initial read
+    _write([1, 2, 3], mode="overwrite")
+    assert source.read().collect()["x"].to_list() == [1, 2, 3]
+    source.commit_incremental()
+    assert source.read_incremental_version() == 0
+
+    # Changes
+    _write([4, 5])
+    assert source.read().collect()["x"].to_list() == [4, 5]
+
+    # Changes are read again until committed
+    assert source.read().collect()["x"].to_list() == [4, 5]
+    source.commit_incremental()
+    assert source.read().collect().height == 0
+
+    # Change data feed not enabled
+    pl.DataFrame({"x": [1]}).write_delta(tmp_path / "table_no_cdf")
+    pl.DataFrame({"x": [2]}).write_delta(tmp_path / "table_no_cdf", mode="append")
+    source = FileDataSource(
+        path=tmp_path / "table_no_cdf",
+        format="DELTA",
+        dataframe_backend="POLARS",
+        incremental={"checkpoint_location": str(tmp_path / "checkpoint_no_cdf.json")},
+    )
+    source.read()
+    source.commit_incremental()
+    pl.DataFrame({"x": [3]}).write_delta(tmp_path / "table_no_cdf", mode="append")
+    with pytest.raises(ValueError, match="enableChangeDataFeed"):
+        source.read()
+
 
 def test_memory_data_source(df0=df0):
     source = MemoryDataSource(
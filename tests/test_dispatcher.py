@@ -1,8 +1,19 @@
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+from databricks.sdk.service.jobs import RunLifeCycleState
+from databricks.sdk.service.pipelines import UpdateInfoState
+
 from laktory import models
 from laktory._testing import MonkeyPatch
 from laktory._testing import Paths
 from laktory._version import VERSION
 from laktory.dispatcher import Dispatcher
+from laktory.dispatcher import DLTPipelineRunner
+from laktory.dispatcher import JobRunner
+from laktory.dispatcher import RunMonitor
 
 paths = Paths(__file__)
 
@@ -48,6 +59,303 @@ def test_resources():
     assert dlt.model_dump() == {"name": "${vars.workflow_name}", "id": None}
 
 
+class StubJobs:
+    def __init__(self, states=None):
+        self.calls = []
+        self.states = states or {}
+        self.polls = 0
+        self.job_id = 123
+        self.deleted_ids = []
+
+    def list(self, name=None):
+        self.calls.append(name)
+        job_id = self.job_id
+        yield SimpleNamespace(
+            job_id=job_id,
+            as_dict=lambda: {"job_id": job_id, "settings": {"name": name}},
+        )
+
+    def list_runs(self, job_id, active_only=True):
+        if job_id in self.deleted_ids:
+            raise ValueError(f"Job {job_id} does not exist")
+        return []
+
+    def run_now(self, job_id, only=None, job_parameters=None):
+        self.only = only
+        self.job_parameters = job_parameters
+        return SimpleNamespace(run_id=job_id)
+
+    def get_run(self, run_id):
+        self.polls += 1
+        states = self.states[run_id]
+        state = states.pop(0) if len(states) > 1 else states[0]
+        return SimpleNamespace(
+            run_page_url="",
+            state=SimpleNamespace(
+                life_cycle_state=RunLifeCycleState(state), state_message=""
+            ),
+            tasks=[],
+        )
+
+
+class StubPipelines:
+    def __init__(self, states=None):
+        self.calls = []
+        self.states = states or {}
+        self.polls = 0
+
+    def list_pipelines(self, filter=None, max_results=None):
+        name = filter.split("'")[1]
+        self.calls.append(name)
+        yield SimpleNamespace(name=name, pipeline_id="abc")
+
+    def start_update(self, pipeline_id, **kwargs):
+        self.update_kwargs = kwargs
+        return SimpleNamespace(update_id=pipeline_id)
+
+    def get_update(self, pipeline_id, update_id):
+        self.polls += 1
+        states = self.states[pipeline_id]
+        state = states.pop(0) if len(states) > 1 else states[0]
+        return SimpleNamespace(update=SimpleNamespace(state=UpdateInfoState(state)))
+
+    def list_pipeline_events(self, **kwargs):
+        return []
+
+
+class StubWorkspaceClient:
+    def __init__(self, job_states=None, pipeline_states=None):
+        self.jobs = StubJobs(job_states)
+        self.pipelines = StubPipelines(pipeline_states)
+        self.config = SimpleNamespace(host="my-host")
+
+
+def get_stub_dispatcher(ttl=3600):
+    dispatcher = Dispatcher(stack=stack, id_cache_ttl=ttl)
+    dispatcher.id_cache_filepath = str(paths.tmp / "dispatcher-ids.json")
+    dispatcher._workspace_kwargs = {"host": "my-host"}
+    dispatcher._wc = StubWorkspaceClient()
+    return dispatcher
+
+
+def test_get_resource_ids():
+    dispatcher = get_stub_dispatcher()
+    if os.path.exists(dispatcher.id_cache_filepath):
+        os.remove(dispatcher.id_cache_filepath)
+
+    # Targeted resource
+    dispatcher.get_resource_ids(names=["job-stock-prices-ut-stack"])
+    assert dispatcher._wc.jobs.calls == ["job-stock-prices-ut-stack"]
+    assert dispatcher._wc.pipelines.calls == []
+    assert dispatcher.resources["job-stock-prices-ut-stack"].id == 123
+    assert dispatcher.resources["${vars.workflow_name}"].id is None
+
+    # All resources - cached job id is re-used
+    dispatcher = get_stub_dispatcher()
+    dispatcher.get_resource_ids()
+    assert dispatcher._wc.jobs.calls == []
+    assert dispatcher._wc.pipelines.calls == ["${vars.workflow_name}"]
+    assert dispatcher.resources["job-stock-prices-ut-stack"].id == 123
+    assert dispatcher.resources["${vars.workflow_name}"].id == "abc"
+
+    # Expired cache
+    dispatcher = get_stub_dispatcher(ttl=0.1)
+    time.sleep(0.2)
+    dispatcher.get_resource_ids()
+    assert dispatcher._wc.jobs.calls == ["job-stock-prices-ut-stack"]
+    assert dispatcher._wc.pipelines.calls == ["${vars.workflow_name}"]
+
+    # Disabled cache - workspace host is not resolved
+    dispatcher = get_stub_dispatcher(ttl=0)
+    dispatcher._wc.config = None
+    dispatcher.get_resource_ids()
+    dispatcher.get_resource_ids()
+    assert len(dispatcher._wc.jobs.calls) == 2
+
+    os.remove(dispatcher.id_cache_filepath)
+
+
+def test_resource_ids_cache():
+    name = "job-stock-prices-ut-stack"
+    dispatcher = get_stub_dispatcher()
+    if os.path.exists(dispatcher.id_cache_filepath):
+        os.remove(dispatcher.id_cache_filepath)
+    dispatcher.get_resource_ids(names=[name])
+
+    # Workspaces don't share entries
+    dispatcher = get_stub_dispatcher()
+    dispatcher._wc.config.host = "other-host"
+    dispatcher.get_resource_ids(names=[name])
+    assert dispatcher._wc.jobs.calls == [name]
+
+    # Re-created job - outdated id is replaced
+    dispatcher = get_stub_dispatcher()
+    dispatcher.get_resource_ids(names=[name])
+    assert dispatcher._wc.jobs.calls == []
+    jobs = dispatcher._wc.jobs
+    jobs.job_id = 456
+    jobs.deleted_ids = [123]
+    jobs.states = {456: ["TERMINATED"]}
+    dispatcher.resources[name].run(wait=False)
+    assert dispatcher.resources[name].id == 456
+    assert jobs.calls == [name]
+
+    dispatcher = get_stub_dispatcher()
+    dispatcher.get_resource_ids(names=[name])
+    assert dispatcher._wc.jobs.calls == []
+    assert dispatcher.resources[name].id == 456
+
+    # Failure unrelated to the id
+    dispatcher = get_stub_dispatcher()
+    dispatcher.get_resource_ids(names=[name])
+    dispatcher._wc.jobs.job_id = 456
+    dispatcher._wc.jobs.deleted_ids = [456]
+    with pytest.raises(ValueError):
+        dispatcher.resources[name].run(wait=False)
+
+    os.remove(dispatcher.id_cache_filepath)
+
+
+def test_run_monitor():
+    wc = StubWorkspaceClient(
+        job_states={
+            "job-a": ["PENDING", "RUNNING", "RUNNING", "TERMINATED"],
+            "job-b": ["RUNNING", "INTERNAL_ERROR"],
+        },
+        pipeline_states={"pl-a": ["RUNNING", "COMPLETED"]},
+    )
+    dispatcher = SimpleNamespace(wc=wc)
+    runners = [
+        JobRunner(name="job-a", id="job-a", dispatcher=dispatcher),
+        JobRunner(name="job-b", id="job-b", dispatcher=dispatcher),
+        DLTPipelineRunner(name="pl-a", id="pl-a", dispatcher=dispatcher),
+    ]
+    for r in runners:
+        r.run(wait=False)
+
+    transitions = []
+
+    async def on_state_change(runner, old, new):
+        transitions.append((runner.name, getattr(old, "value", old), new.value))
+
+    monitor = RunMonitor(
+        runners=runners,
+        min_interval=0.001,
+        max_interval=0.004,
+        on_state_change=on_state_change,
+    )
+    results = monitor.run()
+
+    assert [t for t in transitions if t[0] == "job-a"] == [
+        ("job-a", None, "RUNNING"),
+        ("job-a", "RUNNING", "TERMINATED"),
+    ]
+    assert results["job-a"].success
+    assert results["job-a"].state == "TERMINATED"
+    assert not results["job-b"].success
+    assert results["job-b"].state == "INTERNAL_ERROR"
+    assert results["pl-a"].success
+    assert results["pl-a"].state == "COMPLETED"
+    assert not monitor.success
+    assert monitor.summary == {"TERMINATED": 1, "INTERNAL_ERROR": 1, "COMPLETED": 1}
+    assert runners[0].run_state == RunLifeCycleState.TERMINATED
+
+    # Backoff
+    assert monitor.next_interval(0.001) == 0.0015
+    assert monitor.next_interval(0.004) == 0.004
+
+    # Timeout
+    wc.jobs.states["job-c"] = ["RUNNING"]
+    runner = JobRunner(name="job-c", id="job-c", dispatcher=dispatcher)
+    runner.run(wait=False)
+    monitor = RunMonitor(runners=[runner], timeout=0.05, min_interval=0.01)
+    results = monitor.run()
+    assert results["job-c"].timed_out
+    assert results["job-c"].state == "RUNNING"
+    assert not monitor.success
+
+
+def test_job_runner_wait():
+    wc = StubWorkspaceClient(job_states={"job-a": ["RUNNING", "TERMINATED"]})
+    runner = JobRunner(name="job-a", id="job-a", dispatcher=SimpleNamespace(wc=wc))
+    runner.run(wait=True, timeout=5)
+    assert runner.is_successful
+
+    wc.jobs.states["job-a"] = ["RUNNING", "SKIPPED"]
+    with pytest.raises(Exception, match="not completed"):
+        runner.run(wait=True, timeout=5, raise_exception=True)
+
+
+def test_runners_selection():
+    nodes = [
+        {"name": "brz", "source": {"path": "/brz/"}, "sinks": [{"table_name": "brz"}]},
+        {
+            "name": "slv",
+            "source": {"node_name": "brz"},
+            "sinks": [{"table_name": "slv"}],
+        },
+        {
+            "name": "gld_a",
+            "source": {"node_name": "slv"},
+            "sinks": [{"table_name": "gld_a"}],
+        },
+        {
+            "name": "gld_b",
+            "source": {"node_name": "slv"},
+            "sinks": [{"table_name": "gld_b"}],
+        },
+    ]
+
+    # Job
+    pl = models.Pipeline(
+        name="pl-job",
+        orchestrator="DATABRICKS_JOB",
+        databricks_job={"name": "job-pl"},
+        nodes=nodes,
+    )
+    wc = StubWorkspaceClient(job_states={"job-pl": ["TERMINATED"]})
+    runner = JobRunner(
+        name="job-pl", id="job-pl", dispatcher=SimpleNamespace(wc=wc), pipeline=pl
+    )
+    runner.run(wait=False, select=["slv+"], exclude=["gld_b"])
+    assert wc.jobs.only == ["node-slv", "node-gld_a"]
+    runner.run(wait=False)
+    assert wc.jobs.only is None
+
+    # Job - Force
+    runner.run(wait=False, force=True)
+    assert wc.jobs.job_parameters is None
+    pl.databricks_job.skip_unchanged = True
+    runner.run(wait=False, force=True)
+    assert wc.jobs.job_parameters == {"skip_unchanged": "false"}
+
+    # DLT
+    pl = models.Pipeline(
+        name="pl-dlt",
+        orchestrator="DATABRICKS_DLT",
+        databricks_dlt={"name": "pl-dlt"},
+        nodes=nodes,
+    )
+    wc = StubWorkspaceClient(pipeline_states={"pl-dlt": ["COMPLETED"]})
+    runner = DLTPipelineRunner(
+        name="pl-dlt", id="pl-dlt", dispatcher=SimpleNamespace(wc=wc), pipeline=pl
+    )
+    runner.run(wait=False, select=["+slv"])
+    assert wc.pipelines.update_kwargs == {"refresh_selection": ["brz", "slv"]}
+    runner.run(wait=False, select=["gld_*"], full_refresh=True)
+    assert wc.pipelines.update_kwargs == {"full_refresh_selection": ["gld_a", "gld_b"]}
+
+    # Not a laktory pipeline
+    runner = JobRunner(name="job", id="job", dispatcher=SimpleNamespace(wc=wc))
+    with pytest.raises(ValueError):
+        runner.run(wait=False, select=["slv"])
+
+
 if __name__ == "__main__":
     test_workspace_client(MonkeyPatch())
     test_resources()
+    test_get_resource_ids()
+    test_resource_ids_cache()
+    test_run_monitor()
+    test_job_runner_wait()
+    test_runners_selection()
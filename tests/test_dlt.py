@@ -1,4 +1,9 @@
+from pathlib import Path
+
 from laktory import dlt
+from laktory import models
+
+testdir_path = Path(__file__).parent
 
 
 def test_dlt():
@@ -10,5 +15,63 @@ def test_dlt():
     assert hasattr(dlt, "read_stream")
 
 
+def test_define_node(monkeypatch):
+    pl = models.Pipeline(
+        name="pl-dlt",
+        orchestrator="DATABRICKS_DLT",
+        databricks_dlt={"name": "pl-dlt"},
+        dataframe_backend="POLARS",
+        nodes=[
+            {
+                "name": "slv_stock_prices",
+                "source": {
+                    "path": str(testdir_path / "data/slv_stock_prices/*.parquet"),
+                    "format": "PARQUET",
+                },
+                "expectations": [
+                    {"name": "max price", "expr": "close < 330", "action": "QUARANTINE"}
+                ],
+                "sinks": [
+                    {"table_name": "slv_stock_prices"},
+                    {
+                        "table_name": "slv_stock_prices_quarantine",
+                        "is_quarantine": True,
+                    },
+                ],
+            }
+        ],
+    )
+    node = pl.nodes[0]
+
+    # Count node executions
+    executions = []
+    execute = models.PipelineNode.execute
+
+    def _execute(self, *args, **kwargs):
+        executions.append(self.name)
+        return execute(self, *args, **kwargs)
+
+    monkeypatch.setattr(models.PipelineNode, "execute", _execute)
+    monkeypatch.setattr(dlt, "spark", None, raising=False)
+
+    # Stage view and sinks tables
+    wrappers = dlt.define_node(node)
+    assert len(wrappers) == 3
+    assert dlt.get_stage_view_name(node) == "slv_stock_prices_laktory_stage"
+
+    dfs = [dlt.get_df(w).collect() for w in wrappers]
+    assert executions == ["slv_stock_prices"]
+    assert dfs[0].height == 80
+    assert dfs[1].height == 72
+    assert dfs[2].height == 8
+
+    # Single sink
+    node.sinks = node.sinks[:1]
+    wrappers = dlt.define_node(node)
+    assert len(wrappers) == 1
+    assert dlt.get_df(wrappers[0]).collect().height == 72
+    assert executions == ["slv_stock_prices"] * 2
+
+
 if __name__ == "__main__":
     test_dlt()
@@ -1,3 +1,4 @@
+import polars as pl
 import pytest
 from pyspark.sql import functions as F
 
@@ -5,6 +6,8 @@ from laktory import models
 from laktory._testing import Paths
 from laktory._testing import dff
 from laktory.exceptions import DataQualityCheckFailedError
+from laktory.models.dataquality.expectation import ExpectationSample
+from laktory.models.dataquality.expectation import run_checks
 
 paths = Paths(__file__)
 df = dff.slv
@@ -110,6 +113,122 @@ def test_expectations_agg():
     assert dqe.quarantine_filter is None
 
 
+def test_expectations_agg_polars():
+    df = dff.slv_polars
+
+    dqes = [
+        models.DataQualityExpectation(
+            name="price less than 300", action="WARN", expr="pl.col('close') < 300"
+        ),
+        models.DataQualityExpectation(
+            name="rows count", expr="COUNT(*) > 50", type="AGGREGATE"
+        ),
+        models.DataQualityExpectation(
+            name="symbols count",
+            expr="pl.col('symbol').n_unique() > 4",
+            type="AGGREGATE",
+        ),
+    ]
+    checks = run_checks(dqes, df)
+    assert [c.rows_count for c in checks] == [80, 80, 80]
+    assert [c.fails_count for c in checks] == [20, None, None]
+    assert [c.status for c in checks] == ["FAIL", "PASS", "FAIL"]
+
+    # Lazy and empty
+    check = dqes[2].run_check(df.lazy().filter(pl.col("close") < 0))
+    assert check.rows_count == 0
+    assert check.status == "PASS"
+
+
+def test_expectations_approx():
+    dqe = models.DataQualityExpectation(
+        name="symbols count",
+        expr="COUNT(DISTINCT symbol) > 3 AND median(close) < 300",
+        type="AGGREGATE",
+        approx_relative_error=0.01,
+    )
+    dqe._dataframe_backend = "SPARK"
+    assert str(dqe.agg_expr) == str(
+        F.expr(
+            "approx_count_distinct(symbol, 0.01) > 3 AND percentile_approx(close, 0.5, 100) < 300"
+        )
+    )
+    check = dqe.run_check(df)
+    assert check.status == "PASS"
+
+    dqe = models.DataQualityExpectation(
+        name="symbols count",
+        expr="pl.col('symbol').n_unique() > 3",
+        type="AGGREGATE",
+        approx_relative_error=0.01,
+    )
+    with pytest.warns(UserWarning, match="not configurable with Polars"):
+        check = dqe.run_check(dff.slv_polars)
+    assert check.status == "PASS"
+
+    with pytest.raises(ValueError):
+        models.DataQualityExpectation(
+            name="price less than 300",
+            expr="close < 300",
+            approx_relative_error=0.01,
+        )
+
+    # Above Spark HyperLogLog++ maximum error
+    with pytest.raises(ValueError):
+        models.DataQualityExpectation(
+            name="symbols count",
+            expr="COUNT(DISTINCT symbol) > 3",
+            type="AGGREGATE",
+            approx_relative_error=0.5,
+        )
+
+
+def test_expectations_sample():
+    df = dff.slv_polars
+
+    def _dqe(expr, rel, **sample):
+        return models.DataQualityExpectation(
+            name=expr, expr=expr, tolerance={"rel": rel}, sample=sample
+        )
+
+    dqes = [
+        # Decided from sample
+        _dqe("pl.col('close') < 300", 0.05, fraction=0.5, seed=1),
+        _dqe("pl.col('close') > 0", 0.5, rows=20, seed=1),
+        # Too close to tolerance
+        _dqe("pl.col('close') > 127", 0.05, fraction=0.5, seed=1, margin=0.5),
+    ]
+    checks = run_checks(dqes, df)
+    assert [c.status for c in checks] == ["FAIL", "PASS", "PASS"]
+    assert 20 < checks[0].sample_rows_count < 60
+    rate = checks[0].sample_fails_count / checks[0].sample_rows_count
+    lower, upper = checks[0].failure_rate_interval
+    assert lower < rate < upper
+    assert checks[0].fails_count == round(rate * 80)
+    assert checks[1].sample_fails_count == 0
+    assert checks[2].sample_rows_count is None
+    assert checks[2].fails_count == 3
+
+    # Same seed, same sample
+    checks1 = run_checks(dqes[:1], df)
+    assert checks1[0].sample_fails_count == checks[0].sample_fails_count
+    assert checks1[0].sample_rows_count == checks[0].sample_rows_count
+
+    # Interval
+    sample = ExpectationSample(fraction=0.1)
+    assert sample.get_interval(0, 100) == (0.0, pytest.approx(0.037, abs=1e-3))
+    assert sample.get_interval(50, 100) == (
+        pytest.approx(0.404, abs=1e-3),
+        pytest.approx(0.596, abs=1e-3),
+    )
+
+    # Invalid
+    with pytest.raises(ValueError):
+        ExpectationSample(fraction=0.1, rows=10)
+    with pytest.raises(ValueError):
+        _dqe("close < 300", None, fraction=0.1)
+
+
 def test_expectations_empty():
     # Spark Expression
     dqe = models.DataQualityExpectation(
@@ -156,5 +275,8 @@ if __name__ == "__main__":
     test_expectations_abs()
     test_expectations_rel()
     test_expectations_agg()
+    test_expectations_agg_polars()
+    test_expectations_approx()
+    test_expectations_sample()
     test_expectations_empty()
     test_expectations_exceptions_warnings()
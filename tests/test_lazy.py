@@ -0,0 +1,93 @@
+import subprocess
+import sys
+import types
+
+from laktory._lazy import attach
+from laktory._lazy import when_imported
+
+
+def _imported_modules(statement):
+    code = f"import sys; {statement}; print(','.join(sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(out.stdout.strip().split(","))
+
+
+def test_import_laktory():
+    modules = _imported_modules("import laktory")
+
+    for name in [
+        "laktory.models",
+        "laktory.models.resources.databricks",
+        "laktory.models.grants",
+        "laktory.spark",
+        "pyspark",
+        "pandas",
+    ]:
+        assert name not in modules
+
+
+def test_import_cli():
+    modules = _imported_modules("import laktory.cli")
+
+    assert "laktory.models.stacks.stack" not in modules
+    assert "laktory.models.resources.databricks.job" not in modules
+
+
+def test_import_spark_without_connect():
+    modules = _imported_modules("import laktory.spark")
+
+    assert "laktory.spark.dataframe" in modules
+    assert "pyspark.sql.connect.dataframe" not in modules
+
+
+def test_namespaces():
+    modules = _imported_modules(
+        "import laktory; import polars as pl; assert pl.DataFrame().laktory"
+    )
+    assert "laktory.polars" in modules
+    assert "laktory.models" not in modules
+
+
+def test_attach():
+    from laktory import models
+
+    assert "Pipeline" in models.__all__
+    assert "Pipeline" in dir(models)
+    assert models.Pipeline.__name__ == "Pipeline"
+    assert models.resources.databricks.Job.__name__ == "Job"
+    assert models.grants.TableGrant.__name__ == "TableGrant"
+
+    __getattr__, _, _ = attach("laktory.models", attributes={})
+    try:
+        __getattr__("NotAModel")
+        raise AssertionError()
+    except AttributeError:
+        pass
+
+
+def test_when_imported():
+    calls = []
+
+    # Already imported
+    when_imported("json", lambda m: calls.append(m.__name__))
+    assert calls == ["json"]
+
+    # Imported later
+    name = "laktory._testing.paths"
+    sys.modules.pop(name, None)
+    when_imported(name, lambda m: calls.append(m.__name__))
+    import laktory._testing.paths  # noqa: F401
+
+    assert calls == ["json", name]
+    assert isinstance(sys.modules[name], types.ModuleType)
+
+
+if __name__ == "__main__":
+    test_import_laktory()
+    test_import_cli()
+    test_import_spark_without_connect()
+    test_namespaces()
+    test_attach()
+    test_when_imported()
@@ -1,7 +1,7 @@
-from typing import Union
+from typing import Annotated
 
 from laktory.models import BaseModel
-from laktory.typing import var
+from laktory.typing import VariableOr
 
 
 class Price(BaseModel):
@@ -29,8 +29,9 @@ def test_bool():
     assert m.active == "yes"
 
     # annotation
-    ann = m.model_fields["active"].annotation
-    assert ann == Union[bool, var]
+    field = m.model_fields["active"]
+    assert field.annotation is bool
+    assert field.metadata == [VariableOr()]
 
 
 def test_int():
@@ -43,8 +44,9 @@ def test_int():
     assert m.id == "some_id"
 
     # annotation
-    ann = m.model_fields["id"].annotation
-    assert ann == Union[int, var]
+    field = m.model_fields["id"]
+    assert field.annotation is int
+    assert field.metadata == [VariableOr()]
 
 
 def test_string():
@@ -57,8 +59,9 @@ def test_string():
     assert m.symbol == "other"
 
     # annotation
-    ann = m.model_fields["symbol"].annotation
-    assert ann == Union[str, var]
+    field = m.model_fields["symbol"]
+    assert field.annotation is str
+    assert field.metadata == []
 
 
 def test_model():
@@ -67,13 +70,19 @@ def test_model():
     assert m.price.open == 1.0
     assert m.price.close == 2.0
 
+    # model instance
+    m = MyModel(price=Price(open=1.0, close=2.0))
+    assert m.price.open == 1.0
+    assert m.price.close == 2.0
+
     # string
     m = MyModel(symbol="some_prices")
     assert m.symbol == "some_prices"
 
     # annotation
-    ann = m.model_fields["price"].annotation
-    assert ann == Union[Price, var]
+    field = m.model_fields["price"]
+    assert field.annotation == Price
+    assert field.metadata == [VariableOr()]
 
 
 def test_list():
@@ -90,8 +99,9 @@ def test_list():
     assert m.ids == ["id0", "id1", "id2"]
 
     # annotation
-    ann = m.model_fields["ids"].annotation
-    assert ann == Union[list[Union[int, var]], var]
+    field = m.model_fields["ids"]
+    assert field.annotation == list[Annotated[int, VariableOr()]]
+    assert field.metadata == [VariableOr()]
 
 
 def test_dict():
@@ -113,8 +123,12 @@ def test_dict():
     assert m.prices_dict == {"id1": "price1", "id2": "price2"}
 
     # annotation
-    ann = m.model_fields["prices_dict"].annotation
-    assert ann == Union[dict[Union[int, var], Union[Price, var]], var]
+    field = m.model_fields["prices_dict"]
+    assert (
+        field.annotation
+        == dict[Annotated[int, VariableOr()], Annotated[Price, VariableOr()]]
+    )
+    assert field.metadata == [VariableOr()]
 
 
 if __name__ == "__main__":
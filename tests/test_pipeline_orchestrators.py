@@ -1,6 +1,8 @@
 import io
+import json
 from pathlib import Path
 
+import pytest
 import yaml
 
 from laktory import __version__
@@ -167,7 +169,124 @@ def test_pipeline_job():
 
     # Test resources
     resources = pl_job.core_resources
-    assert len(resources) == 5
+    assert len(resources) == 7
+
+
+def test_pipeline_job_nodes_config():
+    # Compact config
+    data = pl_job.get_node_config("slv_stock_prices")
+    assert [n["name"] for n in data["nodes"]] == [
+        "slv_stock_prices",
+        "brz_stock_prices",
+        "slv_stock_meta",
+    ]
+    assert "databricks_job" not in data
+    assert data["nodes"][1] == {
+        "name": "brz_stock_prices",
+        "source": {"as_stream": True, "format": "DELTA", "path": "/brz_stock_prices"},
+        "sinks": [{"mode": "APPEND", "format": "DELTA", "path": "/brz_stock_prices"}],
+    }
+
+    # Fast loader
+    json_data = json.dumps({"slv_stock_prices": data})
+    pl = models.Pipeline.model_validate_node_json(json_data, "slv_stock_prices")
+    node = pl.nodes_dict["slv_stock_prices"]
+    assert node.model_dump() == pl_job.nodes_dict["slv_stock_prices"].model_dump()
+    assert pl.sorted_node_names[-1] == "slv_stock_prices"
+    assert node.source.node.primary_sink.path == "/brz_stock_prices"
+
+    # Workspace file
+    job = pl_job.databricks_job
+    assert job.nodes_config_file.path == (
+        "/.laktory/pipelines/pl-spark-job/nodes_config.json"
+    )
+
+
+def test_pipeline_job_task_grouping():
+    pl = get_pl(
+        """
+name: pl-spark-job
+orchestrator: DATABRICKS_JOB
+databricks_job:
+  task_grouping: chain
+"""
+    )
+    job = pl.databricks_job
+
+    # Chains
+    assert job.node_groups == {
+        "node-brz_stock_prices": ["brz_stock_prices"],
+        "chain-brz_stock_meta": ["brz_stock_meta", "slv_stock_meta"],
+        "chain-slv_stock_prices": ["slv_stock_prices", "gld_stock_prices"],
+    }
+    tasks = {t.task_key: t for t in job.tasks}
+    assert list(tasks) == [
+        "chain-brz_stock_meta",
+        "chain-slv_stock_prices",
+        "node-brz_stock_prices",
+    ]
+    task = tasks["chain-slv_stock_prices"]
+    assert task.notebook_task.base_parameters == {
+        "node_name": "slv_stock_prices,gld_stock_prices"
+    }
+    assert [d.task_key for d in task.depends_ons] == [
+        "chain-brz_stock_meta",
+        "node-brz_stock_prices",
+    ]
+
+    # Compact configs
+    job.nodes_config_file.write_source()
+    with open(job.nodes_config_file.source) as fp:
+        json_data = fp.read()
+    assert list(json.loads(json_data)) == [
+        "brz_stock_prices",
+        "brz_stock_meta,slv_stock_meta",
+        "slv_stock_prices,gld_stock_prices",
+    ]
+    _pl = models.Pipeline.model_validate_node_json(
+        json_data, "slv_stock_prices,gld_stock_prices"
+    )
+    assert _pl.sorted_node_names == [
+        "brz_stock_prices",
+        "slv_stock_meta",
+        "slv_stock_prices",
+        "gld_stock_prices",
+    ]
+
+    # Layers
+    job.task_grouping = "layer"
+    job.task_max_workers = 2
+    job.update_from_parent()
+    tasks = {t.task_key: t for t in job.tasks}
+    assert list(tasks) == [
+        "layer-0",
+        "node-gld_stock_prices",
+        "node-slv_stock_meta",
+        "node-slv_stock_prices",
+    ]
+    assert tasks["layer-0"].notebook_task.base_parameters == {
+        "node_name": "brz_stock_prices,brz_stock_meta",
+        "max_workers": "2",
+    }
+    assert [d.task_key for d in tasks["node-slv_stock_prices"].depends_ons] == [
+        "layer-0",
+        "node-slv_stock_meta",
+    ]
+
+    # Custom
+    job.task_grouping = "custom"
+    job.task_groups = {"silver": ["slv_stock_prices", "slv_stock_meta"]}
+    assert job.node_groups == {
+        "node-brz_stock_prices": ["brz_stock_prices"],
+        "node-brz_stock_meta": ["brz_stock_meta"],
+        "group-silver": ["slv_stock_meta", "slv_stock_prices"],
+        "node-gld_stock_prices": ["gld_stock_prices"],
+    }
+
+    # Circular groups
+    job.task_groups = {"bronze_gold": ["brz_stock_prices", "gld_stock_prices"]}
+    with pytest.raises(ValueError):
+        job.node_groups
 
 
 def test_pipeline_dlt():
@@ -183,6 +302,7 @@ def test_pipeline_dlt():
         "dataframe_backend": None,
         "drops": None,
         "filter": None,
+        "incremental": None,
         "limit": None,
         "renames": None,
         "sample": None,
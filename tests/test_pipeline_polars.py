@@ -4,6 +4,7 @@ import uuid
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 from laktory import models
 from laktory._testing import Paths
@@ -15,8 +16,9 @@ OPEN_FIGURES = False
 testdir_path = Path(__file__).parent
 
 
-def get_pl(clean_path=False):
-    pl_path = testdir_path / "tmp" / "test_pipeline_polars" / str(uuid.uuid4())
+def get_pl(clean_path=False, pl_path=None):
+    if pl_path is None:
+        pl_path = testdir_path / "tmp" / "test_pipeline_polars" / str(uuid.uuid4())
 
     with open(paths.data / "pl-polars-local.yaml", "r") as fp:
         data = fp.read()
@@ -52,6 +54,118 @@ def test_df_backend():
             assert s.df_backend == "POLARS"
 
 
+def test_dag_cache():
+    pl, _ = get_pl()
+
+    # Cached graph
+    dag = pl.dag
+    assert pl.dag is dag
+    assert pl.sorted_node_names == [
+        "brz_stock_prices",
+        "brz_stock_meta",
+        "slv_stock_meta",
+        "slv_stock_prices",
+        "gld_stock_prices",
+    ]
+
+    # Node dependencies update
+    node = pl.nodes_dict["gld_stock_prices"]
+    node.source = models.PipelineNodeDataSource(node_name="brz_stock_prices")
+    assert pl.dag is not dag
+    assert list(pl.dag.predecessors("gld_stock_prices")) == ["brz_stock_prices"]
+
+    # Nested dependency update
+    node.source.node_name = "brz_stock_meta"
+    assert list(pl.dag.predecessors("gld_stock_prices")) == ["brz_stock_meta"]
+
+    # Node replaced in place
+    i = pl.nodes.index(node)
+    pl.nodes[i] = models.PipelineNode(
+        name="gld_stock_prices",
+        source={"node_name": "slv_stock_meta"},
+    )
+    assert list(pl.dag.predecessors("gld_stock_prices")) == ["slv_stock_meta"]
+    assert pl.nodes_dict["gld_stock_prices"] is pl.nodes[i]
+
+    # Node renamed
+    pl.nodes[i].name = "gld_stock_meta"
+    assert "gld_stock_meta" in pl.nodes_dict
+    assert "gld_stock_prices" not in pl.nodes_dict
+
+    # Node appended
+    pl.nodes.append(
+        models.PipelineNode(name="gld_new", source={"node_name": "gld_stock_meta"})
+    )
+    assert list(pl.dag.predecessors("gld_new")) == ["gld_stock_meta"]
+    pl.nodes[-1].source = models.PipelineNodeDataSource(node_name="brz_stock_meta")
+    assert list(pl.dag.predecessors("gld_new")) == ["brz_stock_meta"]
+    del pl.nodes[-1]
+    assert "gld_new" not in pl.nodes_dict
+
+    # Nodes update
+    dag = pl.dag
+    pl.nodes = [n for n in pl.nodes if n.name.startswith("brz")]
+    assert pl.dag is not dag
+    assert list(pl.nodes_dict) == ["brz_stock_prices", "brz_stock_meta"]
+    assert pl.sorted_node_names == ["brz_stock_prices", "brz_stock_meta"]
+
+
+def test_select():
+    pl, pl_path = get_pl(clean_path=True)
+
+    # Selectors
+    assert pl.select_node_names(select=["slv_stock_prices+"]) == [
+        "slv_stock_prices",
+        "gld_stock_prices",
+    ]
+    assert pl.select_node_names(select=["+slv_stock_prices"], exclude=["brz_*"]) == [
+        "slv_stock_meta",
+        "slv_stock_prices",
+    ]
+    assert pl.select_node_names(select=["1+slv_stock_prices+1"]) == [
+        "brz_stock_prices",
+        "slv_stock_meta",
+        "slv_stock_prices",
+        "gld_stock_prices",
+    ]
+    with pytest.raises(ValueError):
+        pl.select_node_names(select=["dummy*"])
+
+    # Names with wildcards are matched exactly
+    _pl = models.Pipeline(
+        name="pl-names",
+        nodes=[
+            {"name": "brz[1]", "source": {"path": "/brz/"}},
+            {"name": "brz1", "source": {"path": "/brz/"}},
+            {"name": "slv*", "source": {"node_name": "brz[1]"}},
+            {"name": "slv_a", "source": {"node_name": "brz1"}},
+        ],
+    )
+    assert _pl.select_node_names(select=["brz[1]"]) == ["brz[1]"]
+    assert _pl.select_node_names(select=["brz[1]+"]) == ["brz[1]", "slv*"]
+    assert _pl.select_node_names(select=["slv*"]) == ["slv*"]
+    assert _pl._get_execution_node_names(node_names=["brz[1]"]) == ["brz[1]"]
+    assert _pl.select_node_names(select=["slv_?"]) == ["slv_a"]
+
+    # Execution
+    pl.execute(select=["brz_*+1"], exclude=["slv_stock_prices"])
+    assert pl.nodes_dict["slv_stock_meta"].output_df is not None
+    assert pl.nodes_dict["gld_stock_prices"].output_df is None
+
+    # Unselected upstream nodes are read from their sink, not from the
+    # output of a previous execution
+    pl.execute()
+    brz = pl.nodes_dict["brz_stock_prices"]
+    brz._output_df = brz.output_df.limit(0)
+    pl.execute(select=["slv_stock_prices"])
+    assert pl.nodes_dict["slv_stock_prices"].output_df.collect().height > 0
+    pl.execute(select=["brz_stock_prices+"])
+    assert pl.nodes_dict["slv_stock_prices"].output_df.collect().height > 0
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
 def test_execute():
     pl, pl_path = get_pl(clean_path=True)
 
@@ -99,6 +213,145 @@ def test_execute():
     shutil.rmtree(pl_path)
 
 
+def test_execute_parallel():
+    pl, pl_path = get_pl(clean_path=True)
+
+    # Run selected nodes concurrently
+    pl.execute(node_names=["brz_stock_prices", "brz_stock_meta"], max_workers=2)
+    assert pl.nodes_dict["brz_stock_prices"].output_df is not None
+    assert pl.nodes_dict["brz_stock_meta"].output_df is not None
+    assert pl.nodes_dict["slv_stock_prices"].output_df is None
+
+    # Run remaining nodes
+    pl.execute(
+        node_names=["gld_stock_prices", "slv_stock_prices", "slv_stock_meta"],
+        max_workers=4,
+    )
+    df = (
+        pl.nodes_dict["gld_stock_prices"]
+        .output_df.collect()
+        .to_pandas()
+        .round(0)
+        .sort_values("symbol")
+        .reset_index(drop=True)
+    )
+    assert df.equals(gld_target)
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
+def test_execute_skip_unchanged():
+    pl, pl_path = get_pl(clean_path=True)
+
+    def _get_pl():
+        _pl, _ = get_pl(pl_path=pl_path)
+        _pl.root_path = str(pl_path / "laktory")
+        return _pl
+
+    pl = _get_pl()
+
+    # First run
+    pl.execute(skip_unchanged=True)
+    for node in pl.nodes:
+        assert node.output_df is not None
+        assert node._fingerprint_path.exists()
+
+    # Unchanged inputs
+    pl = _get_pl()
+    pl.execute(skip_unchanged=True)
+    for node in pl.nodes:
+        assert node.output_df is None
+
+    # Updated configuration
+    pl = _get_pl()
+    pl.nodes_dict["slv_stock_meta"].description = "Stock metadata"
+    pl.execute(skip_unchanged=True)
+    executed = {n.name for n in pl.nodes if n.output_df is not None}
+    assert executed == {"slv_stock_meta", "slv_stock_prices", "gld_stock_prices"}
+
+    # Forced
+    pl = _get_pl()
+    pl.execute()
+    for node in pl.nodes:
+        assert node.output_df is not None
+
+    # Purged
+    pl.purge(max_workers=4)
+    for node in pl.nodes:
+        assert not node._fingerprint_path.exists()
+        for sink in node.sinks:
+            assert not Path(sink.path).exists()
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
+def test_execute_incremental():
+    import polars as pl
+
+    pl_path = testdir_path / "tmp" / "test_pipeline_polars" / str(uuid.uuid4())
+
+    def _write(path, x, mode="append"):
+        pl.DataFrame({"x": x}, schema={"x": pl.Int64}).write_delta(
+            pl_path / path,
+            mode=mode,
+            delta_write_options={
+                "configuration": {"delta.enableChangeDataFeed": "true"}
+            },
+        )
+
+    pipeline = models.Pipeline(
+        name="pl-incremental",
+        dataframe_backend="POLARS",
+        root_path=str(pl_path / "laktory"),
+        nodes=[
+            {
+                "name": "brz",
+                "source": {
+                    "path": str(pl_path / "source"),
+                    "format": "DELTA",
+                    "incremental": {},
+                },
+                "sinks": [
+                    {"path": str(pl_path / "brz"), "format": "DELTA", "mode": "APPEND"}
+                ],
+            },
+            {
+                "name": "slv",
+                "source": {"node_name": "brz", "incremental": {}},
+                "sinks": [
+                    {"path": str(pl_path / "slv"), "format": "DELTA", "mode": "APPEND"}
+                ],
+            },
+        ],
+    )
+    slv = pipeline.nodes_dict["slv"]
+
+    # Tables with change data feed enabled
+    _write("source", [], mode="overwrite")
+    _write("brz", [], mode="overwrite")
+
+    # Initial load
+    _write("source", [1, 2, 3])
+    pipeline.execute()
+    assert slv.output_df.collect()["x"].to_list() == [1, 2, 3]
+
+    # New data
+    _write("source", [4, 5])
+    pipeline.execute()
+    assert slv.output_df.collect()["x"].to_list() == [4, 5]
+    assert slv.primary_sink.read().collect().height == 5
+
+    # No new data
+    pipeline.execute()
+    assert slv.output_df.collect().height == 0
+    assert slv.primary_sink.read().collect().height == 5
+
+    # Cleanup
+    shutil.rmtree(pl_path)
+
+
 def test_sql_join():
     # Get Pipeline
     pl, pl_path = get_pl(clean_path=True)
@@ -1,8 +1,10 @@
 import datetime
 
 import polars as pl
+import pytest
 
 from laktory._testing import dff
+from laktory.polars.dataframe.window_filter import TOP_K_MAX_ROWS
 
 df = pl.DataFrame(
     [
@@ -62,6 +64,111 @@ def test_union():
     assert df2.schema == df.schema
 
 
+def test_union_by_name():
+    df0 = pl.LazyFrame({"symbol": ["AAPL"], "close": [190]})
+    df1 = pl.DataFrame({"close": [135.5], "symbol": ["GOOGL"], "open": [137.0]})
+    dfs = [pl.LazyFrame({"symbol": [f"S{i}"], "close": [float(i)]}) for i in range(3)]
+
+    df2 = df0.laktory.union_by_name(df1, dfs)
+    assert isinstance(df2, pl.LazyFrame)
+    df2 = df2.collect(engine="streaming")
+    assert df2.columns == ["symbol", "close", "open"]
+    assert df2.schema["close"] == pl.Float64
+    assert df2["symbol"].to_list() == ["AAPL", "GOOGL", "S0", "S1", "S2"]
+    assert df2["open"].to_list() == [None, 137.0, None, None, None]
+
+    # Eager
+    df3 = df1.laktory.union_by_name(df0)
+    assert isinstance(df3, pl.DataFrame)
+    assert df3.height == 2
+
+    # Missing columns
+    with pytest.raises(ValueError):
+        df0.laktory.union_by_name(df1, allow_missing_columns=False)
+
+
+def test_sample():
+    df0 = pl.LazyFrame({"x": range(1000)})
+
+    df = df0.laktory.sample(fraction=0.1, seed=42)
+    assert isinstance(df, pl.LazyFrame)
+    df = df.collect()
+    assert 50 < df.height < 150
+    assert df.equals(df0.laktory.sample(fraction=0.1, seed=42).collect())
+    assert not df.equals(df0.laktory.sample(fraction=0.1, seed=1).collect())
+
+    # Identical rows are sampled independently
+    df1 = pl.LazyFrame({"x": [1] * 1000})
+    assert 400 < df1.laktory.sample(fraction=0.5).collect().height < 600
+
+    # Bounds
+    assert df0.collect().laktory.sample(fraction=0).height == 0
+    assert df0.collect().laktory.sample(fraction=1).height == 1000
+    with pytest.raises(ValueError):
+        df0.laktory.sample(fraction=1.5)
+
+
+def test_flatten():
+    df0 = pl.LazyFrame(
+        {
+            "name": ["stock_price", "stock_price"],
+            "data": [
+                {
+                    "symbol": "AAPL",
+                    "_created_at": "2023-09-01",
+                    "meta": {"currency": "USD", "exchange": {"code": "NASDAQ"}},
+                    "prices": [{"open": 1, "close": 2}, {"open": 3, "close": 4}],
+                },
+                {
+                    "symbol": "MSFT",
+                    "_created_at": "2023-09-01",
+                    "meta": {"currency": "USD", "exchange": {"code": "NASDAQ"}},
+                    "prices": [],
+                },
+            ],
+        }
+    )
+
+    # All structs
+    df = df0.laktory.flatten()
+    assert isinstance(df, pl.LazyFrame)
+    assert df.collect_schema().names() == [
+        "name",
+        "symbol",
+        "_created_at",
+        "currency",
+        "code",
+        "prices",
+    ]
+
+    # Separator and depth
+    df = df0.laktory.flatten(columns="data", separator="_", max_depth=2)
+    assert df.collect_schema().names() == [
+        "name",
+        "data_symbol",
+        "data__created_at",
+        "data_meta_currency",
+        "data_meta_exchange",
+        "data_prices",
+    ]
+
+    # Include and explode
+    df = df0.laktory.flatten(
+        include=["data.symbol", "data.prices.close"], explode="prices"
+    ).collect()
+    assert df.columns == ["name", "symbol", "close"]
+    assert df["symbol"].to_list() == ["AAPL", "AAPL", "MSFT"]
+    assert df["close"].to_list() == [2, 4, None]
+
+    # Exclude
+    df = df0.laktory.flatten(exclude=["data._*", "data.meta.*", "data.prices"])
+    assert df.collect_schema().names() == ["name", "symbol"]
+
+    # Duplicates
+    with pytest.raises(ValueError):
+        df0.with_columns(symbol=pl.lit("")).laktory.flatten()
+
+
 def test_join():
     left = dff.slv_polars.filter(
         pl.col("created_at") == datetime.datetime(2023, 9, 1)
@@ -195,6 +302,66 @@ def test_aggregation():
     assert "symbol" in df.columns
     assert df["mean_close"].round(2).to_list() == [187.36, 136.92, 135.3, 331.7]
 
+    # Window
+    df = _df.laktory.groupby_and_agg(
+        groupby_window={
+            "time_column": "created_at",
+            "window_duration": "1 day",
+        },
+        agg_expressions=[
+            {
+                "name": "min_open",
+                "expr": "pl.col('open').min()",
+            },
+            {
+                "name": "max_open",
+                "expr": "pl.col('open').max()",
+            },
+        ],
+    ).sort("window")
+    assert df.columns == ["window", "min_open", "max_open"]
+    assert df["min_open"].round(2).to_list() == [137.46, 135.44, 136.02]
+    assert df["max_open"].round(2).to_list() == [331.31, 329.0, 333.38]
+
+    # Symbol and sliding window with offset
+    df = _df.laktory.groupby_and_agg(
+        groupby_window={
+            "time_column": "created_at",
+            "window_duration": "2 days",
+            "slide_duration": "1 day",
+            "start_time": "12 hours",
+        },
+        groupby_columns=["symbol"],
+        agg_expressions=[
+            {
+                "name": "count",
+                "expr": "pl.col('close').count()",
+            },
+        ],
+    ).sort("symbol", "window")
+    assert df.columns == ["window", "symbol", "count"]
+    assert df["window"].struct.field("start").dt.hour().unique().to_list() == [12]
+    assert df["count"].sum() == 2 * _df.height
+
+    # Rolling window
+    df = _df.laktory.groupby_and_agg(
+        groupby_window={
+            "time_column": "created_at",
+            "window_duration": "2d",
+            "rolling": True,
+        },
+        groupby_columns=["symbol"],
+        agg_expressions=[
+            {
+                "name": "count",
+                "expr": "pl.col('close').count()",
+            },
+        ],
+    ).sort("symbol", "created_at")
+    assert df.columns == ["created_at", "symbol", "count"]
+    assert df.height == _df.height
+    assert df["count"].to_list()[:3] == [1, 1, 2]
+
 
 def test_window_filter():
     df = dff.slv_polars.laktory.window_filter(
@@ -223,11 +390,67 @@ def test_window_filter():
         "_row_index": [2, 1, 2, 1, 2, 1, 2, 1],
     }
 
+    # Shuffled rows with null order by values (sorted first)
+    df0 = dff.slv_polars.sample(fraction=1.0, shuffle=True, seed=0).with_columns(
+        close=pl.when(pl.col("created_at") == datetime.datetime(2023, 9, 5))
+        .then(None)
+        .otherwise(pl.col("close"))
+    )
+    for desc in [True, False]:
+        kwargs = {
+            "partition_by": ["symbol"],
+            "order_by": [{"sql_expression": "close", "desc": desc}],
+            "drop_row_index": False,
+            "rows_to_keep": 3,
+        }
+        columns = ["symbol", "close", "_row_index"]
+        df = df0.laktory.window_filter(**kwargs).sort("symbol", "_row_index")
+        df_sorted = (
+            df0.sort("close", descending=desc, nulls_last=False)
+            .with_columns(
+                _row_index=pl.int_range(1, pl.len() + 1, dtype=pl.UInt32).over("symbol")
+            )
+            .filter(pl.col("_row_index") <= 3)
+            .sort("symbol", "_row_index")
+        )
+        assert df.select(columns).equals(df_sorted.select(columns))
+        assert df.filter(pl.col("_row_index") == 1)["close"].null_count() == 4
+
+    # Ties keep the first rows, as with a stable sort
+    n = 100_000
+    df0 = pl.DataFrame(
+        {
+            "symbol": ["A", "B"] * n,
+            "close": [float(i % 3) for i in range(2 * n)],
+            "id": range(2 * n),
+        }
+    )
+    for rows_to_keep in [1, 3, TOP_K_MAX_ROWS + 1]:
+        df = df0.laktory.window_filter(
+            partition_by=["symbol"],
+            order_by=[{"sql_expression": "close", "desc": True}],
+            drop_row_index=False,
+            rows_to_keep=rows_to_keep,
+        ).sort("symbol", "_row_index")
+        df_sorted = (
+            df0.sort("close", descending=True, maintain_order=True)
+            .with_columns(
+                _row_index=pl.int_range(1, pl.len() + 1, dtype=pl.UInt32).over("symbol")
+            )
+            .filter(pl.col("_row_index") <= rows_to_keep)
+            .sort("symbol", "_row_index")
+        )
+        assert df.equals(df_sorted.select(df.columns))
+    assert df.filter(pl.col("_row_index") == 1)["id"].to_list() == [2, 5]
+
 
 if __name__ == "__main__":
     test_df_schema_flat()
     test_df_has_column()
     test_union()
+    test_union_by_name()
+    test_sample()
+    test_flatten()
     test_join()
     test_join_outer()
     test_aggregation()
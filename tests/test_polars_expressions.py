@@ -1,4 +1,6 @@
+from uuid import NAMESPACE_URL
 from uuid import UUID
+from uuid import uuid5
 
 import numpy as np
 import polars as pl
@@ -93,12 +95,35 @@ def test_string_split(df0=df0):
 
 
 def test_uuid(df0=df0):
-    df = df0.with_columns(uuid=pl.Expr.laktory.uuid())
+    df = df0.with_columns(
+        uuid=pl.Expr.laktory.uuid(),
+        uuid7=pl.Expr.laktory.uuid(version=7),
+        key=pl.Expr.laktory.uuid(columns=["x", "word"]),
+    )
 
     for _uuid in df["uuid"]:
         assert str(UUID(_uuid)) == _uuid
+        assert UUID(_uuid).version == 4
+
+    for _uuid in df["uuid7"]:
+        assert UUID(_uuid).version == 7
 
     assert df["uuid"].n_unique() == 3
+    assert df["uuid7"].n_unique() == 3
+    assert df["key"].to_list() == [
+        str(uuid5(NAMESPACE_URL, f"{x}|{w}")) for x, w in zip(df["x"], df["word"])
+    ]
+
+    # Streaming batches
+    df = (
+        pl.LazyFrame({"x": range(100000)})
+        .with_columns(uuid=pl.Expr.laktory.uuid())
+        .collect(engine="streaming")
+    )
+    assert df["uuid"].n_unique() == 100000
+
+    with pytest.raises(ValueError):
+        pl.Expr.laktory.uuid(version=5)
 
 
 def test_units(df0=df0):
@@ -112,6 +137,13 @@ def test_units(df0=df0):
     ]
     assert df["kelvin"].to_list() == [274.15, 275.15, 276.15]
 
+    # Multiple columns
+    df = df0.select(pl.col("x").alias("a"), pl.col("x").alias("b") * 100)
+    df = df.with_columns(pl.col("a", "b").laktory.convert_units("C", "F"))
+    assert df.columns == ["a", "b"]
+    assert df["a"].to_list() == [33.8, 35.6, 37.4]
+    assert df["b"].to_list() == [212.0, 392.0, 572.0]
+
 
 if __name__ == "__main__":
     atest_coalesce()
@@ -111,6 +111,69 @@ def test_watermark():
     # TODO: Add test for spark connect DataFrame
 
 
+def test_plan():
+    df = dff.slv.withWatermark("created_at", "1 hour")
+    dfa = df.groupby("symbol").agg(F.max("close"))
+
+    plan = dfa.laktory.get_plan()
+    assert dfa.laktory.get_plan() is plan
+    assert plan.is_aggregate
+    assert plan.watermark.column == "created_at"
+    assert plan.size_in_bytes > 0
+    assert not df.laktory.get_plan().is_aggregate
+    assert dff.slv.laktory.get_plan().watermark is None
+
+
+def test_flatten():
+    df0 = spark.createDataFrame(
+        [
+            {
+                "name": "stock_price",
+                "data": {
+                    "symbol": "AAPL",
+                    "_created_at": "2023-09-01",
+                    "meta": {"currency": "USD", "exchange": {"code": "NASDAQ"}},
+                    "prices": [{"open": 1, "close": 2}, {"open": 3, "close": 4}],
+                },
+            },
+            {
+                "name": "stock_price",
+                "data": {
+                    "symbol": "MSFT",
+                    "_created_at": "2023-09-01",
+                    "meta": {"currency": "USD", "exchange": {"code": "NASDAQ"}},
+                    "prices": [],
+                },
+            },
+        ],
+        schema="name string, data struct<symbol string, _created_at string, meta struct<currency string, exchange struct<code string>>, prices array<struct<open long, close long>>>",
+    )
+
+    # All structs
+    df = df0.laktory.flatten()
+    assert df.columns == ["name", "symbol", "_created_at", "currency", "code", "prices"]
+
+    # Separator and depth
+    df = df0.laktory.flatten(columns="data", separator="_", max_depth=2)
+    assert df.columns == [
+        "name",
+        "data_symbol",
+        "data__created_at",
+        "data_meta_currency",
+        "data_meta_exchange",
+        "data_prices",
+    ]
+
+    # Include and explode
+    df = df0.laktory.flatten(
+        include=["data.symbol", "data.prices.close"], explode="prices"
+    )
+    assert df.columns == ["name", "symbol", "close"]
+    pdf = df.toPandas()
+    assert pdf["symbol"].tolist() == ["AAPL", "AAPL", "MSFT"]
+    assert pdf["close"].fillna(-1).tolist() == [2, 4, -1]
+
+
 def test_join():
     left = dff.slv.filter(F.col("created_at") == "2023-09-01T00:00:00Z").filter(
         F.col("symbol") != "GOOGL"
@@ -221,6 +284,19 @@ def test_join():
     ]
     assert df5.toPandas()["open"].fillna(-1).to_list() == [2, 2, -1]
 
+    # Broadcast
+    df6 = left.laktory.smart_join(other=other, on=["symbol"])
+    assert "broadcast" in str(df6._jdf.queryExecution().optimizedPlan()).lower()
+    df7 = left.laktory.smart_join(other=other, on=["symbol"], broadcast_threshold=0)
+    assert "broadcast" not in str(df7._jdf.queryExecution().optimizedPlan()).lower()
+
+    # Salting
+    df8 = left.laktory.smart_join(
+        other=other, on=["symbol"], broadcast_threshold=None, salt_buckets=4
+    )
+    assert df8.columns == df.columns
+    assert df8.sort("symbol").toPandas().equals(df.sort("symbol").toPandas())
+
 
 def test_join_outer():
     left = dff.slv.filter(F.col("created_at") == "2023-09-01T00:00:00Z").filter(
@@ -403,6 +479,25 @@ def test_window_filter():
         },
     ]
 
+    # Single row
+    df = (
+        dff.slv.laktory.window_filter(
+            partition_by=["symbol"],
+            order_by=[
+                {"sql_expression": "created_at", "desc": True},
+            ],
+            drop_row_index=False,
+            rows_to_keep=1,
+        )
+        .select("created_at", "symbol", "_row_index")
+        .sort("symbol")
+    )
+    assert df.columns == ["created_at", "symbol", "_row_index"]
+    assert df.toPandas().to_dict(orient="records") == [
+        {"created_at": Timestamp("2023-09-29 00:00:00"), "symbol": s, "_row_index": 1}
+        for s in ["AAPL", "AMZN", "GOOGL", "MSFT"]
+    ]
+
 
 def test_is_aggregate():
     # Static
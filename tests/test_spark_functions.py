@@ -73,6 +73,14 @@ def test_units(df0=df0):
     ]
     assert pdf["kelvin"].tolist() == [274.15, 275.15, 276.15]
 
+    # Multiple columns
+    df = df0.select(F.col("x").alias("a"), (F.col("x") * 100).alias("b"))
+    df = df.select(F.laktory.convert_units(["a", "b"], "C", "F"))
+    pdf = df.toPandas()
+    assert pdf.columns.tolist() == ["a", "b"]
+    assert pdf["a"].tolist() == [33.8, 35.6, 37.4]
+    assert pdf["b"].tolist() == [212.0, 392.0, 572.0]
+
 
 if __name__ == "__main__":
     test_compare()
@@ -524,6 +524,7 @@ def test_stack_model():
                                 "broadcast": False,
                                 "drops": None,
                                 "filter": None,
+                                "incremental": None,
                                 "limit": None,
                                 "renames": None,
                                 "sample": None,
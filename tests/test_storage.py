@@ -0,0 +1,91 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from laktory.storage import FsspecStorage
+from laktory.storage import LocalStorage
+from laktory.storage import NullStorage
+from laktory.storage import get_protocol
+from laktory.storage import get_storage
+from laktory.storage import purge_paths
+from laktory.storage import register_storage
+from laktory.storage import to_posix
+
+
+def test_paths():
+    assert to_posix(Path("s3://bucket/checkpoints")) == "s3://bucket/checkpoints"
+    assert to_posix(Path("/tmp/checkpoints")) == "/tmp/checkpoints"
+    assert get_protocol(Path("abfss://landing@account/x")) == "abfss"
+    assert get_protocol("/Volumes/dev/sources") == "file"
+    assert get_protocol("C:/data") == "file"
+    assert isinstance(get_storage("/tmp"), LocalStorage)
+
+
+def test_local_storage(tmp_path):
+    storage = LocalStorage(max_workers=4)
+
+    # Atomic write
+    path = tmp_path / "state" / "fingerprint.json"
+    storage.write_text(path, '{"fingerprint": "a"}')
+    storage.write_text(path, '{"fingerprint": "b"}')
+    assert storage.read_text(path) == '{"fingerprint": "b"}'
+    assert storage.ls(tmp_path / "state") == [path.as_posix()]
+    assert storage.read_text(tmp_path / "missing.json") is None
+
+    # Bulk listing and delete
+    dirpaths = [tmp_path / "checkpoints" / f"sink-{i}" for i in range(50)]
+    for p in dirpaths:
+        storage.write_text(p / "offsets" / "0", "v1")
+    listing = storage.ls_many(dirpaths)
+    assert len(listing) == 50
+    assert listing[dirpaths[0].as_posix()] == [(dirpaths[0] / "offsets").as_posix()]
+
+    deleted = storage.rm_many(dirpaths + [tmp_path / "missing"])
+    assert len(deleted) == 50
+    assert storage.ls(tmp_path / "checkpoints") == []
+    assert not storage.rm(tmp_path / "missing")
+
+
+def test_purge_paths(tmp_path):
+    paths = [tmp_path / "a.json", tmp_path / "b"]
+    storage = get_storage(tmp_path)
+    storage.write_text(paths[0], "{}")
+    storage.write_text(paths[1] / "c.json", "{}")
+
+    assert purge_paths(paths + [None]) == [p.as_posix() for p in paths]
+    assert not storage.exists(paths[0])
+    assert not storage.exists(paths[1])
+
+
+def test_missing_storage(monkeypatch):
+    # Protocol implementation not available
+    monkeypatch.setitem(sys.modules, "fsspec", None)
+    paths = ["dbfs:/checkpoints/sink", "abfss://landing@account/x", "s3://b/x"]
+    for path in paths:
+        storage = get_storage(path)
+        assert isinstance(storage, NullStorage)
+        assert storage.read_text(path) is None
+        assert not storage.exists(path)
+        with pytest.raises(ModuleNotFoundError):
+            storage.write_text(path, "{}")
+        with pytest.raises(ModuleNotFoundError):
+            storage.rename(path, path + ".tmp")
+    with pytest.raises(ModuleNotFoundError):
+        purge_paths(paths)
+    assert purge_paths([]) == []
+
+
+def test_register_storage():
+    fsspec = pytest.importorskip("fsspec")
+
+    storage = FsspecStorage(fs=fsspec.filesystem("memory"))
+    register_storage("memory", storage)
+    try:
+        path = Path("memory://pipelines/pl/node/fingerprint.json")
+        get_storage(path).write_text(path, "{}")
+        assert storage.read_text(path) == "{}"
+        assert purge_paths([path, "memory://pipelines/missing"]) == [to_posix(path)]
+        assert not storage.exists(path)
+    finally:
+        register_storage("memory", None)